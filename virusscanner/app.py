@@ -1,5 +1,6 @@
 import click
 from virusscanner.interface import input_interface
+from virusscanner.interface.json_backend import get_json_backend_names
 from virusscanner.parsing import signature_detector
 
 
@@ -9,7 +10,15 @@ from virusscanner.parsing import signature_detector
 @click.option("-g", "--connections-graph", "connections_graph", type=click.Path(), required=True,
               help="JSON file containing the connections graph of the input design")
 @click.option("-o", "--output-file", "output_file", type=click.Path(), required=True, help="Output file path")
-def main(config: str, connections_graph: str, output_file: str) -> None:
+@click.option("-s", "--stream-input", "stream_input", is_flag=True,
+              help="Parse the connections graph incrementally to keep the memory usage low with large designs")
+@click.option("--graph-cache", "graph_cache", is_flag=True,
+              help="Load the connections graph from a binary cache file next to it and save the cache after parsing")
+@click.option("--json-backend", "json_backend", type=click.Choice(get_json_backend_names()),
+              help="JSON library used to decode the connections graph. Defaults to the VIRUSSCANNER_JSON_BACKEND "
+                   "environment variable or the fastest installed library")
+def main(config: str, connections_graph: str, output_file: str, stream_input: bool, graph_cache: bool,
+         json_backend: str) -> None:
     """Program to scan the given design for viruses with the given resources defined in the config"""
     signature_detector.SignatureDetector().parse_input(
-        input_interface.Input(config, output_file, connections_graph))
+        input_interface.Input(config, output_file, connections_graph, stream_input, graph_cache, json_backend))
@@ -0,0 +1,46 @@
+import bz2
+import gzip
+import io
+import lzma
+import os
+import zipfile
+from typing import TextIO
+
+COMPRESSED_FILE_OPENERS = {".gz": gzip.open, ".bz2": bz2.open, ".xz": lzma.open}
+ZIP_FILE_EXTENSION = ".zip"
+
+
+def is_compressed_file(file_path: str) -> bool:
+    """Function to check if the given file is compressed based on its file extension.
+
+    Args:
+        file_path: Path of the file.
+
+    Returns:
+        Boolean which says if the file is decompressed while it is read.
+    """
+    file_extension = os.path.splitext(file_path)[1].lower()
+    return file_extension in COMPRESSED_FILE_OPENERS or file_extension == ZIP_FILE_EXTENSION
+
+
+def open_text_file(file_path: str) -> TextIO:
+    """Function to open the given file for reading text. Files with .gz, .bz2 and .xz extensions and ZIP archives
+    containing a single file are decompressed while they are read without writing temporary files.
+
+    Args:
+        file_path: Path of the plain or compressed file.
+
+    Returns:
+        Text file handle which has to be closed by the caller.
+    """
+    file_extension = os.path.splitext(file_path)[1].lower()
+    if file_extension in COMPRESSED_FILE_OPENERS:
+        return COMPRESSED_FILE_OPENERS[file_extension](file_path, "rt", encoding="utf-8")
+    if file_extension == ZIP_FILE_EXTENSION:
+        with zipfile.ZipFile(file_path) as zip_file:
+            members = [member for member in zip_file.infolist() if not member.is_dir()]
+            if len(members) != 1:
+                raise ValueError("ZIP file should contain exactly one file: " + file_path)
+            # The opened member keeps the archive file open after the ZipFile object is closed.
+            return io.TextIOWrapper(zip_file.open(members[0]), encoding="utf-8")
+    return open(file_path, "r")
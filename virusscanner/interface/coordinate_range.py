@@ -0,0 +1,93 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy
+
+# Inclusive ranges like "10..40", "10.." or "..40".
+INCLUSIVE_RANGE_REGEX = re.compile(r"^\s*(-?\d+)?\s*\.\.\s*(-?\d+)?\s*$")
+# Comparisons like ">=12" or "<40".
+COMPARISON_REGEX = re.compile(r"^\s*(>=|<=|>|<)\s*(-?\d+)\s*$")
+
+
+@dataclass(frozen=True)
+class CoordinateRange:
+    """Dataclass for a numeric range of tile coordinates given in a CSV file instead of a regular expression. The
+    range can be used like a compiled regular expression with the match method or evaluated for many coordinates at
+    once with the contains method.
+
+    Args:
+        pattern: String form of the range as it was given.
+        minimum: Smallest coordinate in the range or None if there is no lower limit.
+        maximum: Largest coordinate in the range or None if there is no upper limit.
+
+    """
+    __slots__ = ("pattern", "minimum", "maximum")
+    flags = 0
+
+    pattern: str
+    minimum: Optional[int]
+    maximum: Optional[int]
+
+    def __reduce__(self):
+        return CoordinateRange, (self.pattern, self.minimum, self.maximum)
+
+    @classmethod
+    def from_string(cls, range_string: str) -> Optional["CoordinateRange"]:
+        """Method to parse the given string to a coordinate range.
+
+        Args:
+            range_string: String like "10..40", "10..", "..40", ">=12", "<=12", ">12" or "<12".
+
+        Returns:
+            CoordinateRange of the string or None if the string isn't a coordinate range.
+        """
+        found_range = INCLUSIVE_RANGE_REGEX.match(range_string)
+        if found_range and (found_range.group(1) or found_range.group(2)):
+            minimum = int(found_range.group(1)) if found_range.group(1) else None
+            maximum = int(found_range.group(2)) if found_range.group(2) else None
+            return cls(range_string, minimum, maximum)
+        found_comparison = COMPARISON_REGEX.match(range_string)
+        if found_comparison:
+            operator, limit = found_comparison.group(1), int(found_comparison.group(2))
+            if operator == ">=":
+                return cls(range_string, limit, None)
+            if operator == ">":
+                return cls(range_string, limit + 1, None)
+            if operator == "<=":
+                return cls(range_string, None, limit)
+            return cls(range_string, None, limit - 1)
+        return None
+
+    def match(self, coordinate_string: str) -> bool:
+        """Method to check if the given coordinate is in the range. The method has the same use as the match method of
+        compiled regular expressions.
+
+        Args:
+            coordinate_string: String form of the coordinate.
+
+        Returns:
+            Boolean which says if the string is an integer in the range.
+        """
+        try:
+            coordinate = int(coordinate_string)
+        except ValueError:
+            return False
+        return (self.minimum is None or coordinate >= self.minimum) and \
+               (self.maximum is None or coordinate <= self.maximum)
+
+    def contains(self, coordinates: numpy.ndarray) -> numpy.ndarray:
+        """Method to check which of the given coordinates are in the range with vectorized comparisons.
+
+        Args:
+            coordinates: Integer array of coordinates.
+
+        Returns:
+            Boolean array which is True for the coordinates in the range.
+        """
+        in_range = numpy.ones(coordinates.shape, dtype=bool)
+        if self.minimum is not None:
+            in_range &= coordinates >= self.minimum
+        if self.maximum is not None:
+            in_range &= coordinates <= self.maximum
+        return in_range
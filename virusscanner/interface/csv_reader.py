@@ -2,16 +2,26 @@ import csv
 import re
 from typing import List, Dict, Pattern, Union
 
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.literal_pattern import LiteralPattern
+
 
 class CSVInput:
     """Class for reading regular expressions from the given CSV files"""
     REGEX_KEY_SET = (
         "tile_type", "tile_x", "tile_y", "input_port", "output_port", "port", "begin_tile_type", "begin_tile_x",
-        "begin_tile_y", "begin_port", "end_tile_type", "end_tile_x", "end_tile_y", "end_port"
+        "begin_tile_y", "begin_port", "end_tile_type", "end_tile_x", "end_tile_y", "end_port", "stop_tile_type",
+        "stop_tile_x", "stop_tile_y", "stop_port"
     )  # Set of keys which mark which csv columns are regular expressions.
+    COORDINATE_KEY_SET = (
+        "tile_x", "tile_y", "begin_tile_x", "begin_tile_y", "end_tile_x", "end_tile_y", "stop_tile_x", "stop_tile_y"
+    )  # Set of keys which mark which csv columns can have numeric coordinate ranges instead of regular expressions.
 
-    def get_regexps_list_from_file(self, csv_filename: str) -> List[Dict[str, Union[str, Pattern[str]]]]:
+    def get_regexps_list_from_file(self, csv_filename: str) -> List[Dict[str, Union[str, Pattern[str], CoordinateRange,
+                                                                                    LiteralPattern]]]:
         """Method to open and read the given csv file and return the regular expressions and strings given.
+        Coordinate columns can have numeric ranges like "10..40" or ">=12" instead of regular expressions. Values
+        without regular expression metacharacters are kept as literal patterns which can be matched with hash lookups.
 
         Args:
             csv_filename: File path to the CSV file.
@@ -27,8 +37,18 @@ class CSVInput:
                 for key in row:
                     if row[key]:
                         if key in self.REGEX_KEY_SET:
-                            current_regex_line[key] = re.compile(r"{}".format(row[key]))
+                            current_regex_line[key] = self.__compile_column(key, row[key])
                         else:
                             current_regex_line[key] = row[key]
                 regexps_list.append(current_regex_line)
         return regexps_list
+
+    def __compile_column(self, key: str, value: str) -> Union[Pattern[str], CoordinateRange, LiteralPattern]:
+        if key in self.COORDINATE_KEY_SET:
+            coordinate_range = CoordinateRange.from_string(value)
+            if coordinate_range is not None:
+                return coordinate_range
+        literal_pattern = LiteralPattern.from_string(value)
+        if literal_pattern is not None:
+            return literal_pattern
+        return re.compile(r"{}".format(value))
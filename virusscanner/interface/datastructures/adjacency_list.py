@@ -0,0 +1,72 @@
+from typing import Dict, Iterable, Iterator, Mapping, Tuple
+
+from virusscanner.interface.datastructures.port import Port
+
+
+class AdjacencyList(Mapping):
+    """Class for holding an adjacency list which can be updated one edge at a time. Every port maps to an insertion
+    ordered dictionary of its adjacent ports and the amount of edges to each of them, so adding and removing edges
+    takes constant time on average and repeated edges are kept like in the connections of the graph. Only ports with
+    at least one adjacent port are keys of the mapping and the adjacent ports are returned as tuples which are cached
+    until the ports of the row change.
+
+    Args:
+        edges: Pairs of source and target ports to initialise the adjacency list with.
+
+    """
+
+    def __init__(self, edges: Iterable[Tuple[Port, Port]] = ()) -> None:
+        self.__rows: Dict[Port, Dict[Port, int]] = dict()
+        self.__decoded_rows: Dict[Port, Tuple[Port, ...]] = dict()
+        for source_port, target_port in edges:
+            self.add_edge(source_port, target_port)
+
+    def add_edge(self, source_port: Port, target_port: Port) -> None:
+        """Method to add the given edge to the adjacency list.
+
+        Args:
+            source_port: Port which the edge starts from.
+            target_port: Port which the edge goes to.
+        """
+        row = self.__rows.get(source_port)
+        if row is None:
+            row = dict()
+            self.__rows[source_port] = row
+        row[target_port] = row.get(target_port, 0) + 1
+        self.__decoded_rows.pop(source_port, None)
+
+    def remove_edge(self, source_port: Port, target_port: Port) -> None:
+        """Method to remove one of the given edges from the adjacency list.
+
+        Args:
+            source_port: Port which the edge starts from.
+            target_port: Port which the edge goes to.
+        """
+        row = self.__rows[source_port]
+        if row[target_port] > 1:
+            row[target_port] -= 1
+        else:
+            del row[target_port]
+        if not row:
+            del self.__rows[source_port]
+        self.__decoded_rows.pop(source_port, None)
+
+    def __getitem__(self, port: Port) -> Tuple[Port, ...]:
+        adjacent_ports = self.__decoded_rows.get(port)
+        if adjacent_ports is None:
+            adjacent_ports = tuple(adjacent_port for adjacent_port, edge_count in self.__rows[port].items()
+                                   for _ in range(edge_count))
+            self.__decoded_rows[port] = adjacent_ports
+        return adjacent_ports
+
+    def __contains__(self, port: object) -> bool:
+        return port in self.__rows
+
+    def __iter__(self) -> Iterator[Port]:
+        return iter(self.__rows)
+
+    def __len__(self) -> int:
+        return len(self.__rows)
+
+    def __repr__(self) -> str:
+        return "AdjacencyList({})".format(dict(self.items()))
@@ -0,0 +1,137 @@
+from typing import Dict, FrozenSet, Iterable, List
+
+from virusscanner.interface.datastructures.connection import Connection
+
+
+class AttributeIndex:
+    """Class for finding the connections of a graph by their attributes. Every attribute name used in the graph gets
+    a bit in the attribute vocabulary of the graph so sets of attributes can be compared as integer bitmasks. An
+    inverted index keeps the connections having each attribute so they are found without visiting the other
+    connections. The connections are kept by identity, so parallel connections between the same ports are all kept
+    and counted like in the connection list of the graph.
+
+    Args:
+        connections: Connections of the implemented graph.
+
+    """
+
+    def __init__(self, connections: Iterable[Connection]) -> None:
+        self.__attribute_bits: Dict[str, int] = dict()
+        self.__attribute_masks: Dict[FrozenSet[str], int] = dict()
+        self.__attribute_connections: Dict[str, Dict[int, List[Connection]]] = dict()
+        self.__attribute_counts: Dict[str, int] = dict()
+        for connection in connections:
+            self.add_connection(connection)
+
+    def __len__(self) -> int:
+        return len(self.__attribute_bits)
+
+    def get_attribute_names(self) -> List[str]:
+        """Method to return the attribute vocabulary of the graph.
+
+        Returns:
+            List of the attribute names where the attribute at index i has the bit i in the bitmasks.
+        """
+        return list(self.__attribute_bits)
+
+    def get_attribute_mask(self, attribute_names: Iterable[str]) -> int:
+        """Method to return the bitmask of the given attributes. Attributes which aren't used in the graph are left
+        out.
+
+        Args:
+            attribute_names: Names of the attributes.
+
+        Returns:
+            Bitmask where the bit of every given attribute used in the graph is set.
+        """
+        attribute_mask = 0
+        for attribute_name in attribute_names:
+            if attribute_name in self.__attribute_bits:
+                attribute_mask |= 1 << self.__attribute_bits[attribute_name]
+        return attribute_mask
+
+    def get_connection_mask(self, connection: Connection) -> int:
+        """Method to return the bitmask of the attributes of the given connection. The bitmasks are memoized for every
+        distinct set of attributes.
+
+        Args:
+            connection: Connection of the graph.
+
+        Returns:
+            Bitmask where the bit of every attribute of the connection is set.
+        """
+        attribute_mask = self.__attribute_masks.get(connection.attributes)
+        if attribute_mask is None:
+            attribute_mask = self.get_attribute_mask(connection.attributes)
+            self.__attribute_masks[connection.attributes] = attribute_mask
+        return attribute_mask
+
+    def get_connections(self, attribute_names: Iterable[str]) -> List[Connection]:
+        """Method to find the connections having any of the given attributes.
+
+        Args:
+            attribute_names: Names of the wanted attributes.
+
+        Returns:
+            List of the connections with the attributes in the order they got the attributes. Every connection of the
+            graph is listed once, also the parallel connections between the same ports.
+        """
+        found_connections: Dict[int, List[Connection]] = dict()
+        for attribute_name in attribute_names:
+            found_connections.update(self.__attribute_connections.get(attribute_name, ()))
+        return [connection for connection_occurrences in found_connections.values()
+                for connection in connection_occurrences]
+
+    def count_connections(self, attribute_name: str) -> int:
+        """Method to count the connections having the given attribute.
+
+        Args:
+            attribute_name: Name of the attribute.
+
+        Returns:
+            Amount of connections with the attribute.
+        """
+        return self.__attribute_counts.get(attribute_name, 0)
+
+    def add_connection(self, connection: Connection) -> None:
+        """Method to add the attributes of a new connection of the graph to the index.
+
+        Args:
+            connection: Connection added to the graph.
+        """
+        for attribute_name in connection.attributes:
+            self.__add_attribute(attribute_name, connection)
+
+    def update_connection(self, connection: Connection, previous_attributes: FrozenSet[str]) -> None:
+        """Method to add the new attributes of a connection of the graph to the index.
+
+        Args:
+            connection: Connection whose attributes were added.
+            previous_attributes: Attributes the connection had before.
+        """
+        for attribute_name in connection.attributes - previous_attributes:
+            self.__add_attribute(attribute_name, connection)
+
+    def remove_connection(self, connection: Connection) -> None:
+        """Method to remove a connection removed from the graph from the index.
+
+        Args:
+            connection: Connection removed from the graph.
+        """
+        for attribute_name in connection.attributes:
+            attribute_connections = self.__attribute_connections[attribute_name]
+            connection_occurrences = attribute_connections.get(id(connection))
+            if connection_occurrences is None:
+                continue
+            connection_occurrences.pop()
+            if not connection_occurrences:
+                del attribute_connections[id(connection)]
+            self.__attribute_counts[attribute_name] -= 1
+
+    def __add_attribute(self, attribute_name: str, connection: Connection) -> None:
+        if attribute_name not in self.__attribute_bits:
+            self.__attribute_bits[attribute_name] = len(self.__attribute_bits)
+            self.__attribute_connections[attribute_name] = dict()
+            self.__attribute_counts[attribute_name] = 0
+        self.__attribute_connections[attribute_name].setdefault(id(connection), []).append(connection)
+        self.__attribute_counts[attribute_name] += 1
@@ -0,0 +1,162 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+
+
+class CompactGraph:
+    """Class for holding the connections of a graph with dense integer port IDs. The forward and the reverse
+    adjacency are stored in compressed sparse row arrays and the port list is used to decode the IDs back to ports.
+    Traversals can walk the integer rows without hashing ports or allocating a tuple per port. The compact graph is
+    kept next to the connections and the adjacency list of the graph, so it adds to the memory used per connection.
+
+    Args:
+        ports: List of ports where the index of each port is its ID.
+        forward_offsets: Array of length port count + 1 where the successors of port ID i are stored in
+            forward_targets[forward_offsets[i]:forward_offsets[i + 1]].
+        forward_targets: Array of the successor port IDs of every port.
+        reverse_offsets: Array of length port count + 1 indexing reverse_targets like forward_offsets.
+        reverse_targets: Array of the predecessor port IDs of every port.
+
+    """
+    OFFSET_TYPECODE = "q"
+    PORT_ID_TYPECODE = "i"
+
+    def __init__(self, ports: List[Port], forward_offsets: Sequence[int], forward_targets: Sequence[int],
+                 reverse_offsets: Sequence[int], reverse_targets: Sequence[int]) -> None:
+        self.ports = ports
+        self.forward_offsets = forward_offsets
+        self.forward_targets = forward_targets
+        self.reverse_offsets = reverse_offsets
+        self.reverse_targets = reverse_targets
+        self.__port_ids = {port: port_id for port_id, port in enumerate(ports)}
+        self.__forward_rows = CompressedRows(forward_offsets, forward_targets)
+        self.__reverse_rows = CompressedRows(reverse_offsets, reverse_targets)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Port, Port]]) -> "CompactGraph":
+        """Method to build a compact graph from the given pairs of begin and end ports. The order of the edges is kept
+        in the successor and predecessor rows of every port.
+
+        Args:
+            edges: Pairs of begin and end ports of the implemented graph.
+
+        Returns:
+            CompactGraph containing the given edges.
+        """
+        port_ids: Dict[Port, int] = dict()
+        ports: List[Port] = []
+        begin_ids = array(cls.PORT_ID_TYPECODE)
+        end_ids = array(cls.PORT_ID_TYPECODE)
+        for begin_port, end_port in edges:
+            for port, port_id_list in ((begin_port, begin_ids), (end_port, end_ids)):
+                port_id = port_ids.get(port)
+                if port_id is None:
+                    port_id = len(ports)
+                    port_ids[port] = port_id
+                    ports.append(port)
+                port_id_list.append(port_id)
+
+        forward_offsets, forward_targets = cls.__make_compressed_rows(len(ports), begin_ids, end_ids)
+        reverse_offsets, reverse_targets = cls.__make_compressed_rows(len(ports), end_ids, begin_ids)
+        return cls(ports, forward_offsets, forward_targets, reverse_offsets, reverse_targets)
+
+    @classmethod
+    def from_connections(cls, connections: Iterable[Connection]) -> "CompactGraph":
+        """Method to build a compact graph from the given connections.
+
+        Args:
+            connections: Connections of the implemented graph.
+
+        Returns:
+            CompactGraph containing the given connections.
+        """
+        return cls.from_edges((connection.begin, connection.end) for connection in connections)
+
+    @property
+    def port_count(self) -> int:
+        return len(self.ports)
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.forward_targets)
+
+    def get_port_id(self, port: Port) -> Optional[int]:
+        """Method to return the ID of the given port.
+
+        Args:
+            port: Port of the graph.
+
+        Returns:
+            Integer ID of the port if the port is in the graph.
+        """
+        return self.__port_ids.get(port)
+
+    def get_adjacency_rows(self, is_reverse: bool = False) -> "CompressedRows":
+        """Method to return the adjacency of the graph keyed by the port IDs.
+
+        Args:
+            is_reverse: Boolean to note if the rows should be from the end ports to the begin ports or not.
+
+        Returns:
+            Mapping of port IDs to the sequences of port IDs to which they are connected to.
+        """
+        return self.__reverse_rows if is_reverse else self.__forward_rows
+
+    @classmethod
+    def __make_compressed_rows(cls, port_count: int, source_ids: Sequence[int],
+                               target_ids: Sequence[int]) -> Tuple[array, array]:
+        offsets = array(cls.OFFSET_TYPECODE, bytes(array(cls.OFFSET_TYPECODE).itemsize * (port_count + 1)))
+        for source_id in source_ids:
+            offsets[source_id + 1] += 1
+        for port_id in range(port_count):
+            offsets[port_id + 1] += offsets[port_id]
+
+        targets = array(cls.PORT_ID_TYPECODE, bytes(array(cls.PORT_ID_TYPECODE).itemsize * len(target_ids)))
+        insert_positions = offsets[:-1]
+        for source_id, target_id in zip(source_ids, target_ids):
+            targets[insert_positions[source_id]] = target_id
+            insert_positions[source_id] += 1
+        return offsets, targets
+
+
+class CompressedRows(Mapping):
+    """Read-only adjacency list of port IDs over compressed sparse row arrays. Only the port IDs with at least one
+    adjacent port are keys of the mapping like in the adjacency lists of ports. The rows are slices of the target
+    array, so rows of memoryviews aren't copied.
+
+    Args:
+        offsets: Row offsets where the row of port ID i is targets[offsets[i]:offsets[i + 1]].
+        targets: Adjacent port IDs of every row.
+
+    """
+
+    def __init__(self, offsets: Sequence[int], targets: Sequence[int]) -> None:
+        self.__offsets = offsets
+        self.__targets = targets
+
+    def __getitem__(self, port_id: int) -> Sequence[int]:
+        adjacent_ids = self.get(port_id)
+        if adjacent_ids is None:
+            raise KeyError(port_id)
+        return adjacent_ids
+
+    def get(self, port_id: int, default=None):
+        if 0 <= port_id < len(self.__offsets) - 1:
+            row_begin = self.__offsets[port_id]
+            row_end = self.__offsets[port_id + 1]
+            if row_begin != row_end:
+                return self.__targets[row_begin:row_end]
+        return default
+
+    def __contains__(self, port_id: object) -> bool:
+        return isinstance(port_id, int) and self.get(port_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        for port_id in range(len(self.__offsets) - 1):
+            if self.__offsets[port_id] != self.__offsets[port_id + 1]:
+                yield port_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
@@ -1,14 +1,60 @@
-from typing import Set
+from typing import FrozenSet, Iterable, Optional
 
 from virusscanner.interface.datastructures.port import Port
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
+# Shared attributes of the connections without attributes.
+NO_ATTRIBUTES: FrozenSet[str] = frozenset()
 
-@dataclass(frozen=True)
+
+@dataclass(init=False, eq=False)
 class Connection:
+    """Dataclass for a connection between two ports. Connections are equal if their begin and end ports are equal,
+    the attributes aren't compared. The hash is computed once from the begin and end ports, so they should only be
+    replaced with equal ports like the interned ports of a graph. The attributes are changed in place with
+    add_attributes, which every holder of the connection sees. The attributes are kept as frozen sets and the
+    connections without attributes share one empty set. A graph interns the attribute sets of its connections so the
+    connections with the same attributes share one set."""
+    __slots__ = ("begin", "end", "attributes", "__hash", "__string")
+
     begin: Port
     end: Port
-    attributes: Set[str] = field(default_factory=set, compare=False)
+    attributes: FrozenSet[str]
+
+    def __init__(self, begin: Port, end: Port, attributes: Optional[Iterable[str]] = None) -> None:
+        self.begin = begin
+        self.end = end
+        self.attributes = frozenset(attributes) if attributes else NO_ATTRIBUTES
+        self.__hash = hash((begin, end))
+        self.__string = None
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is self.__class__:
+            return self.begin == other.begin and self.end == other.end
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self.__hash
 
     def __str__(self) -> str:
-        return "{} -> {}".format(self.begin, self.end)
+        if self.__string is None:
+            self.__string = "{} -> {}".format(self.begin, self.end)
+        return self.__string
+
+    def __reduce__(self):
+        return Connection, (self.begin, self.end, self.attributes)
+
+    def add_attributes(self, attribute_names: Iterable[str]) -> FrozenSet[str]:
+        """Method to add the given attributes to the connection. The attributes of connections in a graph should be
+        added with the add_attributes method of the graph so the attribute index of the graph is kept up to date.
+
+        Args:
+            attribute_names: Names of the added attributes.
+
+        Returns:
+            Frozen set of the attributes the connection had before.
+        """
+        previous_attributes = self.attributes
+        if not previous_attributes.issuperset(attribute_names):
+            self.attributes = previous_attributes.union(attribute_names)
+        return previous_attributes
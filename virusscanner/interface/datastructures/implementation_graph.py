@@ -1,74 +1,327 @@
+from collections import Counter
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple
+from typing import List, Dict, FrozenSet, Tuple, Optional, Mapping, Iterable, Iterator
 
+from virusscanner.interface.datastructures.adjacency_list import AdjacencyList
+from virusscanner.interface.datastructures.attribute_index import AttributeIndex
+from virusscanner.interface.datastructures.compact_graph import CompactGraph
 from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.lut_index import LUTIndex
 from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_catalogue import PortCatalogue
+from virusscanner.interface.datastructures.port_table import PortTable
+from virusscanner.interface.datastructures.spatial_index import Region, SpatialIndex
 
 
 @dataclass
 class Graph:
-    """Dataclass for holding implemented graph connections. In the future could be replaced by networkx.DiGraph."""
+    """Dataclass for holding implemented graph connections. In the future could be replaced by networkx.DiGraph.
+
+    Next to the connection list the graph keeps an edge index from the begin and end ports to the connections between
+    them, so connections are found in constant average time. Once requested, the forward and reverse adjacency lists
+    are updated together with the connections instead of being rebuilt. The connection list shouldn't be changed
+    directly, use add_connection and remove_connection instead. Removed connections are only noted and they are left
+    out of the connection list in one pass when the list is read next, so removing a connection doesn't scan the
+    list.
+    """
     connections: List[Connection] = field(default_factory=list)
     lut_values: Dict[str, Dict[str, str]] = field(default_factory=dict)  # TODO change to Dict[Port...
-    __adjacency_list: Dict[Port, Tuple[Port, ...]] = field(default_factory=dict, init=False, repr=False, compare=False)
-    __reverse_adjacency_list: Dict[Port, Tuple[Port, ...]] = field(default_factory=dict, init=False, repr=False,
+    __edge_index: Dict[Connection, List[Connection]] = field(default_factory=dict, init=False, repr=False,
+                                                             compare=False)
+    __adjacency_lists: Optional[Tuple[AdjacencyList, AdjacencyList]] = field(default=None, init=False, repr=False,
+                                                                             compare=False)
+    __compact_graph: Optional[CompactGraph] = field(default=None, init=False, repr=False, compare=False)
+    __lut_index: Optional[LUTIndex] = field(default=None, init=False, repr=False, compare=False)
+    __spatial_index: Optional[SpatialIndex] = field(default=None, init=False, repr=False, compare=False)
+    __port_catalogue: Optional[PortCatalogue] = field(default=None, init=False, repr=False, compare=False)
+    __attribute_index: Optional[AttributeIndex] = field(default=None, init=False, repr=False, compare=False)
+    __port_table: PortTable = field(default_factory=PortTable, init=False, repr=False, compare=False)
+    __attribute_sets: Dict[FrozenSet[str], FrozenSet[str]] = field(default_factory=dict, init=False, repr=False,
                                                                    compare=False)
+    __removed_connections: Counter = field(default_factory=Counter, init=False, repr=False, compare=False)
+    __batch_depth: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for connection in self.__connection_list:
+            self.__index_connection(connection)
+
+    def get_port_table(self) -> PortTable:
+        """Method to return the table of interned ports used in the graph.
+
+        Returns:
+            PortTable containing every port of the graph.
+        """
+        return self.__port_table
+
+    def get_port(self, tile_name: str, tile_x: int, tile_y: int, port_name: str) -> Optional[Port]:
+        """Method to look up a port of the graph by its tile and name. Only the ports of the current connections are
+        found.
+
+        Args:
+            tile_name: Type name of the tile of the port.
+            tile_x: X coordinate of the tile of the port.
+            tile_y: Y coordinate of the tile of the port.
+            port_name: Name of the port.
+
+        Returns:
+            Port object used in the graph if the graph contains the given port.
+        """
+        return self.__port_table.find_port(tile_name, tile_x, tile_y, port_name)
+
+    def get_compact_graph(self) -> CompactGraph:
+        """Method to return the graph with integer port IDs and compressed sparse row adjacency arrays. The compact
+        graph is an extra snapshot which is rebuilt after the connections change, it doesn't replace the connections
+        or the adjacency list.
+
+        Returns:
+            CompactGraph of the current connections of the graph.
+        """
+        if self.__compact_graph is None:
+            self.__compact_graph = CompactGraph.from_connections(self.__get_current_connections())
+        return self.__compact_graph
+
+    def set_compact_graph(self, compact_graph: CompactGraph) -> None:
+        """Method to use an already built compact graph like the one loaded from a graph cache instead of building it
+        again. The compact graph must hold the current connections of the graph with the interned ports of the graph
+        and it is dropped like a built one after the connections change.
+
+        Args:
+            compact_graph: CompactGraph of the current connections of the graph.
+        """
+        self.__compact_graph = compact_graph
+
+    def get_lut_index(self) -> LUTIndex:
+        """Method to return the index of the decoded LUT values of the graph. The index is made from the LUT values
+        on the first call so the LUT values shouldn't be changed after the index is used.
+
+        Returns:
+            LUTIndex of the LUT values of the graph.
+        """
+        if self.__lut_index is None:
+            self.__lut_index = LUTIndex(self.lut_values)
+        return self.__lut_index
+
+    def get_spatial_index(self) -> SpatialIndex:
+        """Method to return the index of the ports and connections of the graph by the coordinates of their tiles. The
+        index is a snapshot which is rebuilt after the connections change.
+
+        Returns:
+            SpatialIndex of the current connections of the graph.
+        """
+        if self.__spatial_index is None:
+            self.__spatial_index = SpatialIndex(self.__get_current_connections())
+        return self.__spatial_index
+
+    def get_port_catalogue(self) -> PortCatalogue:
+        """Method to return the catalogue of the distinct ports of the graph grouped by tile type. The catalogue is a
+        snapshot which is rebuilt after the connections change.
+
+        Returns:
+            PortCatalogue of the current connections of the graph.
+        """
+        if self.__port_catalogue is None:
+            self.__port_catalogue = PortCatalogue(self.__get_current_connections())
+        return self.__port_catalogue
+
+    def get_attribute_index(self) -> AttributeIndex:
+        """Method to return the index of the connections of the graph by their attributes. Once requested, the index
+        is updated together with the connections and their attributes.
+
+        Returns:
+            AttributeIndex of the current connections of the graph.
+        """
+        if self.__attribute_index is None:
+            self.__attribute_index = AttributeIndex(self.__get_current_connections())
+        return self.__attribute_index
+
+    def get_region_subgraph(self, region: Region) -> "Graph":
+        """Method to make a new graph of the connections which are completely inside the given region. The connections
+        are copied so adding attributes to them doesn't change this graph.
+
+        Args:
+            region: Region of the tiles whose connections are wanted.
+
+        Returns:
+            Graph containing the connections and LUT values of the region.
+        """
+        spatial_index = self.get_spatial_index()
+        region_lut_values = {str(tile): self.lut_values[str(tile)] for tile in spatial_index.get_tiles(region)
+                             if str(tile) in self.lut_values}
+        return Graph([Connection(connection.begin, connection.end, connection.attributes)
+                      for connection in spatial_index.get_connections(region)], region_lut_values)
+
+    def has_connection(self, connection: Connection) -> bool:
+        """Method to check if the graph contains a connection between the begin and end ports of the given connection.
+
+        Args:
+            connection: Connection to look up.
+
+        Returns:
+            Boolean which says if the connection is in the graph.
+        """
+        return connection in self.__edge_index
 
     def add_connection(self, new_connection: Connection) -> None:
-        """Method for adding new connections to the graph. New addition also clears the saved adjacency lists.
+        """Method for adding new connections to the graph. The adjacency lists are updated with the new connection.
+        The ports of the connection are replaced with the equal interned ports of the graph.
 
         Args:
             new_connection: Connection to be added to the graph.
         """
-        self.connections.append(new_connection)
-        if self.__adjacency_list:
-            self.__adjacency_list = dict()
-        if self.__reverse_adjacency_list:
-            self.__reverse_adjacency_list = dict()
+        self.__index_connection(new_connection)
+        self.__connection_list.append(new_connection)
+        if self.__attribute_index is not None:
+            self.__attribute_index.add_connection(new_connection)
+        if self.__adjacency_lists is not None:
+            self.__adjacency_lists[0].add_edge(new_connection.begin, new_connection.end)
+            self.__adjacency_lists[1].add_edge(new_connection.end, new_connection.begin)
+        self.__clear_snapshots()
 
     def remove_connection(self, connection_to_be_removed: Connection) -> None:
-        """Method for removing connections to the graph. This call also clears the saved adjacency lists.
+        """Method for removing connections from the graph. The first connection between the begin and end ports of
+        the given connection is removed and the adjacency lists are updated without it. The removed connection is left
+        out of the connection list when the list is read next. Raises ValueError if the connection isn't in the
+        graph.
 
         Args:
             connection_to_be_removed: Connection to be removed from the graph.
         """
-        self.connections.remove(connection_to_be_removed)
-        if self.__adjacency_list:
-            self.__adjacency_list = dict()
-        if self.__reverse_adjacency_list:
-            self.__reverse_adjacency_list = dict()
+        equal_connections = self.__edge_index.get(connection_to_be_removed)
+        if equal_connections is None:
+            raise ValueError("Connection not in the graph: " + str(connection_to_be_removed))
+        removed_connection = equal_connections.pop(0)
+        if not equal_connections:
+            del self.__edge_index[connection_to_be_removed]
+        self.__port_table.release_port(removed_connection.begin)
+        self.__port_table.release_port(removed_connection.end)
+        self.__removed_connections[id(removed_connection)] += 1
+        if self.__attribute_index is not None:
+            self.__attribute_index.remove_connection(removed_connection)
+        if self.__adjacency_lists is not None:
+            self.__adjacency_lists[0].remove_edge(removed_connection.begin, removed_connection.end)
+            self.__adjacency_lists[1].remove_edge(removed_connection.end, removed_connection.begin)
+        self.__clear_snapshots()
 
-    def get_adjacency_list(self, is_reverse: bool = False) -> Dict[Port, Tuple[Port, ...]]:
-        """Method to return an adjacency list of the graph.
+    def add_attributes(self, connection: Connection, attribute_names: Iterable[str]) -> None:
+        """Method for adding attributes to the connections of the graph between the begin and end ports of the given
+        connection. The attribute index is updated with the new attributes. Raises ValueError if the connection isn't
+        in the graph.
+
+        Args:
+            connection: Connection of the graph getting the attributes.
+            attribute_names: Names of the added attributes.
+        """
+        equal_connections = self.__edge_index.get(connection)
+        if equal_connections is None:
+            raise ValueError("Connection not in the graph: " + str(connection))
+        attribute_names = frozenset(attribute_names)
+        for existing_connection in equal_connections:
+            previous_attributes = existing_connection.attributes
+            if not previous_attributes.issuperset(attribute_names):
+                existing_connection.attributes = self.__intern_attributes(previous_attributes | attribute_names)
+                if self.__attribute_index is not None:
+                    self.__attribute_index.update_connection(existing_connection, previous_attributes)
+
+    @contextmanager
+    def batch_update(self) -> Iterator["Graph"]:
+        """Method to apply many connection changes at once. Inside the context the adjacency lists aren't updated
+        edge by edge and they are rebuilt once when they are requested after the context.
+
+        Returns:
+            Context manager yielding the graph.
+        """
+        self.__batch_depth += 1
+        self.__adjacency_lists = None
+        try:
+            yield self
+        finally:
+            self.__batch_depth -= 1
+
+    def get_adjacency_list(self, is_reverse: bool = False) -> Mapping[Port, Tuple[Port, ...]]:
+        """Method to return an adjacency list of the graph. The same adjacency list object is returned on every call
+        and it updates live when connections are added or removed, so callers which need a fixed copy while changing
+        the graph have to copy it, e.g. with dict(). Inside batch_update a separate copy which isn't updated is
+        returned and the live adjacency list is rebuilt on the first call after the batch.
 
         Args:
             is_reverse: Boolean to note if the adjacency list should be from the end ports to the begin ports or not.
 
         Returns:
-            Dictionary of ports pointing to tuples of ports to which they are connected to.
+            Mapping of ports pointing to tuples of ports to which they are connected to.
         """
-        if is_reverse:
-            if not self.__reverse_adjacency_list:
-                self.__make_adjacency_lists()
-            return self.__reverse_adjacency_list
+        if self.__adjacency_lists is None:
+            forward_adjacency_list = AdjacencyList()
+            reverse_adjacency_list = AdjacencyList()
+            for connection in self.__get_current_connections():
+                forward_adjacency_list.add_edge(connection.begin, connection.end)
+                reverse_adjacency_list.add_edge(connection.end, connection.begin)
+            if self.__batch_depth:
+                return reverse_adjacency_list if is_reverse else forward_adjacency_list
+            self.__adjacency_lists = (forward_adjacency_list, reverse_adjacency_list)
+        return self.__adjacency_lists[1] if is_reverse else self.__adjacency_lists[0]
+
+    def __index_connection(self, connection: Connection) -> None:
+        """Method to add a connection of the graph to the edge index. The ports of the connection are replaced with
+        the equal interned ports, which keeps the hash of the connection.
+
+        Args:
+            connection: Connection added to the graph.
+        """
+        connection.begin = self.__port_table.intern_port(connection.begin)
+        connection.end = self.__port_table.intern_port(connection.end)
+        connection.attributes = self.__intern_attributes(connection.attributes)
+        equal_connections = self.__edge_index.get(connection)
+        if equal_connections is None:
+            self.__edge_index[connection] = [connection]
         else:
-            if not self.__adjacency_list:
-                self.__make_adjacency_lists()
-            return self.__adjacency_list
-
-    def __make_adjacency_lists(self) -> None:
-        initial_ordered_dict = dict()
-        reverse_ordered_dict = dict()
-        for connection in self.connections:
-            if connection.begin in initial_ordered_dict:
-                initial_ordered_dict[connection.begin].append(connection.end)
-            else:
-                initial_ordered_dict[connection.begin] = [connection.end]
-            if connection.end in reverse_ordered_dict:
-                reverse_ordered_dict[connection.end].append(connection.begin)
+            equal_connections.append(connection)
+
+    def __intern_attributes(self, attributes: FrozenSet[str]) -> FrozenSet[str]:
+        """Method to return the attribute set of the graph equal to the given attributes, so the connections of the
+        graph with the same attributes share one set. The sets are kept only as long as the graph.
+
+        Args:
+            attributes: Attributes of a connection of the graph.
+
+        Returns:
+            Frozen set shared by the connections of the graph with the given attributes.
+        """
+        return self.__attribute_sets.setdefault(attributes, attributes)
+
+    def __get_current_connections(self) -> Iterable[Connection]:
+        if not self.__removed_connections:
+            return self.__connection_list
+        return (connection for equal_connections in self.__edge_index.values() for connection in equal_connections)
+
+    def __get_connections(self) -> List[Connection]:
+        if self.__removed_connections:
+            self.__drop_removed_connections()
+        return self.__connection_list
+
+    def __set_connections(self, connections: List[Connection]) -> None:
+        self.__connection_list = connections
+
+    def __drop_removed_connections(self) -> None:
+        """Method to leave the removed connections out of the connection list. The list object is kept and the first
+        occurrences of the removed connections are dropped like with list.remove. The removed connections stay in the
+        list until then, so their IDs can't be reused by new connections.
+        """
+        remaining_connections = []
+        for connection in self.__connection_list:
+            if self.__removed_connections[id(connection)]:
+                self.__removed_connections[id(connection)] -= 1
             else:
-                reverse_ordered_dict[connection.end] = [connection.begin]
-        for key in initial_ordered_dict:
-            self.__adjacency_list[key] = tuple(initial_ordered_dict[key])
-        for key in reverse_ordered_dict:
-            self.__reverse_adjacency_list[key] = tuple(reverse_ordered_dict[key])
+                remaining_connections.append(connection)
+        self.__connection_list[:] = remaining_connections
+        self.__removed_connections.clear()
+
+    def __clear_snapshots(self) -> None:
+        self.__compact_graph = None
+        self.__spatial_index = None
+        self.__port_catalogue = None
+
+
+# The connection list is a field of the dataclass, so the property leaving out the removed connections when the list
+# is read is added after the dataclass is made.
+Graph.connections = property(Graph._Graph__get_connections, Graph._Graph__set_connections)
@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+@dataclass(frozen=True)
+class LUTFunction:
+    """Dataclass for a decoded LUT value. Bit i of the mask is the output of the LUT for the input state i, which is
+    the character i of the truth table string."""
+    __slots__ = ("truth_table", "mask", "input_count")
+
+    truth_table: str
+    mask: int
+    input_count: int
+
+    @classmethod
+    def from_truth_table(cls, truth_table: str) -> "LUTFunction":
+        """Method to decode the given LUT value string.
+
+        Args:
+            truth_table: String of '0' and '1' characters representing the binary of the LUT value.
+
+        Returns:
+            LUTFunction of the given LUT value.
+        """
+        return cls(truth_table, int(truth_table[::-1], 2), len(truth_table).bit_length() - 1)
+
+
+class LUTIndex:
+    """Class for looking up the LUT values of a graph by the tiles and ports instead of their string forms. The LUT
+    values are decoded once when the index is made.
+
+    Args:
+        lut_values: Dictionary of the LUT values keyed by the string form of the tiles and the LUT port names.
+
+    """
+
+    def __init__(self, lut_values: Dict[str, Dict[str, str]]) -> None:
+        self.__tile_lut_functions: Dict[Tile, Dict[str, LUTFunction]] = dict()
+        decoded_lut_functions: Dict[str, LUTFunction] = dict()
+        for tile_string, tile_lut_values in lut_values.items():
+            tile = Tile.make_tile_from_string(tile_string)
+            if tile is None:
+                continue
+            tile_lut_functions = dict()
+            for lut_port_name, truth_table in tile_lut_values.items():
+                if truth_table:
+                    if truth_table not in decoded_lut_functions:
+                        decoded_lut_functions[truth_table] = LUTFunction.from_truth_table(truth_table)
+                    tile_lut_functions[lut_port_name] = decoded_lut_functions[truth_table]
+            self.__tile_lut_functions[tile] = tile_lut_functions
+
+    def __len__(self) -> int:
+        return len(self.__tile_lut_functions)
+
+    def is_lut_tile(self, tile: Tile) -> bool:
+        return tile in self.__tile_lut_functions
+
+    def get_lut_function(self, begin_port: Port, end_port: Port) -> Optional[LUTFunction]:
+        """Method to return the LUT function of the given connection if the connection goes through a LUT.
+
+        Args:
+            begin_port: Port of the begin of the connection.
+            end_port: Port of the end of the connection.
+
+        Returns:
+            LUTFunction of the LUT if the ports are in the same tile with LUT values and the end port has a LUT value.
+        """
+        if begin_port.tile is not end_port.tile and begin_port.tile != end_port.tile:
+            return None
+        tile_lut_functions = self.__tile_lut_functions.get(end_port.tile)
+        if tile_lut_functions is None:
+            return None
+        return tile_lut_functions.get(end_port.name)
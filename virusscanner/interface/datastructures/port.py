@@ -4,8 +4,22 @@ from dataclasses import dataclass
 
 @dataclass(frozen=True)
 class Port:
+    __slots__ = ("tile", "name", "__hash", "__string")
+
     tile: Tile
     name: str
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_Port__hash", hash((self.tile, self.name)))
+        object.__setattr__(self, "_Port__string", None)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
     def __str__(self) -> str:
-        return "{} {}".format(str(self.tile), self.name)
+        if self.__string is None:
+            object.__setattr__(self, "_Port__string", "{} {}".format(str(self.tile), self.name))
+        return self.__string
+
+    def __reduce__(self):
+        return Port, (self.tile, self.name)
@@ -0,0 +1,89 @@
+from typing import Dict, Iterable, List, Tuple
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+
+
+class PortCatalogue:
+    """Class for holding the distinct ports of a graph grouped by the types of their tiles. Every tile type has a
+    vocabulary of the port names used in tiles of that type so rules can be tested once per tile type and once per
+    port name instead of once per port.
+
+    Args:
+        connections: Connections of the implemented graph.
+
+    """
+    BEGIN_ROLE = 1
+    END_ROLE = 2
+    PORT_ROLES = {"begin": BEGIN_ROLE, "end": END_ROLE}
+
+    def __init__(self, connections: Iterable[Connection]) -> None:
+        self.__port_names: Dict[str, Dict[str, List[Port]]] = dict()
+        self.__port_roles: Dict[Port, int] = dict()
+        self.__connection_counts: Dict[str, List[int]] = dict()
+        for connection in connections:
+            self.__add_port(connection.begin, self.BEGIN_ROLE)
+            self.__add_port(connection.end, self.END_ROLE)
+            self.__connection_counts[connection.begin.tile.name][0] += 1
+            self.__connection_counts[connection.end.tile.name][1] += 1
+
+    def __add_port(self, port: Port, port_role: int) -> None:
+        port_roles = self.__port_roles.get(port)
+        if port_roles is None:
+            self.__port_roles[port] = port_role
+            tile_type_port_names = self.__port_names.get(port.tile.name)
+            if tile_type_port_names is None:
+                tile_type_port_names = dict()
+                self.__port_names[port.tile.name] = tile_type_port_names
+                self.__connection_counts[port.tile.name] = [0, 0]
+            if port.name in tile_type_port_names:
+                tile_type_port_names[port.name].append(port)
+            else:
+                tile_type_port_names[port.name] = [port]
+        else:
+            self.__port_roles[port] = port_roles | port_role
+
+    def __len__(self) -> int:
+        return len(self.__port_roles)
+
+    def get_tile_types(self) -> List[str]:
+        """Method to return the distinct tile types of the graph.
+
+        Returns:
+            List of the tile types in the order they were first used.
+        """
+        return list(self.__port_names)
+
+    def get_port_names(self, tile_type: str) -> Dict[str, List[Port]]:
+        """Method to return the vocabulary of port names used in tiles of the given type.
+
+        Args:
+            tile_type: Type name of the tiles.
+
+        Returns:
+            Dictionary of the distinct ports with each port name in tiles of the given type.
+        """
+        return self.__port_names.get(tile_type, dict())
+
+    def has_port_role(self, port: Port, port_key: str) -> bool:
+        """Method to check if the given port is used as the given end of any connection.
+
+        Args:
+            port: Port to be checked.
+            port_key: Key string "begin" or "end" noting the end of the connections.
+
+        Returns:
+            Boolean which says if the port is used in the given role.
+        """
+        return bool(self.__port_roles.get(port, 0) & self.PORT_ROLES[port_key])
+
+    def get_tile_type_counts(self) -> Dict[str, Tuple[int, int, int]]:
+        """Method to return the amounts of ports and connections of every tile type.
+
+        Returns:
+            Dictionary of the port count, the count of connections beginning from the tile type and the count of
+            connections ending in the tile type keyed by the tile types sorted by name.
+        """
+        return {tile_type: (sum(len(ports) for ports in self.__port_names[tile_type].values()),
+                            self.__connection_counts[tile_type][0], self.__connection_counts[tile_type][1])
+                for tile_type in sorted(self.__port_names)}
@@ -0,0 +1,121 @@
+from typing import Dict, Iterator, Optional, Tuple
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class PortTable:
+    """Class for interning the tiles and ports of a graph so that all equal ports are represented by the same object.
+
+    Interned ports are shared between every connection using them which saves memory and lets dictionary and set
+    lookups succeed on the identity check without comparing the nested tile values. The table counts the uses of
+    every port: a port is used once by every connection it belongs to and it is forgotten together with its tile when
+    the last use is released. Lookups never add to the table, only intern_port does.
+    """
+
+    def __init__(self) -> None:
+        self.__tiles: Dict[Tuple[str, int, int], Tile] = dict()
+        self.__tile_port_counts: Dict[Tuple[str, int, int], int] = dict()
+        self.__ports: Dict[Port, Port] = dict()
+        self.__port_uses: Dict[Port, int] = dict()
+
+    def __len__(self) -> int:
+        return len(self.__port_uses)
+
+    def __iter__(self) -> Iterator[Port]:
+        return iter(self.__port_uses)
+
+    def get_tile(self, tile_name: str, tile_x: int, tile_y: int) -> Tile:
+        """Method to return the interned tile with the given values or a new tile if it is missing. The new tile is
+        not added to the table.
+
+        Args:
+            tile_name: Type name of the tile.
+            tile_x: X coordinate of the tile.
+            tile_y: Y coordinate of the tile.
+
+        Returns:
+            Tile object shared by every port of the table in the given tile.
+        """
+        found_tile = self.__tiles.get((tile_name, tile_x, tile_y))
+        return Tile(tile_name, tile_x, tile_y) if found_tile is None else found_tile
+
+    def get_port(self, tile_name: str, tile_x: int, tile_y: int, port_name: str) -> Port:
+        """Method to return the interned port with the given values or a new port in the interned tile if it is
+        missing. The new port is not added to the table until it is interned.
+
+        Args:
+            tile_name: Type name of the tile of the port.
+            tile_x: X coordinate of the tile of the port.
+            tile_y: Y coordinate of the tile of the port.
+            port_name: Name of the port.
+
+        Returns:
+            Port object shared by every connection using the given port.
+        """
+        new_port = Port(self.get_tile(tile_name, tile_x, tile_y), port_name)
+        found_port = self.__ports.get(new_port)
+        return new_port if found_port is None else found_port
+
+    def intern_port(self, port: Port) -> Port:
+        """Method to return the interned port equal to the given port and to add a use to it. The given port is added
+        to the table if no equal port has been added before. If the table already has the tile of the given port, a
+        copy of the port in the interned tile is added instead.
+
+        Args:
+            port: Port to be interned.
+
+        Returns:
+            Port object shared by every connection using the given port.
+        """
+        found_port = self.__ports.get(port)
+        if found_port is None:
+            found_tile = self.__tiles.get((port.tile.name, port.tile.x, port.tile.y))
+            if found_tile is None:
+                found_port = self.__add_port(port)
+            else:
+                found_port = self.__add_port(port if port.tile is found_tile else Port(found_tile, port.name))
+        self.__port_uses[found_port] = self.__port_uses.get(found_port, 0) + 1
+        return found_port
+
+    def release_port(self, port: Port) -> None:
+        """Method to remove a use of the given interned port. The port is removed from the table after its last use
+        and the tile of the port after its last port.
+
+        Args:
+            port: Port whose use ended.
+        """
+        port_uses = self.__port_uses[port] - 1
+        if port_uses:
+            self.__port_uses[port] = port_uses
+            return
+        del self.__port_uses[port]
+        del self.__ports[port]
+        tile_key = (port.tile.name, port.tile.x, port.tile.y)
+        self.__tile_port_counts[tile_key] -= 1
+        if not self.__tile_port_counts[tile_key]:
+            del self.__tile_port_counts[tile_key]
+            del self.__tiles[tile_key]
+
+    def find_port(self, tile_name: str, tile_x: int, tile_y: int, port_name: str) -> Optional[Port]:
+        """Method to look up a port with the given values without adding it to the table.
+
+        Args:
+            tile_name: Type name of the tile of the port.
+            tile_x: X coordinate of the tile of the port.
+            tile_y: Y coordinate of the tile of the port.
+            port_name: Name of the port.
+
+        Returns:
+            Interned port if it exists in the table.
+        """
+        return self.__ports.get(Port(Tile(tile_name, tile_x, tile_y), port_name))
+
+    def __add_port(self, port: Port) -> Port:
+        tile_key = (port.tile.name, port.tile.x, port.tile.y)
+        if tile_key not in self.__tiles:
+            self.__tiles[tile_key] = port.tile
+            self.__tile_port_counts[tile_key] = 0
+        self.__tile_port_counts[tile_key] += 1
+        self.__ports[port] = port
+        return port
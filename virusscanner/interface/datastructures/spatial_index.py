@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+@dataclass(frozen=True)
+class Region:
+    """Dataclass for a rectangular region of tiles like a clock region or a pblock. The limits are inclusive and a
+    missing limit leaves that side of the region open."""
+    __slots__ = ("min_x", "min_y", "max_x", "max_y")
+
+    min_x: Optional[int]
+    min_y: Optional[int]
+    max_x: Optional[int]
+    max_y: Optional[int]
+
+    def __reduce__(self):
+        return Region, (self.min_x, self.min_y, self.max_x, self.max_y)
+
+    def contains(self, tile: Tile) -> bool:
+        return (self.min_x is None or tile.x >= self.min_x) and (self.max_x is None or tile.x <= self.max_x) and \
+               (self.min_y is None or tile.y >= self.min_y) and (self.max_y is None or tile.y <= self.max_y)
+
+
+class SpatialIndex:
+    """Class for finding the tiles, ports and connections of a graph by the coordinates of the tiles. The tiles are
+    kept in square grid buckets so a region query only visits the buckets overlapping the region.
+
+    Args:
+        connections: Connections of the implemented graph.
+        bucket_size: Width and height of the grid buckets in tiles.
+
+    """
+    DEFAULT_BUCKET_SIZE = 8
+
+    def __init__(self, connections: Iterable[Connection], bucket_size: int = DEFAULT_BUCKET_SIZE) -> None:
+        if bucket_size < 1:
+            raise ValueError("Bucket size has to be positive!")
+        self.__bucket_size = bucket_size
+        self.__buckets: Dict[Tuple[int, int], List[Tile]] = dict()
+        self.__tile_ports: Dict[Tile, Dict[Port, None]] = dict()
+        self.__tile_connections: Dict[Tile, List[Connection]] = dict()
+        for connection in connections:
+            self.__add_port(connection.begin)
+            self.__add_port(connection.end)
+            self.__tile_connections[connection.begin.tile].append(connection)
+            if connection.end.tile != connection.begin.tile:
+                self.__tile_connections[connection.end.tile].append(connection)
+        bucket_keys = list(self.__buckets)
+        self.__bucket_bounds = (min(key[0] for key in bucket_keys), min(key[1] for key in bucket_keys),
+                                max(key[0] for key in bucket_keys), max(key[1] for key in bucket_keys)) \
+            if bucket_keys else None
+
+    def __len__(self) -> int:
+        return len(self.__tile_ports)
+
+    def __add_port(self, port: Port) -> None:
+        tile_ports = self.__tile_ports.get(port.tile)
+        if tile_ports is None:
+            tile_ports = dict()
+            self.__tile_ports[port.tile] = tile_ports
+            self.__tile_connections[port.tile] = []
+            bucket_key = (port.tile.x // self.__bucket_size, port.tile.y // self.__bucket_size)
+            if bucket_key in self.__buckets:
+                self.__buckets[bucket_key].append(port.tile)
+            else:
+                self.__buckets[bucket_key] = [port.tile]
+        tile_ports[port] = None
+
+    def get_tiles(self, region: Region) -> Iterator[Tile]:
+        """Method to find the tiles of the graph in the given region.
+
+        Args:
+            region: Region of the wanted tiles.
+
+        Returns:
+            Iterator of the tiles in the region.
+        """
+        if self.__bucket_bounds is None:
+            return
+        min_bucket_x, min_bucket_y, max_bucket_x, max_bucket_y = self.__bucket_bounds
+        if region.min_x is not None:
+            min_bucket_x = max(min_bucket_x, region.min_x // self.__bucket_size)
+        if region.min_y is not None:
+            min_bucket_y = max(min_bucket_y, region.min_y // self.__bucket_size)
+        if region.max_x is not None:
+            max_bucket_x = min(max_bucket_x, region.max_x // self.__bucket_size)
+        if region.max_y is not None:
+            max_bucket_y = min(max_bucket_y, region.max_y // self.__bucket_size)
+        for bucket_x in range(min_bucket_x, max_bucket_x + 1):
+            for bucket_y in range(min_bucket_y, max_bucket_y + 1):
+                for tile in self.__buckets.get((bucket_x, bucket_y), ()):
+                    if region.contains(tile):
+                        yield tile
+
+    def get_ports(self, region: Region) -> Iterator[Port]:
+        """Method to find the ports of the graph in the given region.
+
+        Args:
+            region: Region of the wanted ports.
+
+        Returns:
+            Iterator of the ports whose tiles are in the region.
+        """
+        for tile in self.get_tiles(region):
+            yield from self.__tile_ports[tile]
+
+    def get_connections(self, region: Region) -> Iterator[Connection]:
+        """Method to find the connections of the graph which are completely inside the given region.
+
+        Args:
+            region: Region of the wanted connections.
+
+        Returns:
+            Iterator of the connections whose begin and end ports are both in the region.
+        """
+        for tile in self.get_tiles(region):
+            for connection in self.__tile_connections[tile]:
+                if connection.begin.tile == tile and region.contains(connection.end.tile):
+                    yield connection
+
+    def get_crossing_connections(self, region: Region) -> Iterator[Connection]:
+        """Method to find the connections of the graph which cross the boundary of the given region.
+
+        Args:
+            region: Region of the wanted connections.
+
+        Returns:
+            Iterator of the connections which have exactly one of their ports in the region.
+        """
+        for tile in self.get_tiles(region):
+            for connection in self.__tile_connections[tile]:
+                if not region.contains(connection.end.tile) or not region.contains(connection.begin.tile):
+                    yield connection
@@ -5,6 +5,7 @@ from typing import Pattern, ClassVar
 
 @dataclass(frozen=True)
 class Tile:
+    __slots__ = ("name", "x", "y", "__hash", "__string")
     __tile_format: ClassVar[Pattern] = re.compile(
         r"(?P<tile_name>.*)_X(?P<tile_x>\d+)Y(?P<tile_y>\d+)")
 
@@ -12,8 +13,20 @@ class Tile:
     x: int
     y: int
 
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_Tile__hash", hash((self.name, self.x, self.y)))
+        object.__setattr__(self, "_Tile__string", None)
+
+    def __hash__(self) -> int:
+        return self.__hash
+
     def __str__(self) -> str:
-        return "{}_X{}Y{}".format(self.name, self.x, self.y)
+        if self.__string is None:
+            object.__setattr__(self, "_Tile__string", "{}_X{}Y{}".format(self.name, self.x, self.y))
+        return self.__string
+
+    def __reduce__(self):
+        return Tile, (self.name, self.x, self.y)
 
     @classmethod
     def make_tile_from_string(cls, str_input: str):
@@ -0,0 +1,257 @@
+import hashlib
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+from virusscanner.interface.datastructures.compact_graph import CompactGraph
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class GraphCache:
+    """Class for storing the implemented graph read from a JSON file in a compact binary sidecar file which can be
+    loaded back instead of parsing the JSON file again. The cache file is memory mapped when it is loaded and the
+    sections are used through views on the mapping without copying them. The JSON decoding is skipped, but the ports
+    and connections of the graph are still built from the stored columns, while the compressed sparse row adjacency
+    of the compact graph is used directly from the mapping.
+
+    The cache file consists of a header, a section table and 8 byte aligned sections holding a string table, columnar
+    tile and port tables, the connections as begin port, end port and attribute set ID columns, the attribute sets,
+    the LUT value tables and the forward and reverse adjacency arrays of the compact graph. The header stores the
+    size, modification time and a hash of the JSON file so stale caches are ignored.
+
+    Args:
+        json_file: File path to the JSON file which the cache belongs to.
+
+    """
+    FILE_EXTENSION = ".graphcache"
+
+    __MAGIC = b"VSGRAPH\0"
+    __VERSION = 3
+    __HEADER_FORMAT = "<8sIIQQ16sI4x"
+    __SECTION_FORMAT = "<8sQQ"
+    __HASH_SAMPLE_SIZE = 1 << 20
+
+    __STRING_OFFSETS = b"STROFFS"
+    __STRING_DATA = b"STRDATA"
+    __TILE_NAMES = b"TNAME"
+    __TILE_XS = b"TX"
+    __TILE_YS = b"TY"
+    __PORT_TILES = b"PTILE"
+    __PORT_NAMES = b"PNAME"
+    __CONNECTION_BEGINS = b"EBEGIN"
+    __CONNECTION_ENDS = b"EEND"
+    __CONNECTION_ATTRIBUTES = b"EATTR"
+    __ATTRIBUTE_SET_OFFSETS = b"ASOFFS"
+    __ATTRIBUTE_SET_NAMES = b"ASNAME"
+    __LUT_TILES = b"LTILE"
+    __LUT_NAMES = b"LNAME"
+    __LUT_VALUES = b"LVAL"
+    __FORWARD_OFFSETS = b"FOFFS"
+    __FORWARD_TARGETS = b"FTARGET"
+    __REVERSE_OFFSETS = b"ROFFS"
+    __REVERSE_TARGETS = b"RTARGET"
+
+    def __init__(self, json_file: str) -> None:
+        self.json_file = json_file
+        self.cache_file = json_file + self.FILE_EXTENSION
+
+    def is_valid(self) -> bool:
+        """Method to check if the cache file exists and was written from the current version of the JSON file.
+
+        Returns:
+            Boolean which says if the cache can be loaded instead of the JSON file.
+        """
+        try:
+            with open(self.cache_file, "rb") as cache_file_handle:
+                header = cache_file_handle.read(struct.calcsize(self.__HEADER_FORMAT))
+        except OSError:
+            return False
+        if len(header) != struct.calcsize(self.__HEADER_FORMAT):
+            return False
+        magic, version, byte_order, source_size, source_mtime, source_digest, _ = struct.unpack(
+            self.__HEADER_FORMAT, header)
+        return magic == self.__MAGIC and version == self.__VERSION and byte_order == self.__get_byte_order() and \
+            (source_size, source_mtime, source_digest) == self.__get_source_key()
+
+    def load_graph(self) -> Graph:
+        """Method to load the implemented graph from the cache file. The mapping of the file stays open while the
+        compact graph of the loaded graph uses the adjacency arrays in it.
+
+        Returns:
+            Graph object containing the cached data.
+        """
+        with open(self.cache_file, "rb") as cache_file_handle:
+            mapped_file = mmap.mmap(cache_file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        sections = self.__read_sections(memoryview(mapped_file))
+
+        string_offsets = sections[self.__STRING_OFFSETS].cast("q")
+        string_data = sections[self.__STRING_DATA]
+        strings = [str(string_data[string_offsets[index]:string_offsets[index + 1]], "utf-8")
+                   for index in range(len(string_offsets) - 1)]
+
+        tiles = [Tile(strings[name_id], tile_x, tile_y) for name_id, tile_x, tile_y in
+                 zip(sections[self.__TILE_NAMES].cast("i"), sections[self.__TILE_XS].cast("i"),
+                     sections[self.__TILE_YS].cast("i"))]
+        ports = [Port(tiles[tile_id], strings[name_id]) for tile_id, name_id in
+                 zip(sections[self.__PORT_TILES].cast("i"), sections[self.__PORT_NAMES].cast("i"))]
+
+        attribute_set_offsets = sections[self.__ATTRIBUTE_SET_OFFSETS].cast("q")
+        attribute_set_names = sections[self.__ATTRIBUTE_SET_NAMES].cast("i")
+        attribute_sets = [frozenset(strings[name_id] for name_id in
+                                    attribute_set_names[attribute_set_offsets[index]:attribute_set_offsets[index + 1]])
+                          for index in range(len(attribute_set_offsets) - 1)]
+
+        connections = [Connection(ports[begin_id], ports[end_id], attribute_sets[attribute_set_id])
+                       for begin_id, end_id, attribute_set_id in
+                       zip(sections[self.__CONNECTION_BEGINS].cast("i"), sections[self.__CONNECTION_ENDS].cast("i"),
+                           sections[self.__CONNECTION_ATTRIBUTES].cast("i"))]
+
+        lut_values: Dict[str, Dict[str, str]] = dict()
+        for tile_id, name_id, value_id in zip(sections[self.__LUT_TILES].cast("i"),
+                                              sections[self.__LUT_NAMES].cast("i"),
+                                              sections[self.__LUT_VALUES].cast("i")):
+            lut_values.setdefault(strings[tile_id], dict())[strings[name_id]] = strings[value_id]
+
+        found_connections_graph = Graph(connections, lut_values)
+        found_connections_graph.set_compact_graph(CompactGraph(
+            ports, sections[self.__FORWARD_OFFSETS].cast(CompactGraph.OFFSET_TYPECODE),
+            sections[self.__FORWARD_TARGETS].cast(CompactGraph.PORT_ID_TYPECODE),
+            sections[self.__REVERSE_OFFSETS].cast(CompactGraph.OFFSET_TYPECODE),
+            sections[self.__REVERSE_TARGETS].cast(CompactGraph.PORT_ID_TYPECODE)))
+        return found_connections_graph
+
+    def save_graph(self, connections_graph: Graph) -> None:
+        """Method to write the given graph to the cache file. The file is written next to the cache location first
+        and then moved in place so readers never see partially written caches.
+
+        Args:
+            connections_graph: Graph read from the JSON file of this cache.
+
+        Raises:
+            OSError: If the cache file couldn't be written.
+        """
+        source_key = self.__get_source_key()
+        string_ids: Dict[str, int] = dict()
+
+        compact_graph = connections_graph.get_compact_graph()
+        tile_ids: Dict[Tuple[str, int, int], int] = dict()
+        tile_columns = (array("i"), array("i"), array("i"))
+        port_columns = (array("i"), array("i"))
+        for port in compact_graph.ports:
+            tile_key = (port.tile.name, port.tile.x, port.tile.y)
+            if tile_key not in tile_ids:
+                tile_ids[tile_key] = len(tile_ids)
+                tile_columns[0].append(self.__get_string_id(string_ids, port.tile.name))
+                tile_columns[1].append(port.tile.x)
+                tile_columns[2].append(port.tile.y)
+            port_columns[0].append(tile_ids[tile_key])
+            port_columns[1].append(self.__get_string_id(string_ids, port.name))
+
+        attribute_set_ids: Dict[FrozenSet[str], int] = dict()
+        attribute_set_columns = (array("q", [0]), array("i"))
+        connection_columns = (array("i"), array("i"), array("i"))
+        for connection in connections_graph.connections:
+            attribute_set_id = attribute_set_ids.get(connection.attributes)
+            if attribute_set_id is None:
+                attribute_set_id = len(attribute_set_ids)
+                attribute_set_ids[connection.attributes] = attribute_set_id
+                attribute_set_columns[1].extend(self.__get_string_id(string_ids, attribute)
+                                                for attribute in sorted(connection.attributes))
+                attribute_set_columns[0].append(len(attribute_set_columns[1]))
+            connection_columns[0].append(compact_graph.get_port_id(connection.begin))
+            connection_columns[1].append(compact_graph.get_port_id(connection.end))
+            connection_columns[2].append(attribute_set_id)
+
+        lut_columns = (array("i"), array("i"), array("i"))
+        for tile_name, tile_lut_values in connections_graph.lut_values.items():
+            for lut_name, lut_value in tile_lut_values.items():
+                lut_columns[0].append(self.__get_string_id(string_ids, tile_name))
+                lut_columns[1].append(self.__get_string_id(string_ids, lut_name))
+                lut_columns[2].append(self.__get_string_id(string_ids, lut_value))
+
+        encoded_strings = [string.encode("utf-8") for string in string_ids]
+        string_offsets = array("q", [0])
+        for encoded_string in encoded_strings:
+            string_offsets.append(string_offsets[-1] + len(encoded_string))
+
+        sections = [(self.__STRING_OFFSETS, string_offsets), (self.__STRING_DATA, b"".join(encoded_strings)),
+                    (self.__TILE_NAMES, tile_columns[0]), (self.__TILE_XS, tile_columns[1]),
+                    (self.__TILE_YS, tile_columns[2]), (self.__PORT_TILES, port_columns[0]),
+                    (self.__PORT_NAMES, port_columns[1]), (self.__CONNECTION_BEGINS, connection_columns[0]),
+                    (self.__CONNECTION_ENDS, connection_columns[1]),
+                    (self.__CONNECTION_ATTRIBUTES, connection_columns[2]),
+                    (self.__ATTRIBUTE_SET_OFFSETS, attribute_set_columns[0]),
+                    (self.__ATTRIBUTE_SET_NAMES, attribute_set_columns[1]), (self.__LUT_TILES, lut_columns[0]),
+                    (self.__LUT_NAMES, lut_columns[1]), (self.__LUT_VALUES, lut_columns[2]),
+                    (self.__FORWARD_OFFSETS, compact_graph.forward_offsets),
+                    (self.__FORWARD_TARGETS, compact_graph.forward_targets),
+                    (self.__REVERSE_OFFSETS, compact_graph.reverse_offsets),
+                    (self.__REVERSE_TARGETS, compact_graph.reverse_targets)]
+        self.__write_sections(sections, source_key)
+
+    def __write_sections(self, sections: List[Tuple[bytes, Sequence]], source_key: Tuple[int, int, bytes]) -> None:
+        header_size = struct.calcsize(self.__HEADER_FORMAT) + len(sections) * struct.calcsize(self.__SECTION_FORMAT)
+        section_table = []
+        section_offset = self.__align(header_size)
+        for name, data in sections:
+            data_bytes = data if isinstance(data, bytes) else data.tobytes()
+            section_table.append((name, section_offset, data_bytes))
+            section_offset = self.__align(section_offset + len(data_bytes))
+
+        temporary_file = "{}.{}.tmp".format(self.cache_file, os.getpid())
+        try:
+            with open(temporary_file, "wb") as cache_file_handle:
+                cache_file_handle.write(struct.pack(self.__HEADER_FORMAT, self.__MAGIC, self.__VERSION,
+                                                    self.__get_byte_order(), *source_key, len(sections)))
+                for name, offset, data_bytes in section_table:
+                    cache_file_handle.write(struct.pack(self.__SECTION_FORMAT, name, offset, len(data_bytes)))
+                for name, offset, data_bytes in section_table:
+                    cache_file_handle.write(bytes(offset - cache_file_handle.tell()))
+                    cache_file_handle.write(data_bytes)
+            os.replace(temporary_file, self.cache_file)
+        finally:
+            if os.path.exists(temporary_file):
+                os.remove(temporary_file)
+
+    def __read_sections(self, mapped_data: memoryview) -> Dict[bytes, memoryview]:
+        header_size = struct.calcsize(self.__HEADER_FORMAT)
+        section_size = struct.calcsize(self.__SECTION_FORMAT)
+        section_count = struct.unpack_from(self.__HEADER_FORMAT, mapped_data)[-1]
+        sections = dict()
+        for section_index in range(section_count):
+            name, offset, length = struct.unpack_from(self.__SECTION_FORMAT, mapped_data,
+                                                      header_size + section_index * section_size)
+            sections[name.rstrip(b"\0")] = mapped_data[offset:offset + length]
+        return sections
+
+    def __get_source_key(self) -> Tuple[int, int, bytes]:
+        file_stats = os.stat(self.json_file)
+        source_hash = hashlib.blake2b(digest_size=16)
+        with open(self.json_file, "rb") as json_file_handle:
+            source_hash.update(json_file_handle.read(self.__HASH_SAMPLE_SIZE))
+            if file_stats.st_size > 2 * self.__HASH_SAMPLE_SIZE:
+                json_file_handle.seek(-self.__HASH_SAMPLE_SIZE, os.SEEK_END)
+            source_hash.update(json_file_handle.read())
+        return file_stats.st_size, file_stats.st_mtime_ns, source_hash.digest()
+
+    @staticmethod
+    def __get_string_id(string_ids: Dict[str, int], string: str) -> int:
+        string_id = string_ids.get(string)
+        if string_id is None:
+            string_id = len(string_ids)
+            string_ids[string] = string_id
+        return string_id
+
+    @staticmethod
+    def __get_byte_order() -> int:
+        return 0 if sys.byteorder == "little" else 1
+
+    @staticmethod
+    def __align(offset: int) -> int:
+        return (offset + 7) & ~7
@@ -1,11 +1,18 @@
+import os
 from configparser import ConfigParser
-from typing import List, Dict, Pattern, Union
+from typing import List, Dict, Optional, Pattern, Union, FrozenSet, Hashable, Set, Tuple
 
 from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_catalogue import PortCatalogue
+from virusscanner.interface.datastructures.spatial_index import Region
+from virusscanner.interface.graph_cache import GraphCache
 from virusscanner.interface.json_graph_parser import GraphCreator
 from virusscanner.interface.signature_options import SignatureOptions
+from virusscanner.parsing.util.attribute_propagator import AttributePropagator
 from virusscanner.parsing.util.attributes_adder import AttributesAdder
 from virusscanner.parsing.util.connections_remover import ConnectionRemover
+from virusscanner.parsing.util.port_matcher import PortMatcher
 
 
 class Input:
@@ -15,32 +22,46 @@ class Input:
         config: Input config file path.
         connections_graph_file: Input implemented connections graph file path.
         output_file: Name of the file to write the output of the scanners to.
+        is_streamed: Boolean to note if the connections graph file should be parsed incrementally.
+        is_cached: Boolean to note if the connections graph should be loaded from and saved to a binary cache file
+            next to the connections graph file.
+        json_backend: Name of the JSON library used to decode the connections graph file.
 
     """
     __CONFIG_SCANNER_SECTION = "virus_signatures"
     __CONFIG_ATTRIBUTES_SECTION = "connection_attributes"
+    __CONFIG_PROPAGATION_SECTION = "attribute_propagation"
     __CONFIG_REMOVABLES_SECTION = "removables"
 
     __CONFIG_ATTRIBUTES_OPTION = "attributes_file"
+    __CONFIG_PROPAGATION_OPTION = "propagation_file"
     __CONFIG_REMOVABLES_OPTION = "connections_file"
 
+    __GRAPH_CACHE_BACKEND = "graph cache"
+
     __virus_signature_option_inputs = dict()
 
     __chosen_virus_signatures = dict()
 
-    def __init__(self, config: str, output_file: str, connections_graph_file: str) -> None:
+    def __init__(self, config: str, output_file: str, connections_graph_file: str, is_streamed: bool = False,
+                 is_cached: bool = False, json_backend: Optional[str] = None) -> None:
         self.output_file = output_file
         self.input_file = connections_graph_file
+        self.json_backend = None
+        self.unmatched_removable_connections: List[str] = []
+        self.__matched_port_catalogue: Optional[PortCatalogue] = None
+        self.__port_matchers: Dict[Hashable, PortMatcher] = dict()
+        self.__matching_ports: Dict[Tuple[Hashable, FrozenSet[str]], FrozenSet[Port]] = dict()
 
         config_parser = self.__get_parser(config)
-        self.__set_found_connections_from_json(connections_graph_file)
+        self.__set_found_connections_from_json(connections_graph_file, is_streamed, is_cached, json_backend)
 
         self.__set_virus_signature_set(config_parser)
         SignatureOptions().set_virus_signature_option_inputs(set(self.__chosen_virus_signatures.keys()),
                                                              self.__virus_signature_option_inputs, config_parser)
 
         if config_parser.has_section(self.__CONFIG_REMOVABLES_SECTION):
-            ConnectionRemover().remove_connections(
+            self.unmatched_removable_connections = ConnectionRemover().remove_connections(
                 config_parser.get(self.__CONFIG_REMOVABLES_SECTION, self.__CONFIG_REMOVABLES_OPTION),
                 self.__found_connections_graph)
 
@@ -49,6 +70,11 @@ class Input:
                 config_parser.get(self.__CONFIG_ATTRIBUTES_SECTION, self.__CONFIG_ATTRIBUTES_OPTION),
                 self.__found_connections_graph)
 
+        if config_parser.has_section(self.__CONFIG_PROPAGATION_SECTION):
+            AttributePropagator().propagate_attributes(
+                config_parser.get(self.__CONFIG_PROPAGATION_SECTION, self.__CONFIG_PROPAGATION_OPTION),
+                self.__found_connections_graph)
+
     def get_connections_graph(self) -> Graph:
         """Getter method to return found connections graph from the input design.
 
@@ -58,6 +84,55 @@ class Input:
         """
         return self.__found_connections_graph
 
+    def get_matching_ports(self, port_regexps_list: List[Dict[str, Union[str, Pattern[str]]]],
+                           port_key_list: List[str]) -> FrozenSet[Port]:
+        """Method to find all of the ports of the connections graph which match the given regular expressions. The
+        results are kept for the whole scan so signatures asking for the same rows of regular expressions and port
+        keys reuse the ports found before. The kept results are dropped when the connections graph changes.
+
+        Args:
+            port_regexps_list: List holding the regular expressions for different values in the ports.
+            port_key_list: Key strings noting which type of ports of the connections should be matched.
+
+        Returns:
+            Frozen set of ports which match the given regular expressions.
+        """
+        port_catalogue = self.__found_connections_graph.get_port_catalogue()
+        if port_catalogue is not self.__matched_port_catalogue:
+            self.__matched_port_catalogue = port_catalogue
+            self.__port_matchers.clear()
+            self.__matching_ports.clear()
+        rules_key = PortMatcher.get_rules_key(port_regexps_list)
+        matching_ports_key = (rules_key, frozenset(port_key_list))
+        if matching_ports_key not in self.__matching_ports:
+            if rules_key not in self.__port_matchers:
+                self.__port_matchers[rules_key] = PortMatcher(port_regexps_list)
+            rule_regions = PortMatcher.get_rule_regions(port_regexps_list)
+            port_matcher = self.__port_matchers[rules_key]
+            if rule_regions is None:
+                self.__matching_ports[matching_ports_key] = frozenset(port_matcher.get_matching_catalogue_ports(
+                    port_catalogue, port_key_list))
+            else:
+                self.__matching_ports[matching_ports_key] = frozenset(port_matcher.get_matching_ports(
+                    self.__get_region_ports(rule_regions, port_key_list)))
+        return self.__matching_ports[matching_ports_key]
+
+    def __get_region_ports(self, regions: List[Region], port_key_list: List[str]) -> Set[Port]:
+        """Method to find the ports in the given regions with the spatial index so only the ports of the regions are
+        visited.
+
+        Args:
+            regions: Regions of the wanted ports.
+            port_key_list: Key strings noting which type of ports of the connections are wanted.
+
+        Returns:
+            Set of the wanted ports in the regions.
+        """
+        port_catalogue = self.__found_connections_graph.get_port_catalogue()
+        spatial_index = self.__found_connections_graph.get_spatial_index()
+        return {port for region in regions for port in spatial_index.get_ports(region)
+                if any(port_catalogue.has_port_role(port, port_key) for port_key in port_key_list)}
+
     def get_virus_signatures(self) -> Dict[str, float]:
         """Getter method to return given virus signature packages.
 
@@ -95,6 +170,15 @@ class Input:
         """
         return self.__virus_signature_option_inputs[SignatureOptions.DISALLOWED_PATH_END_OPTION]
 
+    def get_disallowed_path_report_limit(self) -> Union[int, None]:
+        """Getter method to return given limit for the amount of printed disallowed paths. PathDetector prints out
+        100 paths at most if no limit is given.
+
+        Returns:
+            Integer noting the largest amount of disallowed paths printed out or None if no limit is given.
+        """
+        return self.__virus_signature_option_inputs[SignatureOptions.DISALLOWED_PATH_REPORT_LIMIT_OPTION]
+
     def get_allowed_input_antenna_list(self) -> List[Dict[str, Union[str, Pattern[str]]]]:
         """Getter method to return given input port list to identify allowed antennas in the connections graph.
 
@@ -154,6 +238,14 @@ class Input:
         """
         return self.__virus_signature_option_inputs[SignatureOptions.IGNORED_LOOP_ATTRIBUTES_OPTION]
 
+    def get_ring_oscillator_cycle_limit(self) -> Union[int, None]:
+        """Getter method to return given limit for the amount of printed cycles of every loop.
+
+        Returns:
+            Integer noting the largest amount of cycles printed out for every loop.
+        """
+        return self.__virus_signature_option_inputs[SignatureOptions.RING_OSCILLATOR_CYCLE_LIMIT_OPTION]
+
     def get_fan_out_begin_port_list(self) -> List[Dict[str, Union[str, Pattern[str]]]]:
         """Getter method to return given input port list to identify ports from which the fan-out is found out.
 
@@ -178,6 +270,14 @@ class Input:
         """
         return self.__virus_signature_option_inputs[SignatureOptions.FAN_OUT_THRESHOLD_OPTION]
 
+    def get_fan_out_mode(self) -> Union[str, None]:
+        """Getter method to return given fan-out mode.
+
+        Returns:
+            String noting if the fan-out is counted as paths or as distinct end ports.
+        """
+        return self.__virus_signature_option_inputs[SignatureOptions.FAN_OUT_MODE_OPTION]
+
     def get_glitch_path_begin_port_list(self) -> List[Dict[str, Union[str, Pattern[str]]]]:
         """Getter method to return given input port list to identify ports from which the glitches start.
 
@@ -249,8 +349,20 @@ class Input:
             else:
                 self.__chosen_virus_signatures[item[0]] = float(item[1])
 
-    def __set_found_connections_from_json(self, connections_graph_file: str) -> None:
-        self.__found_connections_graph = GraphCreator().get_connections_from_json(connections_graph_file)
+    def __set_found_connections_from_json(self, connections_graph_file: str, is_streamed: bool, is_cached: bool,
+                                          json_backend: Optional[str]) -> None:
+        graph_cache = GraphCache(connections_graph_file)
+        is_cached = is_cached and os.path.isfile(connections_graph_file)
+        if is_cached and graph_cache.is_valid():
+            self.__found_connections_graph = graph_cache.load_graph()
+            self.json_backend = self.__GRAPH_CACHE_BACKEND
+        else:
+            graph_creator = GraphCreator(json_backend)
+            self.__found_connections_graph = graph_creator.get_connections_from_json(connections_graph_file,
+                                                                                     is_streamed)
+            self.json_backend = graph_creator.get_json_backend_name(is_streamed)
+            if is_cached:
+                graph_cache.save_graph(self.__found_connections_graph)
 
     @staticmethod
     def __get_parser(config: str) -> ConfigParser:
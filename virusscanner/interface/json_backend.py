@@ -0,0 +1,85 @@
+import importlib
+import json
+import os
+from types import ModuleType
+from typing import Any, List, Optional, TextIO, Union
+
+JSON_BACKEND_ENVIRONMENT_VARIABLE = "VIRUSSCANNER_JSON_BACKEND"
+AUTOMATIC_JSON_BACKEND = "auto"
+STDLIB_JSON_BACKEND = "json"
+# Faster backends first so the automatic choice picks the fastest installed one.
+OPTIONAL_JSON_BACKENDS = ["orjson", "ujson"]
+
+
+class JSONBackend:
+    """Class for decoding JSON documents with one of the available JSON libraries.
+
+    Args:
+        name: Name of the JSON library.
+        module: Module of the JSON library which has a loads function.
+
+    """
+
+    def __init__(self, name: str, module: ModuleType) -> None:
+        self.name = name
+        self.__module = module
+
+    def loads(self, json_document: Union[str, bytes]) -> Any:
+        """Method to decode the given JSON document.
+
+        Args:
+            json_document: String or bytes object of the JSON document.
+
+        Returns:
+            Decoded Python object of the document.
+        """
+        return self.__module.loads(json_document)
+
+    def load(self, file_handle: TextIO) -> Any:
+        """Method to decode the JSON document in the given file.
+
+        Args:
+            file_handle: Text file handle positioned at the beginning of the JSON document.
+
+        Returns:
+            Decoded Python object of the document.
+        """
+        return self.__module.loads(file_handle.read())
+
+
+def get_json_backend_names() -> List[str]:
+    """Function to return the names of the JSON backends which can be chosen.
+
+    Returns:
+        List of backend names including the automatic choice.
+    """
+    return [AUTOMATIC_JSON_BACKEND] + OPTIONAL_JSON_BACKENDS + [STDLIB_JSON_BACKEND]
+
+
+def get_json_backend(name: Optional[str] = None) -> JSONBackend:
+    """Function to return the JSON backend with the given name. If no name is given the name is read from the
+    VIRUSSCANNER_JSON_BACKEND environment variable and without it the fastest installed backend is used.
+
+    Args:
+        name: Name of the JSON backend or "auto".
+
+    Returns:
+        JSONBackend object for decoding JSON documents.
+    """
+    if not name:
+        name = os.environ.get(JSON_BACKEND_ENVIRONMENT_VARIABLE, AUTOMATIC_JSON_BACKEND)
+    if name == STDLIB_JSON_BACKEND:
+        return JSONBackend(STDLIB_JSON_BACKEND, json)
+    if name == AUTOMATIC_JSON_BACKEND:
+        for backend_name in OPTIONAL_JSON_BACKENDS:
+            try:
+                return JSONBackend(backend_name, importlib.import_module(backend_name))
+            except ImportError:
+                continue
+        return JSONBackend(STDLIB_JSON_BACKEND, json)
+    if name not in OPTIONAL_JSON_BACKENDS:
+        raise ValueError("Unknown JSON backend given: " + name)
+    try:
+        return JSONBackend(name, importlib.import_module(name))
+    except ImportError:
+        raise ValueError("JSON backend {} isn't installed!".format(name))
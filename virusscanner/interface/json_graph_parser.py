@@ -1,15 +1,39 @@
 import json
-from typing import Optional
+from typing import Optional, Dict, Any
 
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.dataclassesjson import DataClassesJSONEncoder
 from virusscanner.interface.datastructures.implementation_graph import Graph
-from virusscanner.interface.datastructures.port import Port
-from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.interface.compressed_file import open_text_file
+from virusscanner.interface.datastructures.port_table import PortTable
+from virusscanner.interface.json_backend import get_json_backend, STDLIB_JSON_BACKEND
+from virusscanner.interface.json_stream_reader import JSONStreamReader
 
 
 class GraphCreator:
-    """Class to contain util methods to handle the implementation graph being read from or written to the JSON file."""
+    """Class to contain util methods to handle the implementation graph being read from or written to the JSON file.
+
+    Args:
+        json_backend: Name of the JSON library used to decode the JSON files. By default the library is chosen by the
+            VIRUSSCANNER_JSON_BACKEND environment variable or the fastest installed library is used.
+
+    """
+    __CONNECTIONS_KEY = "CONNECTIONS"
+    __LUT_VALUES_KEY = "LUT_VALUES"
+
+    def __init__(self, json_backend: Optional[str] = None) -> None:
+        self.__json_backend = get_json_backend(json_backend)
+
+    def get_json_backend_name(self, is_streamed: bool = False) -> str:
+        """Method to return the name of the JSON library used to decode the JSON files.
+
+        Args:
+            is_streamed: Boolean to note if the file is parsed incrementally which always uses the json module.
+
+        Returns:
+            Name of the JSON library.
+        """
+        return STDLIB_JSON_BACKEND if is_streamed else self.__json_backend.name
 
     @staticmethod
     def output_graph(connections_graph: Graph, output_json_file: Optional[str]) -> None:
@@ -28,30 +52,49 @@ class GraphCreator:
             for connection in connections_graph.connections:
                 print(connection)
 
-    @staticmethod
-    def get_connections_from_json(input_json_file: str) -> Graph:
-        """Method to get the connections from the given JSON file.
+    def get_connections_from_json(self, input_json_file: str, is_streamed: bool = False) -> Graph:
+        """Method to get the connections from the given JSON file. Compressed JSON files are decompressed while they
+        are parsed.
 
         Args:
             input_json_file: File path to the JSON file which contains the desired connections.
+            is_streamed: Boolean to note if the file should be parsed incrementally one connection at a time instead
+                of loading the whole JSON document into memory first.
 
         Returns:
             Graph object containing the data from the JSON file.
 
         """
-        with open(input_json_file, "r") as json_file_handle:
-            json_data = json.load(json_file_handle)
-
-        found_connections_list = []
-        for connection in json_data["CONNECTIONS"]:
-            for field in connection:
-                if "tile" in connection[field]:
-                    connection[field]["tile"] = Tile(**connection[field]["tile"])
-                    connection[field] = Port(**connection[field])
-                else:
-                    connection[field] = set(connection[field])
-            found_connections_list.append(Connection(**connection))
-        if "LUT_VALUES" in json_data:
-            return Graph(connections=found_connections_list, lut_values=json_data["LUT_VALUES"])
-        else:
-            return Graph(connections=found_connections_list)
+        if is_streamed:
+            return self.__get_connections_from_json_stream(input_json_file)
+
+        with open_text_file(input_json_file) as json_file_handle:
+            json_data = self.__json_backend.load(json_file_handle)
+
+        found_connections_graph = Graph(lut_values=json_data.get(self.__LUT_VALUES_KEY, dict()))
+        port_table = found_connections_graph.get_port_table()
+        for connection in json_data[self.__CONNECTIONS_KEY]:
+            found_connections_graph.add_connection(self.__make_connection(connection, port_table))
+        return found_connections_graph
+
+    def __get_connections_from_json_stream(self, input_json_file: str) -> Graph:
+        found_connections_graph = Graph()
+        with open_text_file(input_json_file) as json_file_handle:
+            json_reader = JSONStreamReader(json_file_handle)
+            port_table = found_connections_graph.get_port_table()
+            for key in json_reader.iterate_object():
+                if key == self.__CONNECTIONS_KEY:
+                    for connection in json_reader.iterate_array():
+                        found_connections_graph.add_connection(self.__make_connection(connection, port_table))
+                elif key == self.__LUT_VALUES_KEY:
+                    for tile_name, tile_lut_values in json_reader.iterate_object_items():
+                        found_connections_graph.lut_values[tile_name] = tile_lut_values
+        return found_connections_graph
+
+    @staticmethod
+    def __make_connection(connection: Dict[str, Any], port_table: PortTable) -> Connection:
+        for field in connection:
+            if "tile" in connection[field]:
+                tile = connection[field]["tile"]
+                connection[field] = port_table.get_port(tile["name"], tile["x"], tile["y"], connection[field]["name"])
+        return Connection(**connection)
@@ -0,0 +1,149 @@
+import json
+from typing import Any, Iterator, TextIO, Tuple
+
+
+class JSONStreamReader:
+    """Class for reading a JSON document incrementally from a file handle without loading the whole document.
+
+    Only the values which are currently being consumed are decoded, so large arrays and objects can be iterated
+    element by element while the memory use stays proportional to the size of the largest single element.
+
+    Args:
+        file_handle: Text file handle positioned at the beginning of the JSON document.
+        chunk_size: Amount of characters read from the file handle at once.
+
+    """
+    DEFAULT_CHUNK_SIZE = 1 << 16
+    __WHITESPACE = " \t\n\r"
+    __NUMBER_CHARACTERS = frozenset(".eE+-0123456789")
+
+    def __init__(self, file_handle: TextIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.__file_handle = file_handle
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__position = 0
+        self.__consumed_offset = 0
+        self.__is_exhausted = False
+
+    def read_value(self) -> Any:
+        """Method to decode the next complete JSON value from the stream.
+
+        Returns:
+            Decoded Python object of the next value.
+        """
+        self.__skip_whitespace()
+        read_size = self.__chunk_size
+        while True:
+            try:
+                value, end_position = self.__decoder.raw_decode(self.__buffer, self.__position)
+                # A number at the end of the buffer might continue in the next chunk, also when only the
+                # beginning of its fraction or exponent was read.
+                if self.__is_exhausted or not self.__is_number_cut(value, end_position):
+                    self.__position = end_position
+                    return value
+            except json.JSONDecodeError:
+                if self.__is_exhausted:
+                    raise
+            # Read ahead geometrically so that decoding a large value stays linear in its size.
+            self.__fill_buffer(read_size)
+            read_size = max(read_size, len(self.__buffer) - self.__position)
+
+    def iterate_array(self) -> Iterator[Any]:
+        """Method to iterate over the elements of the JSON array at the current position in the stream.
+
+        Returns:
+            Iterator yielding the decoded elements of the array one at a time.
+        """
+        self.__expect_character("[")
+        if self.__peek_character() == "]":
+            self.__position += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.__is_last_member("]"):
+                return
+
+    def iterate_object(self) -> Iterator[str]:
+        """Method to iterate over the keys of the JSON object at the current position in the stream. After each key
+        the caller should consume the corresponding value with read_value, iterate_array or iterate_object. Values
+        which are not consumed by the caller are skipped.
+
+        Returns:
+            Iterator yielding the keys of the object one at a time.
+        """
+        self.__expect_character("{")
+        if self.__peek_character() == "}":
+            self.__position += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise ValueError("Incorrect JSON object key found: " + str(key))
+            self.__expect_character(":")
+            value_offset = self.__get_offset()
+            yield key
+            if self.__get_offset() == value_offset:
+                self.read_value()
+            if self.__is_last_member("}"):
+                return
+
+    def iterate_object_items(self) -> Iterator[Tuple[str, Any]]:
+        """Method to iterate over the key and value pairs of the JSON object at the current position in the stream.
+
+        Returns:
+            Iterator yielding tuples of keys and their decoded values one at a time.
+        """
+        for key in self.iterate_object():
+            yield key, self.read_value()
+
+    def __is_number_cut(self, value: Any, end_position: int) -> bool:
+        if end_position == len(self.__buffer):
+            return True
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and \
+            self.__NUMBER_CHARACTERS.issuperset(self.__buffer[end_position:])
+
+    def __is_last_member(self, closing_character: str) -> bool:
+        next_character = self.__peek_character()
+        self.__position += 1
+        if next_character == ",":
+            return False
+        elif next_character == closing_character:
+            return True
+        else:
+            raise ValueError("Incorrect JSON found at character {}: expected ',' or '{}'".format(
+                self.__get_offset() - 1, closing_character))
+
+    def __expect_character(self, expected_character: str) -> None:
+        if self.__peek_character() != expected_character:
+            raise ValueError("Incorrect JSON found at character {}: expected '{}'".format(
+                self.__get_offset(), expected_character))
+        self.__position += 1
+
+    def __peek_character(self) -> str:
+        self.__skip_whitespace()
+        if self.__position < len(self.__buffer):
+            return self.__buffer[self.__position]
+        return ""
+
+    def __skip_whitespace(self) -> None:
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position] in self.__WHITESPACE:
+                self.__position += 1
+            if self.__position < len(self.__buffer) or self.__is_exhausted:
+                return
+            self.__fill_buffer(self.__chunk_size)
+
+    def __fill_buffer(self, read_size: int) -> None:
+        if self.__position >= self.__chunk_size:
+            self.__consumed_offset += self.__position
+            self.__buffer = self.__buffer[self.__position:]
+            self.__position = 0
+        new_data = self.__file_handle.read(read_size)
+        if new_data:
+            self.__buffer += new_data
+        else:
+            self.__is_exhausted = True
+
+    def __get_offset(self) -> int:
+        return self.__consumed_offset + self.__position
@@ -0,0 +1,60 @@
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class LiteralPattern:
+    """Dataclass for a value given in a CSV file which has no regular expression metacharacters. The value matches
+    the same strings as the compiled regular expression would, so it can be used like one with the match method, but
+    it can also be looked up from hash tables by the prefixes of the matched strings.
+
+    Args:
+        pattern: The literal string as it was given.
+
+    """
+    __slots__ = ("pattern",)
+    flags = re.UNICODE
+
+    pattern: str
+
+    def __reduce__(self):
+        return LiteralPattern, (self.pattern,)
+
+    @staticmethod
+    def is_literal(pattern_string: str) -> bool:
+        """Method to check if the given regular expression only matches its own characters.
+
+        Args:
+            pattern_string: String form of a regular expression.
+
+        Returns:
+            Boolean which says if the string has no regular expression metacharacters.
+        """
+        return re.escape(pattern_string) == pattern_string
+
+    @classmethod
+    def from_string(cls, pattern_string: str) -> Optional["LiteralPattern"]:
+        """Method to make a literal pattern of the given string.
+
+        Args:
+            pattern_string: String given in a CSV file.
+
+        Returns:
+            LiteralPattern of the string or None if the string has regular expression metacharacters.
+        """
+        if cls.is_literal(pattern_string):
+            return cls(pattern_string)
+        return None
+
+    def match(self, value: str) -> bool:
+        """Method to check if the given string begins with the literal. The method has the same use as the match
+        method of compiled regular expressions.
+
+        Args:
+            value: String to be checked.
+
+        Returns:
+            Boolean which says if the string begins with the literal.
+        """
+        return value.startswith(self.pattern)
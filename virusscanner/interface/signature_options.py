@@ -25,9 +25,11 @@ class SignatureOptions:
     FAN_OUT_BEGIN_OPTION = "fan_out_begin"
     FAN_OUT_END_OPTION = "fan_out_end"
     FAN_OUT_THRESHOLD_OPTION = "fan_out_threshold"
+    FAN_OUT_MODE_OPTION = "fan_out_mode"
     DISALLOWED_PORT_OPTION = "disallowed_port"
     DISALLOWED_PATH_BEGIN_OPTION = "disallowed_begin_port"
     DISALLOWED_PATH_END_OPTION = "disallowed_end_port"
+    DISALLOWED_PATH_REPORT_LIMIT_OPTION = "disallowed_path_report_limit"
     ALLOWED_INPUT_ANTENNA_OPTION = "allowed_input_antenna"
     ALLOWED_OUTPUT_ANTENNA_OPTION = "allowed_output_antenna"
     SHORT_LOCATIONS_OPTION = "short_locations"
@@ -35,11 +37,13 @@ class SignatureOptions:
     SPECIFIED_PATH_END_OPTION = "specified_path_end"
     SPECIFIED_PATH_ROUTING_OPTION = "specified_path_routing"
     IGNORED_LOOP_ATTRIBUTES_OPTION = "ignored_loop_attributes"
+    RING_OSCILLATOR_CYCLE_LIMIT_OPTION = "ring_oscillator_cycle_limit"
     DISALLOWED_ATTRIBUTES_OPTION = "disallowed_attributes"
 
     _CSV_TYPE = "csv"
     _TXT_TYPE = "txt"
     _INT_TYPE = "int"
+    _STR_TYPE = "str"
 
     _signature_options_dict = \
         {
@@ -49,7 +53,9 @@ class SignatureOptions:
                 SignatureOption(DISALLOWED_PATH_BEGIN_OPTION, "path_detection", "disallowed_begin_nodes_file",
                                 _CSV_TYPE),
                 SignatureOption(DISALLOWED_PATH_END_OPTION, "path_detection", "disallowed_destination_nodes_file",
-                                _CSV_TYPE)],
+                                _CSV_TYPE),
+                SignatureOption(DISALLOWED_PATH_REPORT_LIMIT_OPTION, "path_detection", "max_reported_paths",
+                                _INT_TYPE, True)],
             'virusscanner.parsing.signatures.antenna_detection.AntennaDetector': [
                 SignatureOption(ALLOWED_INPUT_ANTENNA_OPTION, "antenna_detection", "allowed_input_antennas_file",
                                 _CSV_TYPE),
@@ -67,7 +73,9 @@ class SignatureOptions:
                                 "specified_routing_nodes_file", _CSV_TYPE)],
             'virusscanner.parsing.signatures.ring_oscillator_detection.CombinatorialLoopDetector': [
                 SignatureOption(IGNORED_LOOP_ATTRIBUTES_OPTION, "ring_oscillator_detection",
-                                "ignored_attributes_file", _TXT_TYPE)],
+                                "ignored_attributes_file", _TXT_TYPE),
+                SignatureOption(RING_OSCILLATOR_CYCLE_LIMIT_OPTION, "ring_oscillator_detection",
+                                "max_reported_cycles", _INT_TYPE, True)],
             'virusscanner.parsing.signatures.attribute_detection.AttributeDetector': [
                 SignatureOption(DISALLOWED_ATTRIBUTES_OPTION, "attribute_detection", "disallowed_attributes_file",
                                 _TXT_TYPE)],
@@ -84,7 +92,8 @@ class SignatureOptions:
                 SignatureOption(FAN_OUT_END_OPTION, "fan_out_detection", "fan_out_end_nodes_file",
                                 _CSV_TYPE),
                 SignatureOption(FAN_OUT_THRESHOLD_OPTION, "fan_out_detection", "fan_out_threshold",
-                                _INT_TYPE, True)],
+                                _INT_TYPE, True),
+                SignatureOption(FAN_OUT_MODE_OPTION, "fan_out_detection", "fan_out_mode", _STR_TYPE, True)],
             'virusscanner.parsing.signatures.glitch_power_estimation.GlitchPowerEstimator': [
                 SignatureOption(GLITCH_POWER_BEGIN_OPTION, "glitch_power_detection", "glitch_begin_nodes_file",
                                 _TXT_TYPE),
@@ -103,7 +112,8 @@ class SignatureOptions:
         self._type_handlers = {
             self._CSV_TYPE: csv_parser.get_regexps_list_from_file,
             self._TXT_TYPE: self.__get_list_of_entries_from_file,
-            self._INT_TYPE: lambda int_entry: int(int_entry)
+            self._INT_TYPE: lambda int_entry: int(int_entry),
+            self._STR_TYPE: lambda str_entry: str_entry.strip()
         }
 
     def set_virus_signature_option_inputs(self, virus_signature_set: Set[str],
@@ -2,6 +2,7 @@ import contextlib
 import datetime
 import importlib
 import io
+from typing import Dict, List, Tuple
 
 import click
 
@@ -19,7 +20,10 @@ class SignatureDetector:
             input_interface: Input object containing data for the virus scans.
 
         """
-        self.__write_output_header(input_interface.output_file, input_interface.input_file)
+        self.__write_output_header(
+            input_interface.output_file, input_interface.input_file, input_interface.json_backend,
+            input_interface.get_connections_graph().get_port_catalogue().get_tile_type_counts(),
+            input_interface.unmatched_removable_connections)
 
         print("Starting virus signature scans...", end="")
         score_sum = 0.0
@@ -47,10 +51,18 @@ class SignatureDetector:
             print("\nFinal score: " + str(score_sum) + "\n")
 
     @staticmethod
-    def __write_output_header(output_file: str, input_file: str) -> None:
+    def __write_output_header(output_file: str, input_file: str, json_backend: str,
+                              tile_type_counts: Dict[str, Tuple[int, int, int]],
+                              unmatched_removable_connections: List[str]) -> None:
         with open(output_file, "a+") as output_file_handle:
             output_file_handle.write(
-                "Output for {} generated at {}\n\n".format(input_file, str(datetime.datetime.now())))
+                "Output for {} generated at {}\nConnections graph decoded with: {}\n{}{}\n".format(
+                    input_file, str(datetime.datetime.now()), json_backend, "".join(
+                        "Tile type {}: {} ports, {} outgoing and {} incoming connections\n".format(
+                            tile_type, port_count, outgoing_count, incoming_count)
+                        for tile_type, (port_count, outgoing_count, incoming_count) in tile_type_counts.items()),
+                    "".join("Removable connection not found in the connections graph: {}\n".format(line)
+                            for line in unmatched_removable_connections)))
 
     @staticmethod
     def __get_current_signature_name(virus_signature: str) -> str:
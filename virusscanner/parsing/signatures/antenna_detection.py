@@ -22,9 +22,8 @@ class AntennaDetector(VirusSignature):
                                                                        self.__found_connections.get_adjacency_list(
                                                                            True),
                                                                        "begin")
-        allowed_input_antenna_ports_list = graph_processor.find_matching_ports(
-            self.__input_parameters.get_allowed_input_antenna_list(),
-            self.__found_connections.connections, ["begin"])
+        allowed_input_antenna_ports_list = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_allowed_input_antenna_list(), ["begin"])
         graph_processor.print_ports("Found the following dangling input ports:",
                                     dangling_input_port_list - allowed_input_antenna_ports_list)
         score = len(dangling_input_port_list - allowed_input_antenna_ports_list)
@@ -32,9 +31,8 @@ class AntennaDetector(VirusSignature):
                                                                         self.__found_connections.get_adjacency_list(
                                                                             False),
                                                                         "end")
-        allowed_output_antenna_ports_list = graph_processor.find_matching_ports(
-            self.__input_parameters.get_allowed_output_antenna_list(),
-            self.__found_connections.connections, ["end"])
+        allowed_output_antenna_ports_list = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_allowed_output_antenna_list(), ["end"])
         graph_processor.print_ports("Found the following dangling output ports:",
                                     dangling_output_port_list - allowed_output_antenna_ports_list)
         return score + len(dangling_output_port_list - allowed_output_antenna_ports_list)
@@ -16,11 +16,9 @@ class AttributeDetector(VirusSignature):
         self.__list_of_disallowed_attributes = input_parameters.get_disallowed_attributes_list()
 
     def detect_virus(self) -> float:
-        fault_count_dict = dict.fromkeys(self.__list_of_disallowed_attributes, 0)
-        for connection in self.__input_parameters.get_connections_graph().connections:
-            for attribute in self.__list_of_disallowed_attributes:
-                if attribute in connection.attributes:
-                    fault_count_dict[attribute] += 1
+        attribute_index = self.__input_parameters.get_connections_graph().get_attribute_index()
+        fault_count_dict = {attribute: attribute_index.count_connections(attribute)
+                            for attribute in self.__list_of_disallowed_attributes}
 
         score = 0
         for attribute in fault_count_dict:
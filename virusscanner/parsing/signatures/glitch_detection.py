@@ -1,15 +1,18 @@
-from typing import Dict, List
+from typing import Callable, Dict
 
 from virusscanner.interface.datastructures.port import Port
 from virusscanner.interface.input_interface import Input
 from virusscanner.parsing.util.glitch_score_calculator import GlitchScoreCalculator
 
 from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.weighted_path_finder import WeightedPathFinder
 from virusscanner.parsing.signatures.abstract_signature import VirusSignature
 
 
 class GlitchyPathsDetector(VirusSignature):
-    """Initial class for detecting high glitch factors.
+    """Initial class for detecting high glitch factors. The score of a path is the sum of the glitch scores of the LUTs
+    it goes through. Without a threshold the highest scoring path is reported, otherwise the paths scoring over the
+    threshold are counted and the highest scoring one ending in every end port is reported.
 
     Args:
         input_parameters: Input object containing data for this virus scanner.
@@ -23,43 +26,41 @@ class GlitchyPathsDetector(VirusSignature):
     def detect_virus(self) -> float:
         graph_processor = GraphProcessor()
 
-        begin_ports = graph_processor.find_matching_ports(self.__input_parameters.get_glitch_path_begin_port_list(),
-                                                          self.__found_connections.connections, ["begin"])
+        begin_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_glitch_path_begin_port_list(), ["begin"])
 
-        end_ports = graph_processor.find_matching_ports(self.__input_parameters.get_glitch_path_end_port_list(),
-                                                        self.__found_connections.connections, ["end"])
+        end_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_glitch_path_end_port_list(), ["end"])
 
         adjacency_list = self.__found_connections.get_adjacency_list()
 
         if begin_ports and end_ports:
-            found_paths = graph_processor.find_all_paths(adjacency_list, begin_ports, end_ports)
-            if found_paths:
-                glitch_score_threshold = self.__input_parameters.get_glitch_score_threshold()
-                if glitch_score_threshold:
-                    return self.output_path_scores_over_threshold(found_paths, graph_processor,
-                                                                  self.__get_path_scores(found_paths, graph_processor),
-                                                                  glitch_score_threshold)
-                else:
-                    return self.output_max_scoring_path(found_paths, graph_processor,
-                                                        self.__get_path_scores(found_paths, graph_processor))
+            path_finder = WeightedPathFinder(adjacency_list, begin_ports, end_ports, self.__get_connection_scorer())
+            glitch_score_threshold = self.__input_parameters.get_glitch_score_threshold()
+            if glitch_score_threshold:
+                return self.output_path_scores_over_threshold(path_finder, graph_processor, glitch_score_threshold)
+            else:
+                return self.output_max_scoring_path(path_finder, graph_processor)
         return 0
 
-    def __get_path_scores(self, found_paths: List[List[Port]], graph_processor: GraphProcessor) -> Dict[int, int]:
+    def __get_connection_scorer(self) -> Callable[[Port, Port], int]:
+        """Method to make a function which gives the glitch score of the LUT a connection goes through as the weight of
+        the connection. Connections which don't go through a LUT have no weight.
+
+        Returns:
+            Function returning the glitch score of the connection between the given ports.
+        """
         found_glitch_scores = dict()
-        path_scores = dict.fromkeys(range(len(found_paths)), 0)
-        for path_index in range(len(found_paths)):
-            self.__score_path(found_glitch_scores, GlitchScoreCalculator(), found_paths[path_index], path_index,
-                              path_scores, graph_processor)
-        return path_scores
-
-    def __score_path(self, found_glitch_scores: Dict[str, int], glitch_scorer: GlitchScoreCalculator, path: List[Port],
-                     path_index: int, path_scores: Dict[int, int], graph_processor: GraphProcessor) -> None:
-        for port_index in range(len(path) - 1):
-            if graph_processor.is_connection_in_lut_tile(path[port_index].tile, path[port_index + 1].tile,
-                                                         self.__found_connections.lut_values):
-                lut_value = graph_processor.get_lut_value(path[port_index + 1], self.__found_connections.lut_values)
-                if lut_value:
-                    path_scores[path_index] += self.get_glitch_score(found_glitch_scores, glitch_scorer, lut_value)
+        glitch_scorer = GlitchScoreCalculator()
+        lut_index = self.__found_connections.get_lut_index()
+
+        def get_connection_score(begin_port: Port, end_port: Port) -> int:
+            lut_function = lut_index.get_lut_function(begin_port, end_port)
+            if lut_function is None:
+                return 0
+            return self.get_glitch_score(found_glitch_scores, glitch_scorer, lut_function.truth_table)
+
+        return get_connection_score
 
     @staticmethod
     def get_glitch_score(found_glitch_scores: Dict[str, int], glitch_scorer: GlitchScoreCalculator,
@@ -69,23 +70,32 @@ class GlitchyPathsDetector(VirusSignature):
         return found_glitch_scores[lut_config]
 
     @staticmethod
-    def output_path_scores_over_threshold(found_paths: List[List[Port]], graph_processor: GraphProcessor,
-                                          path_scores: Dict[int, int], score_threshold: int) -> int:
+    def output_path_scores_over_threshold(path_finder: WeightedPathFinder, graph_processor: GraphProcessor,
+                                          score_threshold: int) -> int:
         signature_score = 0
-        for path_id in path_scores:
-            if path_scores[path_id] > score_threshold:
+        path_counts = path_finder.count_paths_over_threshold(score_threshold)
+        if not path_finder.is_search_exact():
+            print("  The glitchy paths weren't all counted, the score is a lower bound")
+        if path_counts:
+            best_paths = path_finder.find_best_paths()
+            for end_port, path_count in path_counts.items():
+                print(path_count, "paths with a score over", score_threshold, "end in", end_port)
                 graph_processor.print_ports(
-                    "Score of " + str(path_scores[path_id]) + " found for the following path: ",
-                    found_paths[path_id])
-                signature_score += 1
+                    "Score of " + str(best_paths[end_port][0]) + " found for the following path: ",
+                    best_paths[end_port][1])
+                signature_score += path_count
         return signature_score
 
     @staticmethod
-    def output_max_scoring_path(found_paths: List[List[Port]], graph_processor: GraphProcessor,
-                                path_scores: Dict[int, int]) -> int:
-        max_glitch_path_id = max(path_scores.keys(), key=(lambda k: path_scores[k]))
-        if path_scores[max_glitch_path_id]:
-            graph_processor.print_ports(
-                "Score of " + str(path_scores[max_glitch_path_id]) + " for the following path: ",
-                found_paths[max_glitch_path_id])
-        return path_scores[max_glitch_path_id]
+    def output_max_scoring_path(path_finder: WeightedPathFinder, graph_processor: GraphProcessor) -> int:
+        best_paths = path_finder.find_best_paths()
+        if not path_finder.is_search_exact():
+            print("  The glitchy paths weren't all walked, the score is a lower bound")
+        if not best_paths:
+            return 0
+        max_glitch_end_port = max(best_paths.keys(), key=(lambda k: best_paths[k][0]))
+        max_glitch_score, max_glitch_path = best_paths[max_glitch_end_port]
+        if max_glitch_score:
+            graph_processor.print_ports("Score of " + str(max_glitch_score) + " for the following path: ",
+                                        max_glitch_path)
+        return max_glitch_score
@@ -1,13 +1,11 @@
-import resource
-import sys
-from typing import Dict, List, Set, Tuple
+from typing import Dict, List, Set
 
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.port import Port
 from virusscanner.interface.input_interface import Input
+from virusscanner.parsing.util.connection_rule_engine import ConnectionRuleEngine
 from virusscanner.parsing.util.glitch_score_calculator import GlitchScoreCalculator
-
-from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.path_traversal import PathTraversal
 from virusscanner.parsing.signatures.abstract_signature import VirusSignature
 
 
@@ -27,92 +25,74 @@ class GlitchPowerEstimator(VirusSignature):
         self.__input_parameters = input_parameters
         self.__found_connections = input_parameters.get_connections_graph()
 
-    # TODO: Remove recursion limit raise and make the search iterative.
     def detect_virus(self) -> float:
-        sys.setrecursionlimit(10 ** 6)
-        resource.setrlimit(resource.RLIMIT_STACK, (resource.RLIM_INFINITY, resource.RLIM_INFINITY))
-        graph_processor = GraphProcessor()
+        attribute_index = self.__found_connections.get_attribute_index()
         begin_ports = self.__get_end_ports_with_attributes(
-            self.__input_parameters.get_glitch_power_begin_attribute_list(),
-            self.__found_connections.connections)
+            attribute_index.get_connections(self.__input_parameters.get_glitch_power_begin_attribute_list()))
 
         end_ports = self.__get_end_ports_with_attributes(
-            self.__input_parameters.get_glitch_power_end_attribute_list(),
-            self.__found_connections.connections)
+            attribute_index.get_connections(self.__input_parameters.get_glitch_power_end_attribute_list()))
 
-        adjacency_list = self.__found_connections.get_adjacency_list()
+        path_traversal = PathTraversal(self.__found_connections.get_adjacency_list())
         if begin_ports:
             return self.output_max_scoring_connection(
-                self.__get_connection_scores(begin_ports, end_ports, adjacency_list, graph_processor))
+                self.__get_connection_scores(begin_ports, end_ports, path_traversal))
         return 0
 
     @staticmethod
-    def __get_end_ports_with_attributes(attribute_list: List[str], connection_list: List[Connection]) -> Set[
-            Port]:
-        matching_ports = set()
-        for connection in connection_list:
-            for attribute in attribute_list:
-                if attribute in connection.attributes:
-                    matching_ports.add(connection.end)
-        return matching_ports
+    def __get_end_ports_with_attributes(attribute_connections: List[Connection]) -> Set[Port]:
+        return {connection.end for connection in attribute_connections}
 
     def __get_connection_scores(self, begin_ports: Set[Port], end_ports: Set[Port],
-                                adjacency_list: Dict[Port, Tuple[Port, ...]],
-                                graph_processor: GraphProcessor) -> Dict[Connection, float]:
+                                path_traversal: PathTraversal) -> Dict[Connection, float]:
         found_glitch_scores = dict()
         connection_scores = dict()
-        chance_of_switch = 1.0
         for start_port in begin_ports:
-            self.__score_paths_from_start_port(start_port, adjacency_list, end_ports, graph_processor,
-                                               GlitchScoreCalculator(), connection_scores, found_glitch_scores,
-                                               chance_of_switch, [start_port])
+            self.__score_paths_from_start_port(start_port, path_traversal, end_ports, GlitchScoreCalculator(),
+                                               connection_scores, found_glitch_scores)
         return connection_scores
 
-    def __score_paths_from_start_port(self, start_port: Port, adjacency_list_dict: Dict[Port, Tuple[Port, ...]],
-                                      end_ports_set: Set[Port], graph_processor: GraphProcessor,
+    def __score_paths_from_start_port(self, start_port: Port, path_traversal: PathTraversal, end_ports_set: Set[Port],
                                       glitch_scorer: GlitchScoreCalculator,
                                       connection_scores_dict: Dict[Connection, float],
-                                      found_glitch_scores_dict: Dict[str, float], input_chance_of_switch: float,
-                                      current_path_stack: List[Port]) -> None:
-
-        for connecting_port in adjacency_list_dict.get(start_port, []):
-            self.__update_connection_switch_count(connecting_port, connection_scores_dict, input_chance_of_switch,
-                                                  start_port)
-
-            self.__expand_on_connecting_port(start_port, connecting_port, adjacency_list_dict, end_ports_set,
-                                             graph_processor, glitch_scorer, connection_scores_dict,
-                                             found_glitch_scores_dict, input_chance_of_switch, current_path_stack)
-
-    def __expand_on_connecting_port(self, start_port: Port, connecting_port: Port,
-                                    adjacency_list_dict: Dict[Port, Tuple[Port, ...]], end_ports_set: Set[Port],
-                                    graph_processor: GraphProcessor, glitch_scorer: GlitchScoreCalculator,
-                                    connection_scores_dict: Dict[Connection, float],
-                                    found_glitch_scores_dict: Dict[str, float], input_chance_of_switch: float,
-                                    current_path_stack: List[Port]) -> None:
-        if connecting_port not in current_path_stack:
-            current_path_stack.append(connecting_port)
+                                      found_glitch_scores_dict: Dict[str, float]) -> None:
+        """Method to add the switch chances of every path from the given port to the connections of the paths. The
+        switch chance of the port the walk continues from is kept on a stack next to the current path.
+
+        Args:
+            start_port: Port where the paths begin.
+            path_traversal: PathTraversal of the implemented graph.
+            end_ports_set: Set of ports where the paths end.
+            glitch_scorer: GlitchScoreCalculator used for the LUTs on the paths.
+            connection_scores_dict: Dictionary of the switch chance sums of the connections which is updated.
+            found_glitch_scores_dict: Dictionary of the already calculated glitch scores of LUT values.
+        """
+        switch_chances = [1.0]
+
+        def examine_connection(port: Port, connecting_port: Port, _: List[Port]) -> None:
+            self.__update_connection_switch_count(connecting_port, connection_scores_dict, switch_chances[-1], port)
+
+        def enter_port(port: Port, connecting_port: Port, _: List[Port]) -> bool:
             if connecting_port not in end_ports_set and connection_scores_dict.get(
-                    Connection(start_port, connecting_port), 1.0) < self.MAX_SIGNAL_ACTIVITY:
-                self.__score_paths_from_start_port(connecting_port, adjacency_list_dict, end_ports_set,
-                                                   graph_processor, glitch_scorer, connection_scores_dict,
-                                                   found_glitch_scores_dict,
-                                                   self.__get_current_switch_chance(start_port, connecting_port,
-                                                                                    graph_processor, glitch_scorer,
-                                                                                    found_glitch_scores_dict,
-                                                                                    input_chance_of_switch),
-                                                   current_path_stack)
-            current_path_stack.pop()
-
-    def __get_current_switch_chance(self, start_port: Port, connecting_port: Port, graph_processor: GraphProcessor,
+                    Connection(port, connecting_port), 1.0) < self.MAX_SIGNAL_ACTIVITY:
+                switch_chances.append(self.__get_current_switch_chance(port, connecting_port, glitch_scorer,
+                                                                       found_glitch_scores_dict, switch_chances[-1]))
+                return True
+            return False
+
+        def leave_port(*_) -> None:
+            switch_chances.pop()
+
+        path_traversal.walk(start_port, enter_port, [start_port], examine_connection, leave_port)
+
+    def __get_current_switch_chance(self, start_port: Port, connecting_port: Port,
                                     glitch_scorer: GlitchScoreCalculator, found_glitch_scores_dict: Dict[str, float],
                                     input_chance_of_switch: float):
         current_chance_of_switch = input_chance_of_switch
-        if graph_processor.is_connection_in_lut_tile(start_port.tile, connecting_port.tile,
-                                                     self.__found_connections.lut_values):
-            lut_value = graph_processor.get_lut_value(connecting_port, self.__found_connections.lut_values)
-            if lut_value:
-                current_chance_of_switch *= self.get_glitch_score(found_glitch_scores_dict, glitch_scorer,
-                                                                  lut_value)
+        lut_function = self.__found_connections.get_lut_index().get_lut_function(start_port, connecting_port)
+        if lut_function is not None:
+            current_chance_of_switch *= self.get_glitch_score(found_glitch_scores_dict, glitch_scorer,
+                                                              lut_function.truth_table)
         return current_chance_of_switch
 
     @staticmethod
@@ -134,25 +114,15 @@ class GlitchPowerEstimator(VirusSignature):
     def output_max_scoring_connection(self, connection_scores: Dict[Connection, float]) -> float:
         glitch_score_sum = 0
 
-        if self.__input_parameters.get_connection_value_switch_power_cost_list():
+        power_cost_list = self.__input_parameters.get_connection_value_switch_power_cost_list()
+        if power_cost_list:
+            power_cost_indexes = ConnectionRuleEngine(power_cost_list).get_unique_rule_assignments(
+                self.__found_connections.connections, "{} has multiple power costs given!")
             for connection in self.__found_connections.connections:
-                power_cost_found = False
-                for power_cost_line in self.__input_parameters.get_connection_value_switch_power_cost_list():
-                    if power_cost_line["begin_tile_type"].match(connection.begin.tile.name) and \
-                            power_cost_line["begin_tile_x"].match(str(connection.begin.tile.x)) and \
-                            power_cost_line["begin_tile_y"].match(str(connection.begin.tile.y)) and \
-                            power_cost_line["begin_port"].match(connection.begin.name) and \
-                            power_cost_line["end_tile_type"].match(connection.end.tile.name) and \
-                            power_cost_line["end_tile_x"].match(str(connection.end.tile.x)) and \
-                            power_cost_line["end_tile_y"].match(str(connection.end.tile.y)) and \
-                            power_cost_line["end_port"].match(connection.end.name):
-                        if power_cost_found:
-                            raise ValueError(str(connection) + " has multiple power costs given!")
-                        else:
-                            glitch_score_sum += connection_scores.get(connection, 1.0) * float(
-                                power_cost_line["power_cost"])
-                            power_cost_found = True
-                if not power_cost_found:
+                if connection in power_cost_indexes:
+                    glitch_score_sum += connection_scores.get(connection, 1.0) * float(
+                        power_cost_list[power_cost_indexes[connection]]["power_cost"])
+                else:
                     glitch_score_sum += connection_scores.get(connection, 1.0) * self.DEFAULT_POWER_COST
         else:
             for connection in self.__found_connections.connections:
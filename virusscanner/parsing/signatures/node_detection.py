@@ -17,9 +17,8 @@ class PortDetector(VirusSignature):
 
     def detect_virus(self) -> float:
         graph_processor = GraphProcessor()
-        disallowed_ports = graph_processor.find_matching_ports(
-            self.__input_parameters.get_disallowed_port_list(),
-            self.__input_parameters.get_connections_graph().connections, ["begin", "end"])
+        disallowed_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_disallowed_port_list(), ["begin", "end"])
 
         graph_processor.print_ports("Found the following disallowed ports:", disallowed_ports)
         return len(disallowed_ports)
@@ -1,35 +1,45 @@
 from virusscanner.interface.input_interface import Input
 from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.path_counter import PathCounter
 from virusscanner.parsing.signatures.abstract_signature import VirusSignature
 
 
 class PathDetector(VirusSignature):
-    """Initial class for detecting given path usages in the given graph.
+    """Initial class for detecting given path usages in the given graph. Every path is scored but only the first paths
+    up to the report limit are listed.
 
     Args:
         input_parameters: Input object containing data for this virus scanner.
 
     """
+    DEFAULT_PATH_REPORT_LIMIT = 100
 
     def __init__(self, input_parameters: Input) -> None:
         self.__input_parameters = input_parameters
         self.__found_connections = input_parameters.get_connections_graph()
+        report_limit = self.__input_parameters.get_disallowed_path_report_limit()
+        self.__report_limit = self.DEFAULT_PATH_REPORT_LIMIT if report_limit is None else report_limit
+        if self.__report_limit < 0:
+            raise ValueError("Amount of reported paths can't be negative!")
 
     def detect_virus(self) -> float:
         graph_processor = GraphProcessor()
 
-        begin_ports = graph_processor.find_matching_ports(self.__input_parameters.get_disallowed_begin_port_list(),
-                                                          self.__found_connections.connections, ["begin"])
+        begin_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_disallowed_begin_port_list(), ["begin"])
 
-        end_ports = graph_processor.find_matching_ports(self.__input_parameters.get_disallowed_end_port_list(),
-                                                        self.__found_connections.connections, ["end"])
-
-        adjacency_list = self.__found_connections.get_adjacency_list()
+        end_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_disallowed_end_port_list(), ["end"])
 
         score = 0
         if begin_ports and end_ports:
-            found_paths = graph_processor.find_all_paths(adjacency_list, begin_ports, end_ports)
+            path_counter = PathCounter(self.__found_connections.get_compact_graph(), begin_ports, end_ports)
+            score += sum(path_counter.get_path_counts().values())
+            found_paths = path_counter.find_paths(self.__report_limit)
             graph_processor.print_paths("Found the following disallowed paths:", found_paths)
-            score += len(found_paths)
+            if len(found_paths) < score:
+                print("  ... and", score - len(found_paths), "more disallowed paths")
+            if not path_counter.are_path_counts_exact():
+                print("  The disallowed paths weren't all counted, the score is a lower bound")
 
         return score
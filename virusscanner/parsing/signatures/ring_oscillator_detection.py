@@ -1,51 +1,73 @@
+from collections import Counter
 from typing import List, Dict, Tuple
 
-import networkx
-
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.port import Port
 from virusscanner.interface.input_interface import Input
 from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.loop_finder import LoopFinder
 from virusscanner.parsing.signatures.abstract_signature import VirusSignature
 
 
 class CombinatorialLoopDetector(VirusSignature):
-    """Initial class for detecting cycles in the given graph.
+    """Initial class for detecting cycles in the given graph. Every loop scores its amount of independent cycles and
+    the shortest cycles of every loop are printed out.
 
     Args:
         input_parameters: Input object containing data for this virus scanner.
 
     """
+    DEFAULT_CYCLE_LIMIT = 1
 
     def __init__(self, input_parameters: Input) -> None:
         self.__input_parameters = input_parameters
+        cycle_limit = self.__input_parameters.get_ring_oscillator_cycle_limit()
+        self.__cycle_limit = self.DEFAULT_CYCLE_LIMIT if cycle_limit is None else cycle_limit
+        if self.__cycle_limit < 0:
+            raise ValueError("Amount of reported cycles can't be negative!")
 
     def detect_virus(self) -> float:
         adjacency_list = dict(self.__input_parameters.get_connections_graph().get_adjacency_list())
-        self.__remove_synchronous_connections(adjacency_list,
-                                              self.__input_parameters.get_connections_graph().connections,
-                                              self.__input_parameters.get_ignored_loop_attributes_list())
-
-        # In the future networkx could get replaced. Or the package could get used even more.
-        found_cycles = list(networkx.simple_cycles(networkx.DiGraph(adjacency_list)))
+        self.__remove_synchronous_connections(
+            adjacency_list, self.__input_parameters.get_connections_graph().get_attribute_index().get_connections(
+                self.__input_parameters.get_ignored_loop_attributes_list()))
 
+        loop_finder = LoopFinder(adjacency_list)
+        found_cycles = []
         score = 0
+        for loop in loop_finder.find_loops():
+            score += loop_finder.count_independent_cycles(loop)
+            found_cycles.extend(loop_finder.find_shortest_cycles(loop, self.__cycle_limit))
+
         if found_cycles:
-            for cycle_index in range(len(found_cycles)):
-                score += 1
-                found_cycles[cycle_index].append(found_cycles[cycle_index][0])
+            for found_cycle in found_cycles:
+                found_cycle.append(found_cycle[0])
             GraphProcessor().print_paths("Found the following cycles:", found_cycles)
 
         return score
 
     @staticmethod
     def __remove_synchronous_connections(adjacency_list: Dict[Port, Tuple[Port, ...]],
-                                         connections_list: List[Connection], ignored_attributes: List[str]) -> None:
-        for connection in connections_list:
-            if any(attribute in ignored_attributes for attribute in connection.attributes):
-                remaining_end_port_list = list(adjacency_list[connection.begin])
-                remaining_end_port_list.remove(connection.end)
-                if remaining_end_port_list:
-                    adjacency_list[connection.begin] = tuple(remaining_end_port_list)
+                                         ignored_connections: List[Connection]) -> None:
+        """Method to leave the ignored connections out of the adjacency list. Every ignored connection removes one
+        adjacent port, so all of the parallel connections between the same ports are removed when they are all ignored.
+
+        Args:
+            adjacency_list: Adjacency list of the graph which is changed in place.
+            ignored_connections: Connections of the graph with the ignored attributes.
+        """
+        removed_end_port_counts: Dict[Port, Counter] = dict()
+        for connection in ignored_connections:
+            removed_end_port_counts.setdefault(connection.begin, Counter())[connection.end] += 1
+
+        for begin_port, end_port_counts in removed_end_port_counts.items():
+            remaining_end_port_list = []
+            for end_port in adjacency_list[begin_port]:
+                if end_port_counts[end_port]:
+                    end_port_counts[end_port] -= 1
                 else:
-                    adjacency_list.pop(connection.begin)
+                    remaining_end_port_list.append(end_port)
+            if remaining_end_port_list:
+                adjacency_list[begin_port] = tuple(remaining_end_port_list)
+            else:
+                adjacency_list.pop(begin_port)
@@ -18,9 +18,8 @@ class ShortCircuitDetector(VirusSignature):
         graph_processor = GraphProcessor()
 
         adjacency_list = self.__input_parameters.get_connections_graph().get_adjacency_list(True)
-        shorting_ports_set = graph_processor.find_matching_ports(
-            self.__input_parameters.get_short_locations_list(),
-            self.__input_parameters.get_connections_graph().connections, ["end"])
+        shorting_ports_set = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_short_locations_list(), ["end"])
 
         score = 0
         for end_port in adjacency_list:
@@ -19,17 +19,16 @@ class UnspecifiedPathDetector(VirusSignature):
     def detect_virus(self) -> float:
         graph_processor = GraphProcessor()
 
-        begin_ports = graph_processor.find_matching_ports(self.__input_parameters.get_specified_begin_port_list(),
-                                                          self.__found_connections.connections, ["begin"])
+        begin_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_specified_begin_port_list(), ["begin"])
 
-        end_ports = graph_processor.find_matching_ports(self.__input_parameters.get_specified_end_port_list(),
-                                                        self.__found_connections.connections, ["end"])
+        end_ports = self.__input_parameters.get_matching_ports(
+            self.__input_parameters.get_specified_end_port_list(), ["end"])
 
         score = 0
         if begin_ports or end_ports:
-            routing_ports = graph_processor.find_matching_ports(
-                self.__input_parameters.get_specified_routing_port_list(),
-                self.__found_connections.connections, ["begin", "end"])
+            routing_ports = self.__input_parameters.get_matching_ports(
+                self.__input_parameters.get_specified_routing_port_list(), ["begin", "end"])
             if routing_ports:
                 found_reverse_paths = graph_processor.find_all_paths(self.__found_connections.get_adjacency_list(True),
                                                                      end_ports, begin_ports, routing_ports)
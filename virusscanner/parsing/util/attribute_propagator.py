@@ -0,0 +1,96 @@
+from typing import Dict, List, Optional, Pattern, Union
+
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.csv_reader import CSVInput
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.parsing.util.port_matcher import PortMatcher
+
+
+class AttributePropagator:
+    """Class to spread attributes along the implemented graph from the ports where they begin, e.g. to tag a whole
+    clock tree from its clock buffers. Every rule of the CSV file has tile_type, tile_x, tile_y and port columns for
+    the ports where the attribute begins and an attribute_name column. The optional stop_tile_type, stop_tile_x,
+    stop_tile_y and stop_port columns give the ports where the spreading stops and the optional max_depth column
+    limits how many connections away from the beginning ports the attribute spreads."""
+    STOP_PREFIX = "stop_"
+    MAX_DEPTH_KEY = "max_depth"
+
+    @staticmethod
+    def propagate_attributes(propagation_filename: str, input_graph: Graph) -> None:
+        """Method to add the attributes specified in the given CSV file to every connection reachable from the
+        matching ports. The graph is traversed once breadth first for every rule.
+
+        Args:
+            propagation_filename: File path to the CSV file specifying the propagated attributes.
+            input_graph: Graph containing the design's connections.
+        """
+        propagation_rules = CSVInput().get_regexps_list_from_file(propagation_filename)
+        forward_adjacency_list = input_graph.get_adjacency_list()
+        rule_seeds: List[List[Port]] = [[] for _ in propagation_rules]
+        for port, row_mask in PortMatcher(propagation_rules).get_row_masks(forward_adjacency_list).items():
+            while row_mask:
+                lowest_row_bit = row_mask & -row_mask
+                rule_seeds[lowest_row_bit.bit_length() - 1].append(port)
+                row_mask ^= lowest_row_bit
+
+        for propagation_rule, seed_ports in zip(propagation_rules, rule_seeds):
+            stop_rule = AttributePropagator.__get_stop_rule(propagation_rule)
+            AttributePropagator.__spread_attribute(
+                input_graph, seed_ports, propagation_rule["attribute_name"],
+                PortMatcher([stop_rule]) if stop_rule is not None else None,
+                AttributePropagator.__get_max_depth(propagation_rule))
+
+    @staticmethod
+    def __spread_attribute(input_graph: Graph, seed_ports: List[Port], attribute_name: str,
+                           stop_matcher: Optional[PortMatcher], max_depth: Optional[int]) -> None:
+        """Method to add the attribute to the connections reachable from the given ports with one breadth first
+        traversal. The connections ending in the stopping ports get the attribute but the traversal doesn't continue
+        past them.
+
+        Args:
+            input_graph: Graph containing the design's connections.
+            seed_ports: Ports where the attribute begins.
+            attribute_name: Name of the added attribute.
+            stop_matcher: PortMatcher of the ports where the spreading stops or None if it doesn't stop early.
+            max_depth: Largest amount of connections from the beginning ports or None if there is no limit.
+        """
+        forward_adjacency_list = input_graph.get_adjacency_list()
+        attribute_names = (attribute_name,)
+        visited_ports = set(seed_ports)
+        current_ports = seed_ports
+        depth = 0
+        while current_ports and (max_depth is None or depth < max_depth):
+            next_ports = []
+            for port in current_ports:
+                for next_port in forward_adjacency_list.get(port, ()):
+                    input_graph.add_attributes(Connection(port, next_port), attribute_names)
+                    if next_port not in visited_ports:
+                        visited_ports.add(next_port)
+                        if stop_matcher is None or not stop_matcher.is_matching_port(next_port):
+                            next_ports.append(next_port)
+            current_ports = next_ports
+            depth += 1
+
+    @staticmethod
+    def __get_stop_rule(propagation_rule: Dict[str, Union[str, Pattern[str], CoordinateRange]]) -> Optional[
+            Dict[str, Union[Pattern[str], CoordinateRange]]]:
+        stop_keys = [AttributePropagator.STOP_PREFIX + field_key for field_key in PortMatcher.FIELD_KEYS]
+        if not any(stop_key in propagation_rule for stop_key in stop_keys):
+            return None
+        stop_rule = dict()
+        for field_key, stop_key in zip(PortMatcher.FIELD_KEYS, stop_keys):
+            if stop_key not in propagation_rule:
+                raise ValueError("Attribute propagation rule is missing the {} column!".format(stop_key))
+            stop_rule[field_key] = propagation_rule[stop_key]
+        return stop_rule
+
+    @staticmethod
+    def __get_max_depth(propagation_rule: Dict[str, Union[str, Pattern[str], CoordinateRange]]) -> Optional[int]:
+        if AttributePropagator.MAX_DEPTH_KEY not in propagation_rule:
+            return None
+        max_depth = int(propagation_rule[AttributePropagator.MAX_DEPTH_KEY])
+        if max_depth < 1:
+            raise ValueError("Attribute propagation depth has to be positive!")
+        return max_depth
@@ -1,25 +1,22 @@
 from virusscanner.interface.csv_reader import CSVInput
 from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.parsing.util.connection_rule_engine import ConnectionRuleEngine
 
 
 class AttributesAdder:
     """Class to add attributes to the implemented graph"""
     @staticmethod
     def add_attributes_to_connections(attributes_filename: str, input_graph: Graph) -> None:
-        """Method to add attributes specified in the given CSV file to the desired connections.
+        """Method to add attributes specified in the given CSV file to the desired connections. The attributes are
+        added through the graph so its attribute index is kept up to date.
 
         Args:
             attributes_filename: File path to the CSV file specifying the attributes.
             input_graph: Graph containing the design's connections.
         """
-        for attribute_requirement in CSVInput().get_regexps_list_from_file(attributes_filename):
-            for connection in input_graph.connections:
-                if attribute_requirement["begin_tile_type"].match(connection.begin.tile.name) and \
-                        attribute_requirement["begin_tile_x"].match(str(connection.begin.tile.x)) and \
-                        attribute_requirement["begin_tile_y"].match(str(connection.begin.tile.y)) and \
-                        attribute_requirement["begin_port"].match(connection.begin.name) and \
-                        attribute_requirement["end_tile_type"].match(connection.end.tile.name) and \
-                        attribute_requirement["end_tile_x"].match(str(connection.end.tile.x)) and \
-                        attribute_requirement["end_tile_y"].match(str(connection.end.tile.y)) and \
-                        attribute_requirement["end_port"].match(connection.end.name):
-                    connection.attributes.add(attribute_requirement["attribute_name"])
+        attribute_requirements = CSVInput().get_regexps_list_from_file(attributes_filename)
+        rule_assignments = ConnectionRuleEngine(attribute_requirements).get_rule_assignments(input_graph.connections)
+        for attribute_requirement, matching_connections in zip(attribute_requirements, rule_assignments):
+            attribute_names = (attribute_requirement["attribute_name"],)
+            for connection in matching_connections:
+                input_graph.add_attributes(connection, attribute_names)
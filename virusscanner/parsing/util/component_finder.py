@@ -0,0 +1,84 @@
+from typing import Collection, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Set, Tuple
+
+from virusscanner.parsing.util.path_traversal import PortNode
+
+
+class ComponentFinder:
+    """Class for finding the strongly connected components of the implemented graph with an iterative Tarjan's
+    algorithm.
+
+    Args:
+        adjacency_list: Adjacency list of the implemented graph.
+        stop_ports: Optional collection of ports whose outgoing connections are left out of the graph.
+
+    """
+    def __init__(self, adjacency_list: Mapping[PortNode, Sequence[PortNode]],
+                 stop_ports: Optional[Collection[PortNode]] = None) -> None:
+        self.__adjacency_list = adjacency_list
+        self.__stop_ports = stop_ports if stop_ports is not None else ()
+
+    def get_next_ports(self, port: PortNode) -> Sequence[PortNode]:
+        """Method to return the ports the given port connects to in the searched graph.
+
+        Args:
+            port: Port of the graph.
+
+        Returns:
+            Sequence of the adjacent ports or an empty tuple for the stopping ports.
+        """
+        if port in self.__stop_ports:
+            return ()
+        return self.__adjacency_list.get(port, ())
+
+    def find_components(self, start_ports: Iterable[PortNode]) -> List[List[PortNode]]:
+        """Method to find the strongly connected components reachable from the given ports. The components are
+        returned in reverse topological order so every component comes after the components it connects to.
+
+        Args:
+            start_ports: Ports where the search begins.
+
+        Returns:
+            List of the components as lists of their ports.
+        """
+        port_indexes: Dict[PortNode, int] = dict()
+        low_links: Dict[PortNode, int] = dict()
+        component_stack: List[PortNode] = []
+        stacked_ports: Set[PortNode] = set()
+        components: List[List[PortNode]] = []
+        for start_port in start_ports:
+            if start_port in port_indexes:
+                continue
+            search_stack: List[Tuple[PortNode, Iterator[PortNode]]] = [
+                self.__visit_port(start_port, port_indexes, low_links, component_stack, stacked_ports)]
+            while search_stack:
+                port, next_ports = search_stack[-1]
+                for next_port in next_ports:
+                    if next_port not in port_indexes:
+                        search_stack.append(
+                            self.__visit_port(next_port, port_indexes, low_links, component_stack, stacked_ports))
+                        break
+                    if next_port in stacked_ports and port_indexes[next_port] < low_links[port]:
+                        low_links[port] = port_indexes[next_port]
+                else:
+                    search_stack.pop()
+                    if search_stack and low_links[port] < low_links[search_stack[-1][0]]:
+                        low_links[search_stack[-1][0]] = low_links[port]
+                    if low_links[port] == port_indexes[port]:
+                        component = []
+                        while True:
+                            component_port = component_stack.pop()
+                            stacked_ports.discard(component_port)
+                            component.append(component_port)
+                            if component_port == port:
+                                break
+                        components.append(component)
+        return components
+
+    def __visit_port(self, port: PortNode, port_indexes: Dict[PortNode, int], low_links: Dict[PortNode, int],
+                     component_stack: List[PortNode],
+                     stacked_ports: Set[PortNode]) -> Tuple[PortNode, Iterator[PortNode]]:
+        port_indexes[port] = len(port_indexes)
+        low_links[port] = port_indexes[port]
+        component_stack.append(port)
+        stacked_ports.add(port)
+        return port, iter(self.get_next_ports(port))
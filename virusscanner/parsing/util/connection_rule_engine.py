@@ -0,0 +1,113 @@
+from typing import Dict, Iterable, List, Pattern, Tuple, Union
+
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.parsing.util.port_matcher import PortMatcher
+
+
+class ConnectionRuleEngine:
+    """Class for matching connections against rules read from a CSV file with begin_tile_type, begin_tile_x,
+    begin_tile_y, begin_port, end_tile_type, end_tile_x, end_tile_y and end_port columns. A connection matches a rule
+    if its begin and end ports match the begin and end columns of the rule.
+
+    The connections are partitioned by the tile types of their begin and end ports and each partition is only checked
+    against the rules whose tile type regular expressions match it. The matching rules of every port are memoized.
+
+    Args:
+        connection_rules: List of dictionaries holding the regular expressions of each rule.
+
+    """
+    BEGIN_PREFIX = "begin_"
+    END_PREFIX = "end_"
+
+    def __init__(self, connection_rules: List[Dict[str, Union[str, Pattern[str], CoordinateRange]]]) -> None:
+        self.__rule_count = len(connection_rules)
+        self.__begin_matcher = PortMatcher([self.__get_port_rule(connection_rule, self.BEGIN_PREFIX)
+                                            for connection_rule in connection_rules])
+        self.__end_matcher = PortMatcher([self.__get_port_rule(connection_rule, self.END_PREFIX)
+                                          for connection_rule in connection_rules])
+
+    @staticmethod
+    def __get_port_rule(connection_rule: Dict[str, Union[str, Pattern[str], CoordinateRange]],
+                        prefix: str) -> Dict[str, Union[Pattern[str], CoordinateRange]]:
+        port_rule = dict()
+        for field_key in PortMatcher.FIELD_KEYS:
+            if prefix + field_key not in connection_rule:
+                raise ValueError("Connection rule is missing the {} column!".format(prefix + field_key))
+            port_rule[field_key] = connection_rule[prefix + field_key]
+        return port_rule
+
+    def get_rule_masks(self, connections: Iterable[Connection]) -> Dict[Connection, int]:
+        """Method to find the rules matching each of the given connections.
+
+        Args:
+            connections: Connections to be matched.
+
+        Returns:
+            Dictionary of bitmasks where bit i is set if the rule i matches the connection. Connections without any
+            matching rules are left out.
+        """
+        partitions: Dict[Tuple[str, str], List[Connection]] = dict()
+        for connection in connections:
+            partition_key = (connection.begin.tile.name, connection.end.tile.name)
+            if partition_key in partitions:
+                partitions[partition_key].append(connection)
+            else:
+                partitions[partition_key] = [connection]
+
+        matching_partitions = []
+        begin_ports = set()
+        end_ports = set()
+        for (begin_tile_type, end_tile_type), partition in partitions.items():
+            tile_type_mask = self.__begin_matcher.get_tile_type_mask(begin_tile_type) & \
+                             self.__end_matcher.get_tile_type_mask(end_tile_type)
+            if tile_type_mask:
+                matching_partitions.append((tile_type_mask, partition))
+                begin_ports.update(connection.begin for connection in partition)
+                end_ports.update(connection.end for connection in partition)
+
+        begin_row_masks = self.__begin_matcher.get_row_masks(begin_ports)
+        end_row_masks = self.__end_matcher.get_row_masks(end_ports)
+        rule_masks = dict()
+        for tile_type_mask, partition in matching_partitions:
+            for connection in partition:
+                rule_mask = tile_type_mask & begin_row_masks[connection.begin] & end_row_masks[connection.end]
+                if rule_mask:
+                    rule_masks[connection] = rule_mask
+        return rule_masks
+
+    def get_rule_assignments(self, connections: Iterable[Connection]) -> List[List[Connection]]:
+        """Method to find the connections matching each of the rules.
+
+        Args:
+            connections: Connections to be matched.
+
+        Returns:
+            List holding the list of matching connections for every rule in the order of the rules.
+        """
+        rule_assignments = [[] for _ in range(self.__rule_count)]
+        for connection, rule_mask in self.get_rule_masks(connections).items():
+            while rule_mask:
+                lowest_rule_bit = rule_mask & -rule_mask
+                rule_assignments[lowest_rule_bit.bit_length() - 1].append(connection)
+                rule_mask ^= lowest_rule_bit
+        return rule_assignments
+
+    def get_unique_rule_assignments(self, connections: Iterable[Connection],
+                                    conflict_message: str = "{} matches multiple rules!") -> Dict[Connection, int]:
+        """Method to find the single rule matching each of the given connections. Raises ValueError if a connection
+        matches more than one rule.
+
+        Args:
+            connections: Connections to be matched.
+            conflict_message: Message of the raised error which is formatted with the conflicting connection.
+
+        Returns:
+            Dictionary of the indexes of the matching rules. Connections without a matching rule are left out.
+        """
+        rule_indexes = dict()
+        for connection, rule_mask in self.get_rule_masks(connections).items():
+            if rule_mask & (rule_mask - 1):
+                raise ValueError(conflict_message.format(connection))
+            rule_indexes[connection] = rule_mask.bit_length() - 1
+        return rule_indexes
@@ -1,14 +1,51 @@
+from typing import List
+
 from virusscanner.interface.datastructures.implementation_graph import Graph
 
 
 class ConnectionRemover:
-    # TODO: Change these kind of searches from list iteration to using hash functions (i.e sets)
+    """Class to remove the connections listed in a text file from the implemented graph"""
+    CONNECTION_SEPARATOR = "->"
+
     @staticmethod
-    def remove_connections(connections_file: str, found_connections_graph: Graph) -> None:
+    def remove_connections(connections_file: str, found_connections_graph: Graph) -> List[str]:
+        """Method to remove the connections given in the file from the graph. Every line of the file has the string
+        form of one connection and the lines are matched to the connections with a single pass over the graph.
+
+        Args:
+            connections_file: File path to the text file listing the removable connections.
+            found_connections_graph: Graph containing the design's connections.
+
+        Returns:
+            List of the lines which didn't match any connection of the graph.
+        """
+        requested_lines = dict()
         with open(connections_file, "r") as connections_file_handle:
             for line in connections_file_handle:
                 line = line.strip()
                 if line != "":
-                    for connection in found_connections_graph.connections:
-                        if str(connection) == line:
-                            found_connections_graph.remove_connection(connection)
+                    requested_lines.setdefault(ConnectionRemover.__get_connection_key(line), line)
+
+        removed_connections = [connection for connection in found_connections_graph.connections
+                               if str(connection) in requested_lines]
+        with found_connections_graph.batch_update():
+            for connection in removed_connections:
+                found_connections_graph.remove_connection(connection)
+
+        matched_keys = {str(connection) for connection in removed_connections}
+        return [line for connection_key, line in requested_lines.items() if connection_key not in matched_keys]
+
+    @staticmethod
+    def __get_connection_key(line: str) -> str:
+        """Method to make the line comparable to the string form of connections regardless of the whitespace used.
+
+        Args:
+            line: Line of the removable connections file.
+
+        Returns:
+            Canonical string form of the connection given on the line.
+        """
+        begin_port, separator, end_port = line.partition(ConnectionRemover.CONNECTION_SEPARATOR)
+        if not separator:
+            return " ".join(line.split())
+        return "{} {} {}".format(" ".join(begin_port.split()), separator, " ".join(end_port.split()))
@@ -0,0 +1,81 @@
+from typing import Collection, Dict, List, Mapping, Optional, Tuple
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.parsing.util.component_finder import ComponentFinder
+
+
+class EndPortReachability:
+    """Class for finding the distinct end ports every begin port reaches along the paths of
+    GraphProcessor.find_all_paths. The reached end ports of every component are kept as an integer bitmask.
+
+    Args:
+        adjacency_list: Adjacency list of the implemented graph.
+        begin_ports: Collection of ports from which paths must begin.
+        end_ports: Collection of ports where the paths must end.
+
+    """
+    def __init__(self, adjacency_list: Mapping[Port, Tuple[Port, ...]], begin_ports: Collection[Port],
+                 end_ports: Collection[Port]) -> None:
+        self.__adjacency_list = adjacency_list
+        self.__begin_ports = list(begin_ports)
+        self.__end_ports = end_ports
+        self.__reached_end_ports: List[Port] = []
+        self.__begin_port_masks: Optional[Dict[Port, int]] = None
+
+    def get_reachable_end_ports(self) -> Dict[Port, List[Port]]:
+        """Method to find the distinct end ports reachable from every begin port.
+
+        Returns:
+            Dictionary of the lists of end ports keyed by the begin ports in the order they were given.
+        """
+        return {begin_port: [self.__reached_end_ports[bit] for bit in range(end_port_mask.bit_length())
+                             if end_port_mask >> bit & 1]
+                for begin_port, end_port_mask in self.__get_begin_port_masks().items()}
+
+    def count_reachable_end_ports(self) -> Dict[Port, int]:
+        """Method to count the distinct end ports reachable from every begin port.
+
+        Returns:
+            Dictionary of the amount of end ports keyed by the begin ports in the order they were given.
+        """
+        return {begin_port: bin(end_port_mask).count("1")
+                for begin_port, end_port_mask in self.__get_begin_port_masks().items()}
+
+    def __get_begin_port_masks(self) -> Dict[Port, int]:
+        """Method to propagate the end port bitmasks from the end ports to the begin ports once.
+
+        Returns:
+            Dictionary of the bitmasks of the end ports reachable from the begin ports.
+        """
+        if self.__begin_port_masks is None:
+            component_finder = ComponentFinder(self.__adjacency_list, self.__end_ports)
+            start_ports = []
+            for begin_port in self.__begin_ports:
+                if begin_port in self.__end_ports:
+                    start_ports.extend(self.__adjacency_list.get(begin_port, ()))
+                else:
+                    start_ports.append(begin_port)
+
+            port_masks: Dict[Port, int] = dict()
+            for component in component_finder.find_components(start_ports):
+                component_mask = 0
+                for port in component:
+                    if port in self.__end_ports:
+                        component_mask |= 1 << len(self.__reached_end_ports)
+                        self.__reached_end_ports.append(port)
+                    for next_port in component_finder.get_next_ports(port):
+                        component_mask |= port_masks.get(next_port, 0)
+                for port in component:
+                    port_masks[port] = component_mask
+
+            self.__begin_port_masks = dict()
+            for begin_port in self.__begin_ports:
+                if begin_port in self.__end_ports:
+                    # A path can't return to the port it began from, so it doesn't reach itself.
+                    end_port_mask = 0
+                    for next_port in self.__adjacency_list.get(begin_port, ()):
+                        end_port_mask |= port_masks[next_port]
+                    self.__begin_port_masks[begin_port] = end_port_mask & ~port_masks.get(begin_port, 0)
+                else:
+                    self.__begin_port_masks[begin_port] = port_masks[begin_port]
+        return self.__begin_port_masks
@@ -4,6 +4,8 @@ from typing import List, Dict, Tuple, Pattern, Optional, Set, Union
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.port import Port
 from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.path_traversal import PathTraversal
+from virusscanner.parsing.util.port_matcher import PortMatcher
 
 
 class GraphProcessor:
@@ -36,7 +38,8 @@ class GraphProcessor:
     @staticmethod
     def find_matching_ports(port_regexps_list: List[Dict[str, Union[str, Pattern[str]]]],
                             connections_graph: List[Connection], port_key_list: List[str]) -> Set[Port]:
-        """Method to find all of the ports which match the given regular expressions.
+        """Method to find all of the ports which match the given regular expressions. Each distinct port is only
+        matched once.
 
         Args:
             port_regexps_list: List holding the regular expressions for different values in the ports.
@@ -46,18 +49,10 @@ class GraphProcessor:
         Returns:
             Set of ports which match the given regular expressions.
         """
-        matching_ports_list = set()
-        for port_regexps in port_regexps_list:
-            for connection in connections_graph:
-                for port_key in port_key_list:
-                    current_port = getattr(connection, port_key)
-                    if port_regexps["tile_type"].match(current_port.tile.name) and \
-                            port_regexps["tile_x"].match(str(current_port.tile.x)) and \
-                            port_regexps["tile_y"].match(str(current_port.tile.y)) and \
-                            port_regexps["port"].match(current_port.name):
-                        matching_ports_list.add(current_port)
-
-        return matching_ports_list
+        candidate_ports = set()
+        for port_key in port_key_list:
+            candidate_ports.update(getattr(connection, port_key) for connection in connections_graph)
+        return PortMatcher(port_regexps_list).get_matching_ports(candidate_ports)
 
     @staticmethod
     def print_ports(message: str, ports_collection: Union[List[Port], Set[Port], Tuple[Port]]) -> None:
@@ -119,7 +114,7 @@ class GraphProcessor:
     def depth_first_search(self, start_port: Port, end_ports_set: Set[Port],
                            adjacency_list: Dict[Port, Tuple[Port, ...]],
                            found_paths_list: List[List[Port]], current_path_stack: Optional[List[Port]] = None) -> None:
-        """Method to do a DFS to recursively find all of the paths to the destination port from the start port.
+        """Method to do a DFS to find all of the paths to the destination port from the start port.
 
         Args:
             start_port: Port representing the current location in the graph.
@@ -128,25 +123,21 @@ class GraphProcessor:
             found_paths_list: List of paths already found which will be updated with this method calls.
             current_path_stack: List containing nodes currently already visited.
         """
-        current_path_stack = current_path_stack if current_path_stack else [start_port]
-
-        for connecting_port in adjacency_list.get(start_port, []):
-            if connecting_port not in current_path_stack:
-                current_path_stack.append(connecting_port)
-                if connecting_port in end_ports_set:
-                    found_paths_list.append(copy.copy(current_path_stack))
-                else:
-                    self.depth_first_search(connecting_port, end_ports_set, adjacency_list, found_paths_list,
-                                            current_path_stack)
-                current_path_stack.pop()
+        def enter_port(_: Port, connecting_port: Port, current_path: List[Port]) -> bool:
+            if connecting_port in end_ports_set:
+                found_paths_list.append(copy.copy(current_path))
+                return False
+            return True
+
+        PathTraversal(adjacency_list).walk(start_port, enter_port, current_path_stack)
 
     def depth_first_invalid_path_search_with_routing(self, start_port: Port, end_ports_set: Set[Port],
                                                      routing_ports_set: Set[Port],
                                                      adjacency_list: Dict[Port, Tuple[Port, ...]],
                                                      found_paths_list: List[List[Port]], visited_ports_set: Set[Port],
                                                      current_path_stack: Optional[List[Port]] = None) -> None:
-        """Method to do a DFS to recursively find all of the paths not the destination port from the start port using
-        the valid routing ports.
+        """Method to do a DFS to find all of the paths not the destination port from the start port using the valid
+        routing ports.
 
         Args:
             visited_ports_set: Set of visited ports.
@@ -157,21 +148,19 @@ class GraphProcessor:
             found_paths_list: List of paths already found which will be updated with this method calls.
             current_path_stack: List containing nodes currently already visited.
         """
-        current_path_stack = current_path_stack if current_path_stack else [start_port]
-        if start_port not in visited_ports_set:
-            visited_ports_set.add(start_port)
-
-        for connecting_port in adjacency_list.get(start_port, []):
-            if connecting_port not in current_path_stack and connecting_port not in visited_ports_set:
-                current_path_stack.append(connecting_port)
-                visited_ports_set.add(connecting_port)
-                if connecting_port in routing_ports_set:
-                    self.depth_first_invalid_path_search_with_routing(connecting_port, end_ports_set, routing_ports_set,
-                                                                      adjacency_list, found_paths_list,
-                                                                      visited_ports_set, current_path_stack)
-                elif connecting_port not in end_ports_set:
-                    found_paths_list.append(copy.copy(current_path_stack))
-                current_path_stack.pop()
+        visited_ports_set.add(start_port)
+
+        def enter_port(_: Port, connecting_port: Port, current_path: List[Port]) -> bool:
+            if connecting_port in visited_ports_set:
+                return False
+            visited_ports_set.add(connecting_port)
+            if connecting_port in routing_ports_set:
+                return True
+            if connecting_port not in end_ports_set:
+                found_paths_list.append(copy.copy(current_path))
+            return False
+
+        PathTraversal(adjacency_list).walk(start_port, enter_port, current_path_stack)
 
     @staticmethod
     def find_dangling_ports(connections_list: List[Connection], adjacency_list: Dict[Port, Tuple[Port, ...]],
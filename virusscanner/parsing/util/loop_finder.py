@@ -0,0 +1,93 @@
+from collections import deque
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.parsing.util.component_finder import ComponentFinder
+
+
+class LoopFinder:
+    """Class for finding the combinatorial loops of the implemented graph. Every loop is a strongly connected
+    component with a cycle, so all of the loops are found with one pass over the connections without listing the
+    cycles. A few of the shortest cycles of a loop can be listed to show where the loop is.
+
+    Args:
+        adjacency_list: Adjacency list of the implemented graph.
+
+    """
+    def __init__(self, adjacency_list: Mapping[Port, Tuple[Port, ...]]) -> None:
+        self.__adjacency_list = adjacency_list
+
+    def find_loops(self) -> List[List[Port]]:
+        """Method to find the strongly connected components which have a cycle.
+
+        Returns:
+            List of the loops as lists of their ports.
+        """
+        return [component for component in
+                ComponentFinder(self.__adjacency_list).find_components(list(self.__adjacency_list))
+                if len(component) > 1 or component[0] in self.__adjacency_list.get(component[0], ())]
+
+    def count_independent_cycles(self, loop: List[Port]) -> int:
+        """Method to count the independent cycles of the given loop, i.e. the amount of connections in the loop minus
+        the amount of ports in it plus one. A single ring has one independent cycle.
+
+        Args:
+            loop: Ports of the loop.
+
+        Returns:
+            Amount of independent cycles in the loop.
+        """
+        loop_ports = set(loop)
+        connection_count = sum(1 for port in loop for next_port in self.__adjacency_list.get(port, ())
+                               if next_port in loop_ports)
+        return connection_count - len(loop) + 1
+
+    def find_shortest_cycles(self, loop: List[Port], max_cycles: int) -> List[List[Port]]:
+        """Method to list the shortest cycle through the ports of the given loop. The ports are tried in order and
+        ports already on a listed cycle are skipped, so at most max_cycles searches through the loop are done.
+
+        Args:
+            loop: Ports of the loop.
+            max_cycles: Largest amount of listed cycles.
+
+        Returns:
+            List of the distinct cycles as lists of ports sorted by their length.
+        """
+        loop_ports = set(loop)
+        cycle_ports: Set[Port] = set()
+        found_cycles = []
+        for start_port in loop:
+            if len(found_cycles) >= max_cycles:
+                break
+            if start_port in cycle_ports:
+                continue
+            found_cycle = self.__find_shortest_cycle(start_port, loop_ports)
+            cycle_ports.update(found_cycle)
+            found_cycles.append(found_cycle)
+        return sorted(found_cycles, key=len)
+
+    def __find_shortest_cycle(self, start_port: Port, loop_ports: Set[Port]) -> List[Port]:
+        """Method to find the shortest cycle through the given port with a breadth first search inside the loop.
+
+        Args:
+            start_port: Port where the cycle begins.
+            loop_ports: Set of the ports in the loop of the start port.
+
+        Returns:
+            List of the ports of the cycle beginning from the start port.
+        """
+        previous_ports: Dict[Port, Optional[Port]] = {start_port: None}
+        port_queue = deque([start_port])
+        while port_queue:
+            port = port_queue.popleft()
+            for next_port in self.__adjacency_list.get(port, ()):
+                if next_port == start_port:
+                    found_cycle = [port]
+                    while previous_ports[found_cycle[-1]] is not None:
+                        found_cycle.append(previous_ports[found_cycle[-1]])
+                    found_cycle.reverse()
+                    return found_cycle
+                if next_port in loop_ports and next_port not in previous_ports:
+                    previous_ports[next_port] = port
+                    port_queue.append(next_port)
+        raise ValueError("Port {} isn't on a cycle!".format(start_port))
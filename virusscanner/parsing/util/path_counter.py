@@ -0,0 +1,197 @@
+from typing import Collection, Dict, List, Optional, Set
+
+from virusscanner.interface.datastructures.compact_graph import CompactGraph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.parsing.util.component_finder import ComponentFinder
+from virusscanner.parsing.util.path_traversal import PathTraversal
+
+
+class PathCounter:
+    """Class for counting the paths found by GraphProcessor.find_all_paths without listing them. The counts are
+    summed through the strongly connected components in topological order, so only the paths inside cyclic
+    components are walked. The walks can grow exponentially, so they are cut short after max_walk_steps and the
+    counts become lower bounds.
+
+    Args:
+        compact_graph: Compact graph of the implemented graph.
+        begin_ports: Collection of ports from which paths must begin.
+        end_ports: Collection of ports where the paths must end.
+        max_walk_steps: Largest amount of ports added to the walked paths during one count or listing.
+
+    """
+    DEFAULT_MAX_WALK_STEPS = 1000000
+
+    def __init__(self, compact_graph: CompactGraph, begin_ports: Collection[Port],
+                 end_ports: Collection[Port], max_walk_steps: int = DEFAULT_MAX_WALK_STEPS) -> None:
+        if max_walk_steps < 0:
+            raise ValueError("Amount of walk steps can't be negative!")
+        self.__compact_graph = compact_graph
+        self.__adjacency_rows = compact_graph.get_adjacency_rows()
+        self.__begin_ports = list(begin_ports)
+        self.__begin_port_ids = [compact_graph.get_port_id(begin_port) for begin_port in self.__begin_ports]
+        self.__end_port_ids = {compact_graph.get_port_id(end_port) for end_port in end_ports} - {None}
+        self.__component_finder = ComponentFinder(self.__adjacency_rows, self.__end_port_ids)
+        self.__components: Optional[List[List[int]]] = None
+        self.__entry_ports: Set[int] = set()
+        self.__leading_ports: Set[int] = set()
+        self.__path_counts: Optional[Dict[Port, int]] = None
+        self.__max_walk_steps = max_walk_steps
+        self.__remaining_walk_steps = max_walk_steps
+        self.__are_counts_exact = True
+
+    def get_path_counts(self) -> Dict[Port, int]:
+        """Method to count the paths beginning from every begin port.
+
+        Returns:
+            Dictionary of the amount of paths keyed by the begin ports in the order they were given.
+        """
+        if self.__path_counts is None:
+            self.__remaining_walk_steps = self.__max_walk_steps
+            continued_counts = self.__count_continued_paths()
+            self.__path_counts = dict()
+            for begin_port, begin_id in zip(self.__begin_ports, self.__begin_port_ids):
+                if begin_id is None:
+                    self.__path_counts[begin_port] = 0
+                elif begin_id in self.__end_port_ids:
+                    # A path can't return to the port it began from, so paths ending in it don't count.
+                    begin_port_counts = self.__count_continued_paths(begin_id) \
+                        if begin_id in self.__entry_ports else continued_counts
+                    self.__path_counts[begin_port] = self.__sum_next_port_counts(begin_id, begin_port_counts, begin_id)
+                else:
+                    self.__path_counts[begin_port] = continued_counts[begin_id]
+        return self.__path_counts
+
+    def are_path_counts_exact(self) -> bool:
+        """Method to check if the paths were counted without cutting any walk short.
+
+        Returns:
+            Boolean noting if the path counts are exact or only lower bounds.
+        """
+        self.get_path_counts()
+        return self.__are_counts_exact
+
+    def find_paths(self, max_paths: Optional[int] = None) -> List[List[Port]]:
+        """Method to list the paths in the same order as GraphProcessor.find_all_paths.
+
+        Args:
+            max_paths: Optional largest amount of listed paths.
+
+        Returns:
+            List of the found paths.
+        """
+        self.__get_components()
+        found_paths: List[List[Port]] = []
+        ports = self.__compact_graph.ports
+        self.__remaining_walk_steps = self.__max_walk_steps
+
+        def enter_port(_: int, connecting_id: int, current_path: List[int]) -> bool:
+            if max_paths is not None and len(found_paths) >= max_paths or not self.__take_walk_step():
+                return False
+            if connecting_id in self.__end_port_ids:
+                found_paths.append([ports[port_id] for port_id in current_path])
+                return False
+            return connecting_id in self.__leading_ports
+
+        path_traversal = PathTraversal(self.__adjacency_rows)
+        for begin_id in self.__begin_port_ids:
+            if max_paths is not None and len(found_paths) >= max_paths or not self.__remaining_walk_steps:
+                break
+            if begin_id is not None:
+                path_traversal.walk(begin_id, enter_port)
+        return found_paths
+
+    def __get_components(self) -> List[List[int]]:
+        """Method to find the components reachable from the begin ports once.
+
+        Returns:
+            List of the components in reverse topological order.
+        """
+        if self.__components is None:
+            start_ports = []
+            for begin_id in self.__begin_port_ids:
+                if begin_id in self.__end_port_ids:
+                    start_ports.extend(self.__adjacency_rows.get(begin_id, ()))
+                elif begin_id is not None:
+                    start_ports.append(begin_id)
+            self.__components = self.__component_finder.find_components(start_ports)
+            self.__entry_ports.update(start_ports)
+            for component in self.__components:
+                component_ports = set(component) if len(component) > 1 else {component[0]}
+                is_leading = False
+                for port in component:
+                    for next_port in self.__component_finder.get_next_ports(port):
+                        if next_port not in component_ports:
+                            self.__entry_ports.add(next_port)
+                            is_leading = is_leading or next_port in self.__end_port_ids or \
+                                next_port in self.__leading_ports
+                if is_leading:
+                    self.__leading_ports.update(component)
+        return self.__components
+
+    def __count_continued_paths(self, excluded_end_port: Optional[int] = None) -> Dict[int, int]:
+        """Method to count the paths continuing from the ports of the components in reverse topological order.
+
+        Args:
+            excluded_end_port: Optional end port whose paths aren't counted.
+
+        Returns:
+            Dictionary of the amount of paths continuing from the ports.
+        """
+        path_counts: Dict[int, int] = dict()
+        for component in self.__get_components():
+            if len(component) == 1:
+                if component[0] not in self.__end_port_ids:
+                    path_counts[component[0]] = self.__sum_next_port_counts(component[0], path_counts,
+                                                                            excluded_end_port)
+            else:
+                component_ports = set(component)
+                for port in component:
+                    if port in self.__entry_ports:
+                        path_counts[port] = self.__count_component_paths(port, component_ports, path_counts,
+                                                                         excluded_end_port)
+        return path_counts
+
+    def __count_component_paths(self, entry_port: int, component_ports: Set[int], path_counts: Dict[int, int],
+                                excluded_end_port: Optional[int]) -> int:
+        """Method to count the paths continuing from a port of a cyclic component by walking the paths inside it.
+
+        Args:
+            entry_port: Port of the component where the paths begin.
+            component_ports: Set of the ports in the component.
+            path_counts: Dictionary of the amount of paths continuing from the ports of the adjacent components.
+            excluded_end_port: Optional end port whose paths aren't counted.
+
+        Returns:
+            Amount of paths continuing from the entry port.
+        """
+        path_count = 0
+
+        def enter_port(_: int, connecting_port: int, current_path: List[int]) -> bool:
+            nonlocal path_count
+            if not self.__take_walk_step():
+                self.__are_counts_exact = False
+                return False
+            if connecting_port in component_ports:
+                return True
+            path_count += self.__get_next_port_count(connecting_port, path_counts, excluded_end_port)
+            return False
+
+        PathTraversal(self.__adjacency_rows).walk(entry_port, enter_port)
+        return path_count
+
+    def __take_walk_step(self) -> bool:
+        if not self.__remaining_walk_steps:
+            return False
+        self.__remaining_walk_steps -= 1
+        return True
+
+    def __sum_next_port_counts(self, port: int, path_counts: Dict[int, int],
+                               excluded_end_port: Optional[int]) -> int:
+        return sum(self.__get_next_port_count(next_port, path_counts, excluded_end_port)
+                   for next_port in self.__adjacency_rows.get(port, ()) if next_port != port)
+
+    def __get_next_port_count(self, next_port: int, path_counts: Dict[int, int],
+                              excluded_end_port: Optional[int]) -> int:
+        if next_port in self.__end_port_ids:
+            return 0 if next_port == excluded_end_port else 1
+        return path_counts[next_port]
@@ -0,0 +1,65 @@
+from typing import Callable, Iterator, List, Mapping, Optional, Sequence, Union
+
+from virusscanner.interface.datastructures.port import Port
+
+# Ports of an adjacency list or the integer port IDs of the adjacency rows of a compact graph.
+PortNode = Union[Port, int]
+
+
+class PathTraversal:
+    """Class for walking the simple paths of the implemented graph depth first. The walk keeps its own stack instead
+    of recursing, so long routing chains don't hit the recursion limit. The work done on the way is given with
+    callbacks:
+
+    * enter_port(port, next_port, path) is called after a port which isn't on the current path yet is added to the
+      end of the path. The walk continues from the added port only if the callback returns True.
+    * examine_connection(port, next_port, path) is called for every connection leaving a port the walk continues
+      from, also for the connections ending in a port on the current path.
+    * leave_port(port, next_port, path) is called when the walk has finished the paths continuing from an entered
+      port, before the port is removed from the end of the path.
+
+    Args:
+        adjacency_list: Adjacency list of the implemented graph.
+
+    """
+    def __init__(self, adjacency_list: Mapping[PortNode, Sequence[PortNode]]) -> None:
+        self.__adjacency_list = adjacency_list
+
+    def walk(self, start_port: PortNode, enter_port: Callable[[PortNode, PortNode, List[PortNode]], bool],
+             current_path: Optional[List[PortNode]] = None,
+             examine_connection: Optional[Callable[[PortNode, PortNode, List[PortNode]], None]] = None,
+             leave_port: Optional[Callable[[PortNode, PortNode, List[PortNode]], None]] = None) -> None:
+        """Method to walk all of the simple paths continuing from the given port.
+
+        Args:
+            start_port: Port where the walk begins.
+            enter_port: Callback deciding if the walk continues from the port added to the path.
+            current_path: List of the ports already on the path ending in the start port. The list is updated during
+                the walk and has the same ports after it.
+            examine_connection: Optional callback for every connection leaving a port the walk continues from.
+            leave_port: Optional callback for the ports the walk has continued from.
+        """
+        current_path = current_path if current_path else [start_port]
+        path_ports = set(current_path)
+        adjacent_port_iterators: List[Iterator[PortNode]] = [iter(self.__adjacency_list.get(start_port, ()))]
+        while adjacent_port_iterators:
+            next_port = next(adjacent_port_iterators[-1], None)
+            if next_port is None:
+                adjacent_port_iterators.pop()
+                if adjacent_port_iterators:
+                    if leave_port is not None:
+                        leave_port(current_path[-2], current_path[-1], current_path)
+                    path_ports.discard(current_path.pop())
+                continue
+
+            port = current_path[-1]
+            if examine_connection is not None:
+                examine_connection(port, next_port, current_path)
+            if next_port in path_ports:
+                continue
+            current_path.append(next_port)
+            path_ports.add(next_port)
+            if enter_port(port, next_port, current_path):
+                adjacent_port_iterators.append(iter(self.__adjacency_list.get(next_port, ())))
+            else:
+                path_ports.discard(current_path.pop())
@@ -0,0 +1,294 @@
+import re
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Pattern, Set, Tuple, Union
+
+import numpy
+
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_catalogue import PortCatalogue
+from virusscanner.interface.datastructures.spatial_index import Region
+from virusscanner.interface.literal_pattern import LiteralPattern
+
+# Patterns which match any value from the beginning of the value, so they don't need to be evaluated.
+ALWAYS_MATCHING_PATTERNS = frozenset((".*", r"\d*", ""))
+# Patterns which only need a look at the first character of the value to know if they match.
+FIRST_CHARACTER_PATTERNS: Dict[str, Callable[[str], bool]] = {
+    ".+": lambda value: value != "" and value[0] != "\n",
+    r"\d+": lambda value: value[:1].isdecimal(),
+    "[0-9]+": lambda value: value[:1] in "0123456789" and value != "",
+}
+# Patterns with these constructs can't be put into one alternation without changing their meaning.
+NOT_COMBINABLE_PATTERN = re.compile(r"\(\?[aiLmsux-]|\(\?P=|\(\?\(|\\\d|\\g")
+
+
+class PortMatcher:
+    """Class for matching ports against the rows of regular expressions read from a CSV file. A port matches if
+    any row has matching tile type, tile x, tile y and port name regular expressions. Each field value is evaluated
+    once against all of the distinct regular expressions of the field and the results of the ports are memoized.
+    Regular expressions without metacharacters are kept in hash tables and looked up by the prefixes of the value, so
+    long lists of literal rows don't have to be evaluated one by one. Coordinate ranges are evaluated for all of the
+    distinct coordinates at once with vectorized comparisons.
+
+    Args:
+        port_regexps_list: List holding the regular expressions for different values in the ports.
+
+    """
+    FIELD_KEYS = ("tile_type", "tile_x", "tile_y", "port")
+
+    def __init__(self, port_regexps_list: List[Dict[str, Union[str, Pattern[str], CoordinateRange,
+                                                               LiteralPattern]]]) -> None:
+        self.__row_count = len(port_regexps_list)
+        self.__always_matching_masks: List[int] = []
+        self.__first_character_masks: List[List[Tuple[Callable[[str], bool], int]]] = []
+        self.__field_literal_masks: List[List[Tuple[int, Dict[str, int]]]] = []
+        self.__field_patterns: List[List[Pattern[str]]] = []
+        self.__field_pattern_masks: List[List[int]] = []
+        self.__field_prefilters: List[Optional[Pattern[str]]] = []
+        self.__field_ranges: List[List[Tuple[CoordinateRange, int]]] = []
+        self.__field_value_masks: List[Dict[Union[str, int], int]] = []
+        self.__port_row_masks: Dict[Port, int] = dict()
+        for field_key in self.FIELD_KEYS:
+            self.__add_field([self.__get_row_pattern(port_regexps, field_key) for port_regexps in port_regexps_list])
+
+    @classmethod
+    def get_rules_key(cls, port_regexps_list: List[Dict[str, Union[str, Pattern[str], CoordinateRange]]]) -> Hashable:
+        """Method to make a key which is equal for rows of regular expressions matching the same ports. The order
+        and repetitions of the rows don't change the matched ports so they don't change the key.
+
+        Args:
+            port_regexps_list: List holding the regular expressions for different values in the ports.
+
+        Returns:
+            Hashable key of the given rows.
+        """
+        return frozenset(tuple((field_key, port_regexps[field_key].pattern, port_regexps[field_key].flags)
+                               for field_key in cls.FIELD_KEYS if field_key in port_regexps)
+                         for port_regexps in port_regexps_list)
+
+    @staticmethod
+    def get_rule_regions(port_regexps_list: List[Dict[str, Union[str, Pattern[str], CoordinateRange]]]) -> Optional[
+            List[Region]]:
+        """Method to find the regions of the device which the rows of regular expressions are limited to by their
+        coordinate ranges. Ports outside of the regions can't match.
+
+        Args:
+            port_regexps_list: List holding the regular expressions for different values in the ports.
+
+        Returns:
+            List of the regions of the rows or None if a row has no coordinate ranges.
+        """
+        rule_regions = []
+        for port_regexps in port_regexps_list:
+            coordinate_limits = []
+            for field_key in ("tile_x", "tile_y"):
+                coordinate_range = port_regexps.get(field_key)
+                if isinstance(coordinate_range, CoordinateRange):
+                    coordinate_limits.append((coordinate_range.minimum, coordinate_range.maximum))
+                else:
+                    coordinate_limits.append((None, None))
+            (min_x, max_x), (min_y, max_y) = coordinate_limits
+            if min_x is None and max_x is None and min_y is None and max_y is None:
+                return None
+            rule_regions.append(Region(min_x, min_y, max_x, max_y))
+        return rule_regions
+
+    @staticmethod
+    def __get_row_pattern(port_regexps: Dict[str, Union[str, Pattern[str], CoordinateRange]],
+                          field_key: str) -> Union[Pattern[str], CoordinateRange]:
+        if field_key not in port_regexps:
+            raise ValueError("Port regular expression row is missing the {} column!".format(field_key))
+        return port_regexps[field_key]
+
+    def __add_field(self, row_patterns: List[Union[Pattern[str], CoordinateRange, LiteralPattern]]) -> None:
+        always_matching_mask = 0
+        first_character_masks: Dict[str, int] = dict()
+        literal_masks: Dict[int, Dict[str, int]] = dict()
+        pattern_masks: Dict[Pattern[str], int] = dict()
+        range_masks: Dict[CoordinateRange, int] = dict()
+        for row_index, pattern in enumerate(row_patterns):
+            row_bit = 1 << row_index
+            if isinstance(pattern, CoordinateRange):
+                range_masks[pattern] = range_masks.get(pattern, 0) | row_bit
+            elif not pattern.flags & ~re.UNICODE and pattern.pattern in ALWAYS_MATCHING_PATTERNS:
+                always_matching_mask |= row_bit
+            elif not pattern.flags & ~re.UNICODE and pattern.pattern in FIRST_CHARACTER_PATTERNS:
+                first_character_masks[pattern.pattern] = first_character_masks.get(pattern.pattern, 0) | row_bit
+            elif isinstance(pattern, LiteralPattern) or (
+                    isinstance(pattern.pattern, str) and not pattern.flags & ~re.UNICODE and
+                    LiteralPattern.is_literal(pattern.pattern)):
+                length_masks = literal_masks.setdefault(len(pattern.pattern), dict())
+                length_masks[pattern.pattern] = length_masks.get(pattern.pattern, 0) | row_bit
+            else:
+                pattern_masks[pattern] = pattern_masks.get(pattern, 0) | row_bit
+        self.__always_matching_masks.append(always_matching_mask)
+        self.__first_character_masks.append([(FIRST_CHARACTER_PATTERNS[pattern], row_mask)
+                                             for pattern, row_mask in first_character_masks.items()])
+        self.__field_literal_masks.append(sorted(literal_masks.items()))
+        self.__field_patterns.append(list(pattern_masks))
+        self.__field_pattern_masks.append(list(pattern_masks.values()))
+        self.__field_prefilters.append(self.__make_prefilter(list(pattern_masks)))
+        self.__field_ranges.append(list(range_masks.items()))
+        self.__field_value_masks.append(dict())
+
+    @staticmethod
+    def __make_prefilter(patterns: List[Pattern[str]]) -> Optional[Pattern[str]]:
+        """Method to combine the given regular expressions into one alternation which matches a value if any of the
+        regular expressions match it. Values which don't match the alternation don't need to be evaluated further.
+
+        Args:
+            patterns: List of the distinct regular expressions of one field.
+
+        Returns:
+            Compiled alternation or None if the regular expressions can't be combined safely.
+        """
+        if len(patterns) < 2:
+            return None
+        for pattern in patterns:
+            if not isinstance(pattern.pattern, str) or pattern.flags & ~re.UNICODE or \
+                    NOT_COMBINABLE_PATTERN.search(pattern.pattern):
+                return None
+        try:
+            return re.compile("|".join("(?:{})".format(pattern.pattern) for pattern in patterns))
+        except re.error:
+            return None
+
+    def __get_field_mask(self, field_index: int, value: Union[str, int]) -> int:
+        value_masks = self.__field_value_masks[field_index]
+        if value in value_masks:
+            return value_masks[value]
+        value_string = str(value)
+        field_mask = self.__get_pattern_mask(field_index, value_string)
+        for coordinate_range, row_mask in self.__field_ranges[field_index]:
+            if coordinate_range.match(value_string):
+                field_mask |= row_mask
+        value_masks[value] = field_mask
+        return field_mask
+
+    def __get_pattern_mask(self, field_index: int, value_string: str) -> int:
+        pattern_mask = self.__always_matching_masks[field_index]
+        for first_character_match, row_mask in self.__first_character_masks[field_index]:
+            if first_character_match(value_string):
+                pattern_mask |= row_mask
+        for literal_length, length_masks in self.__field_literal_masks[field_index]:
+            if literal_length > len(value_string):
+                break
+            pattern_mask |= length_masks.get(value_string[:literal_length], 0)
+        patterns = self.__field_patterns[field_index]
+        prefilter = self.__field_prefilters[field_index]
+        if patterns and (prefilter is None or prefilter.match(value_string)):
+            for pattern, row_mask in zip(patterns, self.__field_pattern_masks[field_index]):
+                if pattern.match(value_string):
+                    pattern_mask |= row_mask
+        return pattern_mask
+
+    def get_tile_type_mask(self, tile_name: str) -> int:
+        """Method to return the rows whose tile type regular expression matches the given tile type.
+
+        Args:
+            tile_name: Type name of a tile.
+
+        Returns:
+            Bitmask where bit i is set if the row i matches the tile type.
+        """
+        return self.__get_field_mask(0, tile_name)
+
+    def get_row_mask(self, port: Port) -> int:
+        """Method to return the rows which match the given port.
+
+        Args:
+            port: Port to be checked.
+
+        Returns:
+            Bitmask where bit i is set if the row i matches all of the fields of the port.
+        """
+        if port in self.__port_row_masks:
+            return self.__port_row_masks[port]
+        row_mask = (1 << self.__row_count) - 1
+        for field_index, value in enumerate((port.tile.name, port.tile.x, port.tile.y, port.name)):
+            row_mask &= self.__get_field_mask(field_index, value)
+            if not row_mask:
+                break
+        self.__port_row_masks[port] = row_mask
+        return row_mask
+
+    def get_row_masks(self, ports: Iterable[Port]) -> Dict[Port, int]:
+        """Method to return the matching rows of all of the given ports. Coordinate ranges are evaluated for all of the
+        distinct coordinates of the ports at once.
+
+        Args:
+            ports: Iterable of ports to be checked. Repeated ports are only checked once.
+
+        Returns:
+            Dictionary of the row bitmasks of the ports.
+        """
+        ports = set(ports)
+        for field_index, coordinate_key in ((1, "x"), (2, "y")):
+            if self.__field_ranges[field_index]:
+                self.__add_coordinate_masks(field_index, {getattr(port.tile, coordinate_key) for port in ports})
+        return {port: self.get_row_mask(port) for port in ports}
+
+    def is_matching_port(self, port: Port) -> bool:
+        """Method to check if the given port matches any of the rows of regular expressions.
+
+        Args:
+            port: Port to be checked.
+
+        Returns:
+            Boolean which says if the port matched.
+        """
+        return bool(self.get_row_mask(port))
+
+    def get_matching_ports(self, ports: Iterable[Port]) -> Set[Port]:
+        """Method to find all of the given ports which match any of the rows of regular expressions.
+
+        Args:
+            ports: Iterable of ports to be checked. Repeated ports are only checked once.
+
+        Returns:
+            Set of ports which matched.
+        """
+        if not self.__row_count:
+            return set()
+        return {port for port, row_mask in self.get_row_masks(ports).items() if row_mask}
+
+    def get_matching_catalogue_ports(self, port_catalogue: PortCatalogue, port_key_list: List[str]) -> Set[Port]:
+        """Method to find the ports of the given catalogue which match any of the rows of regular expressions. The
+        tile type regular expressions are tested once per tile type and the port regular expressions once per port
+        name of the matching tile types, so only the ports with matching tile types and names are checked further.
+
+        Args:
+            port_catalogue: Catalogue of the ports of a graph.
+            port_key_list: Key strings noting which type of ports of the connections should be matched.
+
+        Returns:
+            Set of ports which matched.
+        """
+        candidate_ports = []
+        for tile_type in port_catalogue.get_tile_types():
+            tile_type_mask = self.get_tile_type_mask(tile_type)
+            if not tile_type_mask:
+                continue
+            for port_name, ports in port_catalogue.get_port_names(tile_type).items():
+                if tile_type_mask & self.__get_field_mask(3, port_name):
+                    candidate_ports.extend(port for port in ports if any(
+                        port_catalogue.has_port_role(port, port_key) for port_key in port_key_list))
+        return self.get_matching_ports(candidate_ports)
+
+    def __add_coordinate_masks(self, field_index: int, coordinates: Set[int]) -> None:
+        """Method to evaluate the coordinate ranges of the given field for all of the given coordinates at once and
+        memoize the row masks of the coordinates.
+
+        Args:
+            field_index: Index of the tile x or tile y field.
+            coordinates: Set of coordinates of the field.
+        """
+        value_masks = self.__field_value_masks[field_index]
+        new_coordinates = [coordinate for coordinate in coordinates if coordinate not in value_masks]
+        if not new_coordinates:
+            return
+        coordinate_array = numpy.array(new_coordinates, dtype=numpy.int64)
+        range_masks = numpy.zeros(len(new_coordinates), dtype=object)
+        for coordinate_range, row_mask in self.__field_ranges[field_index]:
+            range_masks[coordinate_range.contains(coordinate_array)] |= row_mask
+        for coordinate, range_mask in zip(new_coordinates, range_masks.tolist()):
+            value_masks[coordinate] = self.__get_pattern_mask(field_index, str(coordinate)) | range_mask
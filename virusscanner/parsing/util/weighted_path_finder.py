@@ -0,0 +1,256 @@
+from collections import Counter
+from typing import Callable, Collection, Dict, List, Mapping, Optional, Tuple, TypeVar
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.parsing.util.component_finder import ComponentFinder
+from virusscanner.parsing.util.path_traversal import PathTraversal
+
+PathValue = TypeVar("PathValue")
+
+
+class WeightedPathFinder:
+    """Class for scoring the paths counted by PathCounter without listing them. The score of a path is the sum of
+    the non-negative weights of its connections.
+
+    Args:
+        adjacency_list: Adjacency list of the implemented graph.
+        begin_ports: Collection of ports from which paths must begin.
+        end_ports: Collection of ports where the paths must end.
+        get_connection_weight: Function returning the non-negative weight of the connection between the given ports.
+        max_walk_steps: Largest amount of ports added to the walked paths during one search.
+
+    """
+    DEFAULT_MAX_WALK_STEPS = 1000000
+
+    def __init__(self, adjacency_list: Mapping[Port, Tuple[Port, ...]], begin_ports: Collection[Port],
+                 end_ports: Collection[Port], get_connection_weight: Callable[[Port, Port], int],
+                 max_walk_steps: int = DEFAULT_MAX_WALK_STEPS) -> None:
+        if max_walk_steps < 0:
+            raise ValueError("Amount of walk steps can't be negative!")
+        self.__adjacency_list = adjacency_list
+        self.__begin_ports = list(begin_ports)
+        self.__end_ports = end_ports
+        self.__get_connection_weight = get_connection_weight
+        self.__connection_weights: Dict[Tuple[Port, Port], int] = dict()
+        self.__max_walk_steps = max_walk_steps
+        self.__remaining_walk_steps = max_walk_steps
+        self.__is_search_exact = True
+
+    def is_search_exact(self) -> bool:
+        """Method to check if the last search walked every path through the cyclic components.
+
+        Returns:
+            Boolean noting if the last found scores and counts are exact or only lower bounds.
+        """
+        return self.__is_search_exact
+
+    def find_best_paths(self) -> Dict[Port, Tuple[int, List[Port]]]:
+        """Method to find the highest scoring path ending in every reachable end port.
+
+        Returns:
+            Dictionary of the highest score and a path with that score keyed by the end ports.
+        """
+        best_paths: Dict[Port, Tuple[int, List[Port]]] = dict()
+        for path_values in self.__propagate_values((0, None), self.__extend_best_path, self.__merge_best_paths):
+            for end_port, path_value in path_values.items():
+                if end_port in self.__end_ports and (end_port not in best_paths or
+                                                     path_value[0] > best_paths[end_port][0]):
+                    best_paths[end_port] = (path_value[0], self.__rebuild_path(end_port, path_values))
+        return best_paths
+
+    def count_paths_over_threshold(self, score_threshold: int) -> Dict[Port, int]:
+        """Method to count the paths with a score over the given threshold ending in every end port. Paths which
+        can't pass the threshold anymore are dropped and the ones already over it share one score.
+
+        Args:
+            score_threshold: Score which the counted paths have to exceed.
+
+        Returns:
+            Dictionary of the amount of paths over the threshold keyed by the end ports.
+        """
+        exceeding_score = max(score_threshold + 1, 0)
+        max_continued_scores = self.__get_max_continued_scores()
+
+        def extend_score_counts(score_counts: Counter, weight: int, _: Tuple[Port, ...], next_port: Port) -> Counter:
+            extended_counts = Counter()
+            max_continued_score = max_continued_scores.get(next_port)
+            if max_continued_score is None:
+                return extended_counts
+            for score, path_count in score_counts.items():
+                extended_score = min(score + weight, exceeding_score)
+                if extended_score + max_continued_score > score_threshold:
+                    extended_counts[extended_score] += path_count
+            return extended_counts
+
+        def merge_score_counts(score_counts: Optional[Counter], new_counts: Counter) -> Counter:
+            return new_counts if score_counts is None else score_counts + new_counts
+
+        path_counts: Dict[Port, int] = dict()
+        for path_values in self.__propagate_values(Counter({0: 1}), extend_score_counts, merge_score_counts):
+            for end_port, score_counts in path_values.items():
+                if end_port in self.__end_ports and score_counts[exceeding_score]:
+                    path_counts[end_port] = path_counts.get(end_port, 0) + score_counts[exceeding_score]
+        return path_counts
+
+    def __get_max_continued_scores(self) -> Dict[Port, int]:
+        """Method to find an upper limit for the score of the paths continuing from every port to an end port. A
+        cyclic component adds the weights of all of its connections to the best score leaving it.
+
+        Returns:
+            Dictionary of the highest possible scores keyed by the ports from which an end port can be reached.
+        """
+        component_finder = ComponentFinder(self.__adjacency_list, self.__end_ports)
+        start_ports = list(self.__begin_ports)
+        for begin_port in self.__begin_ports:
+            if begin_port in self.__end_ports:
+                start_ports.extend(self.__adjacency_list.get(begin_port, ()))
+
+        max_scores: Dict[Port, int] = dict()
+        for component in component_finder.find_components(start_ports):
+            if component[0] in self.__end_ports:
+                max_scores[component[0]] = 0
+                continue
+            component_ports = set(component)
+            component_weight = 0
+            max_leaving_score = None
+            for port in component:
+                for next_port in component_finder.get_next_ports(port):
+                    if next_port in component_ports:
+                        if next_port != port:
+                            component_weight += self.__get_weight(port, next_port)
+                    elif next_port in max_scores:
+                        leaving_score = self.__get_weight(port, next_port) + max_scores[next_port]
+                        if max_leaving_score is None or leaving_score > max_leaving_score:
+                            max_leaving_score = leaving_score
+            if max_leaving_score is not None:
+                for port in component:
+                    max_scores[port] = component_weight + max_leaving_score
+        return max_scores
+
+    def __propagate_values(self, begin_value: PathValue,
+                           extend_value: Callable[[PathValue, int, Tuple[Port, ...], Port], PathValue],
+                           merge_values: Callable[[Optional[PathValue], PathValue], PathValue]) -> List[
+            Dict[Port, PathValue]]:
+        """Method to carry the values of the paths from the begin ports to the end ports.
+
+        Args:
+            begin_value: Value of the paths at their begin ports.
+            extend_value: Function returning the value of a path extended with the connections of the given weight
+                going through the given ports to the given next port.
+            merge_values: Function combining the values of paths ending in the same port.
+
+        Returns:
+            List of the dictionaries of the values of the paths reaching the ports.
+        """
+        self.__remaining_walk_steps = self.__max_walk_steps
+        self.__is_search_exact = True
+        propagations = []
+        continued_begin_ports = [begin_port for begin_port in self.__begin_ports if begin_port not in self.__end_ports]
+        if continued_begin_ports:
+            propagations.append(self.__propagate_from_ports(
+                {begin_port: begin_value for begin_port in continued_begin_ports}, extend_value, merge_values))
+        for begin_port in self.__begin_ports:
+            if begin_port in self.__end_ports:
+                start_values = dict()
+                for next_port in self.__adjacency_list.get(begin_port, ()):
+                    if next_port != begin_port:
+                        start_values[next_port] = merge_values(start_values.get(next_port), extend_value(
+                            begin_value, self.__get_weight(begin_port, next_port), (begin_port,), next_port))
+                propagations.append(self.__propagate_from_ports(start_values, extend_value, merge_values,
+                                                                begin_port))
+        return propagations
+
+    def __propagate_from_ports(self, start_values: Dict[Port, PathValue],
+                               extend_value: Callable[[PathValue, int, Tuple[Port, ...], Port], PathValue],
+                               merge_values: Callable[[Optional[PathValue], PathValue], PathValue],
+                               excluded_end_port: Optional[Port] = None) -> Dict[Port, PathValue]:
+        """Method to carry the values of the paths from the given ports through the components in topological order.
+
+        Args:
+            start_values: Dictionary of the values of the paths at the ports where they start.
+            extend_value: Function returning the value of a path extended with the connections of the given weight
+                going through the given ports to the given next port.
+            merge_values: Function combining the values of paths ending in the same port.
+            excluded_end_port: Optional end port the paths can't reach.
+
+        Returns:
+            Dictionary of the values of the paths reaching the ports.
+        """
+        path_values = dict(start_values)
+        component_finder = ComponentFinder(self.__adjacency_list, self.__end_ports)
+        path_traversal = PathTraversal(self.__adjacency_list)
+
+        def add_value(port: Port, next_port: Port, path_value: PathValue, path_weight: int,
+                      path_ports: Tuple[Port, ...]) -> None:
+            if next_port != excluded_end_port:
+                path_values[next_port] = merge_values(path_values.get(next_port), extend_value(
+                    path_value, path_weight + self.__get_weight(port, next_port), path_ports, next_port))
+
+        for component in reversed(component_finder.find_components(list(start_values))):
+            if len(component) == 1:
+                port = component[0]
+                if port in path_values:
+                    for next_port in component_finder.get_next_ports(port):
+                        if next_port != port:
+                            add_value(port, next_port, path_values[port], 0, (port,))
+                continue
+
+            component_ports = set(component)
+            for entry_port in component:
+                if entry_port not in path_values:
+                    continue
+                entry_value = path_values[entry_port]
+                path_weights = [0]
+
+                def enter_port(port: Port, next_port: Port, current_path: List[Port]) -> bool:
+                    if not self.__remaining_walk_steps:
+                        self.__is_search_exact = False
+                        return False
+                    self.__remaining_walk_steps -= 1
+                    if next_port in component_ports:
+                        path_weights.append(path_weights[-1] + self.__get_weight(port, next_port))
+                        return True
+                    add_value(port, next_port, entry_value, path_weights[-1], tuple(current_path[:-1]))
+                    return False
+
+                path_traversal.walk(entry_port, enter_port, leave_port=lambda port, next_port, current_path:
+                                    path_weights.pop())
+        return path_values
+
+    def __get_weight(self, port: Port, next_port: Port) -> int:
+        connection_weight = self.__connection_weights.get((port, next_port))
+        if connection_weight is None:
+            connection_weight = self.__get_connection_weight(port, next_port)
+            self.__connection_weights[(port, next_port)] = connection_weight
+        return connection_weight
+
+    @staticmethod
+    def __extend_best_path(best_path: Tuple[int, Optional[Tuple[Port, ...]]], weight: int,
+                           path_ports: Tuple[Port, ...], _: Port) -> Tuple[int, Tuple[Port, ...]]:
+        return best_path[0] + weight, path_ports
+
+    @staticmethod
+    def __merge_best_paths(best_path: Optional[Tuple[int, Optional[Tuple[Port, ...]]]],
+                           new_path: Tuple[int, Tuple[Port, ...]]) -> Tuple[int, Optional[Tuple[Port, ...]]]:
+        if best_path is None or new_path[0] > best_path[0]:
+            return new_path
+        return best_path
+
+    @staticmethod
+    def __rebuild_path(end_port: Port, best_paths: Dict[Port, Tuple[int, Optional[Tuple[Port, ...]]]]) -> List[Port]:
+        """Method to rebuild the highest scoring path to the given port.
+
+        Args:
+            end_port: Port where the path ends.
+            best_paths: Dictionary of the highest scores and the ports before them keyed by the ports.
+
+        Returns:
+            List of the ports of the path.
+        """
+        path_segments = [(end_port,)]
+        previous_ports = best_paths[end_port][1]
+        while previous_ports is not None:
+            path_segments.append(previous_ports)
+            best_path = best_paths.get(previous_ports[0])
+            previous_ports = best_path[1] if best_path is not None else None
+        return [port for path_segment in reversed(path_segments) for port in path_segment]
@@ -0,0 +1,41 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.adjacency_list import AdjacencyList
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestAdjacencyList(TestCase):
+    def setUp(self) -> None:
+        self.first_port = Port(Tile("INT", 0, 0), "FAKE_PORT")
+        self.second_port = Port(Tile("INT", 0, 1), "FAKE_PORT1")
+        self.third_port = Port(Tile("INT", 1, 1), "FAKE_PORT2")
+
+    def test_adjacency_list_keeps_edge_order(self):
+        adjacency_list = AdjacencyList([(self.first_port, self.third_port), (self.first_port, self.second_port),
+                                        (self.second_port, self.first_port)])
+
+        self.assertEqual(adjacency_list[self.first_port], (self.third_port, self.second_port))
+        self.assertEqual(list(adjacency_list), [self.first_port, self.second_port])
+        self.assertEqual(len(adjacency_list), 2)
+        self.assertIsNone(adjacency_list.get(self.third_port))
+
+    def test_remove_edge_removes_empty_rows(self):
+        adjacency_list = AdjacencyList([(self.first_port, self.second_port), (self.first_port, self.third_port)])
+        self.assertEqual(adjacency_list[self.first_port], (self.second_port, self.third_port))
+
+        adjacency_list.remove_edge(self.first_port, self.second_port)
+        self.assertEqual(adjacency_list[self.first_port], (self.third_port,))
+
+        adjacency_list.remove_edge(self.first_port, self.third_port)
+        self.assertNotIn(self.first_port, adjacency_list)
+        self.assertEqual(adjacency_list, {})
+        self.assertRaises(KeyError, adjacency_list.remove_edge, self.first_port, self.third_port)
+
+    def test_repeated_edges_are_kept_until_removed(self):
+        adjacency_list = AdjacencyList([(self.first_port, self.second_port), (self.first_port, self.third_port),
+                                        (self.first_port, self.second_port)])
+        self.assertEqual(adjacency_list[self.first_port], (self.second_port, self.second_port, self.third_port))
+
+        adjacency_list.remove_edge(self.first_port, self.second_port)
+        self.assertEqual(adjacency_list[self.first_port], (self.second_port, self.third_port))
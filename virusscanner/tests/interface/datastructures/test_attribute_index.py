@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.attribute_index import AttributeIndex
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestAttributeIndex(TestCase):
+    def setUp(self) -> None:
+        first_port = Port(Tile("INT", 1, 2), "A")
+        second_port = Port(Tile("CLEM", 1, 2), "B")
+        third_port = Port(Tile("CLEM", 1, 2), "C")
+        self.clock_connection = Connection(first_port, second_port, {"CLK"})
+        self.flip_flop_connection = Connection(second_port, third_port, {"FF", "CLK"})
+        self.plain_connection = Connection(third_port, first_port)
+        self.index_under_test = AttributeIndex([self.clock_connection, self.flip_flop_connection,
+                                                self.plain_connection])
+
+    def test_vocabulary_gives_every_attribute_a_bit(self):
+        self.assertEqual(len(self.index_under_test), 2)
+        self.assertCountEqual(self.index_under_test.get_attribute_names(), ["CLK", "FF"])
+        self.assertEqual(self.index_under_test.get_attribute_mask(["CLK", "FF", "LATCH"]), 0b11)
+        self.assertEqual(self.index_under_test.get_connection_mask(self.flip_flop_connection), 0b11)
+        self.assertEqual(self.index_under_test.get_connection_mask(self.plain_connection), 0)
+
+    def test_get_connections_finds_connections_with_any_attribute(self):
+        self.assertEqual(self.index_under_test.get_connections(["CLK", "FF"]),
+                         [self.clock_connection, self.flip_flop_connection])
+        self.assertEqual(self.index_under_test.get_connections(["FF"]), [self.flip_flop_connection])
+        self.assertEqual(self.index_under_test.get_connections(["LATCH"]), [])
+        self.assertEqual(self.index_under_test.count_connections("CLK"), 2)
+
+    def test_index_follows_added_attributes_and_removed_connections(self):
+        previous_attributes = self.plain_connection.add_attributes({"LATCH"})
+        self.index_under_test.update_connection(self.plain_connection, previous_attributes)
+        self.index_under_test.remove_connection(self.clock_connection)
+
+        self.assertEqual(self.index_under_test.get_connections(["LATCH", "CLK"]),
+                         [self.plain_connection, self.flip_flop_connection])
+        self.assertEqual(self.index_under_test.get_connection_mask(self.plain_connection), 0b100)
+
+    def test_parallel_connections_are_all_counted(self):
+        parallel_connection = Connection(self.clock_connection.begin, self.clock_connection.end, {"CLK"})
+        self.index_under_test.add_connection(parallel_connection)
+
+        self.assertEqual(self.index_under_test.count_connections("CLK"), 3)
+        self.assertEqual(self.index_under_test.get_connections(["CLK"]),
+                         [self.clock_connection, self.flip_flop_connection, parallel_connection])
+
+        self.index_under_test.remove_connection(self.clock_connection)
+
+        self.assertEqual(self.index_under_test.count_connections("CLK"), 2)
+        self.assertIs(self.index_under_test.get_connections(["CLK"])[1], parallel_connection)
@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.compact_graph import CompactGraph
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestCompactGraph(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+
+        self.graph_under_test = CompactGraph.from_connections([Connection(self.first_port, self.third_port),
+                                                               Connection(self.second_port, self.third_port),
+                                                               Connection(self.first_port, self.second_port)])
+
+    def test_from_connections_assigns_dense_ids(self):
+        self.assertEqual(self.graph_under_test.port_count, 3)
+        self.assertEqual(self.graph_under_test.edge_count, 3)
+        for port in (self.first_port, self.second_port, self.third_port):
+            self.assertIs(self.graph_under_test.ports[self.graph_under_test.get_port_id(port)], port)
+        self.assertIsNone(self.graph_under_test.get_port_id(Port(Tile("missing", 1, 1), "A")))
+
+    def test_get_adjacency_rows_keep_connection_order(self):
+        first_id, second_id, third_id = (self.graph_under_test.get_port_id(port)
+                                         for port in (self.first_port, self.second_port, self.third_port))
+
+        self.assertEqual({port_id: list(row) for port_id, row in self.graph_under_test.get_adjacency_rows().items()},
+                         {first_id: [third_id, second_id], second_id: [third_id]})
+        self.assertEqual({port_id: list(row) for port_id, row in
+                          self.graph_under_test.get_adjacency_rows(True).items()},
+                         {third_id: [first_id, second_id], second_id: [first_id]})
+
+    def test_get_adjacency_rows_handle_ports_without_connections(self):
+        adjacency_rows = self.graph_under_test.get_adjacency_rows()
+        third_id = self.graph_under_test.get_port_id(self.third_port)
+
+        self.assertNotIn(third_id, adjacency_rows)
+        self.assertEqual(adjacency_rows.get(third_id, ()), ())
+        self.assertIsNone(adjacency_rows.get(self.graph_under_test.port_count))
+        self.assertEqual(len(adjacency_rows), 2)
+        with self.assertRaises(KeyError):
+            _ = adjacency_rows[third_id]
@@ -0,0 +1,64 @@
+import json
+import pickle
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.dataclassesjson import DataClassesJSONEncoder
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestConnection(TestCase):
+    def setUp(self) -> None:
+        self.first_port = Port(Tile("INT", 1, 0), "FAKE_PORT")
+        self.second_port = Port(Tile("CLEM", 2, 50), "FAKE_PORT1")
+
+    def test_connection_equality_ignores_attributes(self):
+        first_connection = Connection(self.first_port, self.second_port, {"FF"})
+        second_connection = Connection(self.first_port, self.second_port)
+
+        self.assertEqual(first_connection, second_connection)
+        self.assertEqual(hash(first_connection), hash(second_connection))
+        self.assertNotEqual(first_connection, Connection(self.second_port, self.first_port))
+        self.assertEqual(second_connection.attributes, set())
+
+    def test_connections_without_attributes_share_empty_set(self):
+        first_connection = Connection(self.first_port, self.second_port, {"FF"})
+
+        self.assertIs(Connection(self.first_port, self.second_port).attributes,
+                      Connection(self.second_port, self.first_port, set()).attributes)
+        with self.assertRaises(AttributeError):
+            first_connection.attributes.add("CLK")
+
+    def test_add_attributes_replaces_attributes_of_one_connection(self):
+        first_connection = Connection(self.first_port, self.second_port, {"FF"})
+        second_connection = Connection(self.second_port, self.first_port, {"FF"})
+
+        self.assertEqual(first_connection.add_attributes(["CLK"]), {"FF"})
+        self.assertEqual(first_connection.attributes, {"FF", "CLK"})
+        self.assertEqual(second_connection.attributes, {"FF"})
+
+    def test_connection_is_mutable_and_keeps_its_hash(self):
+        connection_under_test = Connection(self.first_port, self.second_port)
+        connection_hash = hash(connection_under_test)
+
+        connection_under_test.attributes = frozenset({"FF"})
+        connection_under_test.add_attributes(["CLK"])
+
+        self.assertEqual(connection_under_test.attributes, {"FF", "CLK"})
+        self.assertEqual(hash(connection_under_test), connection_hash)
+
+    def test_connection_str_is_correct(self):
+        connection_under_test = Connection(self.first_port, self.second_port)
+        self.assertEqual(str(connection_under_test), "INT_X1Y0 FAKE_PORT -> CLEM_X2Y50 FAKE_PORT1")
+        self.assertFalse(hasattr(connection_under_test, "__dict__"))
+
+    def test_connection_json_and_pickle_round_trip(self):
+        connection_under_test = Connection(self.first_port, self.second_port, {"FF"})
+
+        self.assertEqual(json.loads(json.dumps(connection_under_test, cls=DataClassesJSONEncoder)),
+                         dict(begin=dict(tile=dict(name="INT", x=1, y=0), name="FAKE_PORT"),
+                              end=dict(tile=dict(name="CLEM", x=2, y=50), name="FAKE_PORT1"), attributes=["FF"]))
+        unpickled_connection = pickle.loads(pickle.dumps(connection_under_test))
+        self.assertEqual(unpickled_connection, connection_under_test)
+        self.assertEqual(unpickled_connection.attributes, {"FF"})
@@ -3,6 +3,7 @@ from unittest import TestCase, mock
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.implementation_graph import Graph
 from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.spatial_index import Region
 from virusscanner.interface.datastructures.tile import Tile
 
 
@@ -37,8 +38,8 @@ class TestGraph(TestCase):
 
         self.assertEqual(self.graph_under_test.get_adjacency_list(), expected_adjacency_list)
         self.assertEqual(self.graph_under_test.get_adjacency_list(True), expected_reverse_adjacency_list)
-        self.assertNotEqual(self.graph_under_test.get_adjacency_list(), initial_adjacency_list)
-        self.assertNotEqual(self.graph_under_test.get_adjacency_list(True), initial_reverse_adjacency_list)
+        self.assertIs(self.graph_under_test.get_adjacency_list(), initial_adjacency_list)
+        self.assertIs(self.graph_under_test.get_adjacency_list(True), initial_reverse_adjacency_list)
 
     def test_remove_connection_update_visible_in_adjacency_list(self):
         initial_adjacency_list = self.graph_under_test.get_adjacency_list()
@@ -55,5 +56,198 @@ class TestGraph(TestCase):
 
         self.assertEqual(self.graph_under_test.get_adjacency_list(), expected_adjacency_list)
         self.assertEqual(self.graph_under_test.get_adjacency_list(True), expected_reverse_adjacency_list)
-        self.assertNotEqual(self.graph_under_test.get_adjacency_list(), initial_adjacency_list)
-        self.assertNotEqual(self.graph_under_test.get_adjacency_list(True), initial_reverse_adjacency_list)
+        self.assertIs(self.graph_under_test.get_adjacency_list(), initial_adjacency_list)
+        self.assertIs(self.graph_under_test.get_adjacency_list(True), initial_reverse_adjacency_list)
+
+    def test_remove_connection_raises_error_with_missing_connection(self):
+        self.assertRaises(ValueError, self.graph_under_test.remove_connection,
+                          Connection(self.second_port, self.first_port))
+
+    def test_duplicate_connections_are_kept(self):
+        duplicate_connection = Connection(self.first_port, self.second_port, {"ANOTHER_ATTRIBUTE"})
+        self.graph_under_test.get_adjacency_list()
+        self.graph_under_test.add_connection(duplicate_connection)
+
+        self.assertEqual(self.graph_under_test.connections, [self.initial_connection, duplicate_connection])
+        self.assertEqual(self.graph_under_test.connections[1].attributes, {"ANOTHER_ATTRIBUTE"})
+        self.assertEqual(self.graph_under_test.get_adjacency_list(), {self.first_port: (self.second_port,
+                                                                                        self.second_port)})
+
+        self.graph_under_test.remove_connection(Connection(self.first_port, self.second_port))
+
+        self.assertIs(self.graph_under_test.connections[0], duplicate_connection)
+        self.assertTrue(self.graph_under_test.has_connection(self.initial_connection))
+        self.assertEqual(self.graph_under_test.get_adjacency_list(), {self.first_port: (self.second_port,)})
+
+    def test_add_attributes_adds_attributes_to_duplicate_connections(self):
+        duplicate_connection = Connection(self.first_port, self.second_port)
+        self.graph_under_test.add_connection(duplicate_connection)
+        attribute_index = self.graph_under_test.get_attribute_index()
+
+        self.graph_under_test.add_attributes(Connection(self.first_port, self.second_port), {"FF"})
+
+        self.assertEqual(self.initial_connection.attributes, {"FAKE_ATTRIBUTE", "FF"})
+        self.assertEqual(duplicate_connection.attributes, {"FF"})
+        self.assertEqual(attribute_index.get_connections(["FF"]), [self.initial_connection, duplicate_connection])
+        self.assertEqual(attribute_index.count_connections("FF"), 2)
+
+        self.graph_under_test.remove_connection(self.initial_connection)
+
+        self.assertEqual(len(attribute_index.get_connections(["FF"])), 1)
+        self.assertIs(attribute_index.get_connections(["FF"])[0], duplicate_connection)
+        self.assertEqual(attribute_index.count_connections("FF"), 1)
+        self.assertEqual(attribute_index.get_connections(["FAKE_ATTRIBUTE"]), [])
+
+    def test_attribute_sets_are_interned_per_graph(self):
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        new_connection = Connection(self.second_port, third_port, ["FAKE_ATTRIBUTE"])
+        self.graph_under_test.add_connection(new_connection)
+
+        self.assertIs(new_connection.attributes, self.initial_connection.attributes)
+
+        self.graph_under_test.add_attributes(self.initial_connection, {"FF"})
+        self.graph_under_test.add_attributes(new_connection, {"FF"})
+        another_graph = Graph([Connection(self.first_port, self.second_port, {"FAKE_ATTRIBUTE", "FF"})])
+
+        self.assertIs(new_connection.attributes, self.initial_connection.attributes)
+        self.assertEqual(another_graph.connections[0].attributes, new_connection.attributes)
+        self.assertIsNot(another_graph.connections[0].attributes, new_connection.attributes)
+
+    def test_graph_equality_and_repr_use_connections_and_lut_values(self):
+        equal_graph = Graph([Connection(self.first_port, self.second_port)], {"fake_tile": {"fake_lut": "11"}})
+
+        self.assertEqual(self.graph_under_test, equal_graph)
+        self.assertNotEqual(self.graph_under_test, Graph([self.initial_connection]))
+        self.assertEqual(repr(self.graph_under_test), "Graph(connections={}, lut_values={})".format(
+            [self.initial_connection], self.initial_lut_values))
+
+    def test_batch_update_rebuilds_adjacency_list_after_changes(self):
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.get_adjacency_list()
+
+        with self.graph_under_test.batch_update():
+            self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+            self.graph_under_test.add_connection(Connection(third_port, self.first_port))
+            self.graph_under_test.remove_connection(self.initial_connection)
+            self.assertEqual(len(self.graph_under_test.connections), 2)
+
+        self.assertEqual(self.graph_under_test.connections, [Connection(self.second_port, third_port),
+                                                             Connection(third_port, self.first_port)])
+        self.assertEqual(self.graph_under_test.get_adjacency_list(),
+                         {self.second_port: (third_port,), third_port: (self.first_port,)})
+        self.assertEqual(self.graph_under_test.get_adjacency_list(True),
+                         {third_port: (self.second_port,), self.first_port: (third_port,)})
+        self.assertTrue(self.graph_under_test.has_connection(Connection(third_port, self.first_port)))
+        self.assertFalse(self.graph_under_test.has_connection(self.initial_connection))
+
+    def test_removed_connections_are_left_out_when_connections_are_read(self):
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        second_connection = Connection(self.second_port, third_port)
+        self.graph_under_test.add_connection(second_connection)
+        self.graph_under_test.add_connection(self.initial_connection)
+        self.graph_under_test.add_connection(Connection(third_port, self.first_port))
+
+        self.graph_under_test.remove_connection(self.initial_connection)
+        self.graph_under_test.remove_connection(second_connection)
+        self.graph_under_test.add_connection(second_connection)
+
+        self.assertEqual(self.graph_under_test.connections, [self.initial_connection,
+                                                             Connection(third_port, self.first_port),
+                                                             second_connection])
+        self.assertIs(self.graph_under_test.connections[0], self.initial_connection)
+
+    def test_get_port_finds_ports_of_added_connections(self):
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+
+        self.assertIs(self.graph_under_test.get_port("fake_tile", 0, 1, "fake_name"), self.first_port)
+        self.assertIs(self.graph_under_test.get_port("third_tile", 2, 3, "third_name"), third_port)
+        self.assertIsNone(self.graph_under_test.get_port("third_tile", 3, 2, "third_name"))
+
+    def test_get_port_forgets_ports_of_removed_connections(self):
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+
+        self.graph_under_test.remove_connection(self.initial_connection)
+
+        self.assertIsNone(self.graph_under_test.get_port("fake_tile", 0, 1, "fake_name"))
+        self.assertIs(self.graph_under_test.get_port("another_tile", 1, 0, "another_name"), self.second_port)
+
+    def test_graph_interns_ports_of_given_connections(self):
+        first_connection = Connection(Port(Tile("fake_tile", 0, 1), "fake_name"), self.second_port)
+        second_connection = Connection(self.second_port, Port(Tile("fake_tile", 0, 1), "fake_name"))
+        third_connection = Connection(Port(Tile("fake_tile", 0, 1), "third_name"), self.second_port)
+        graph = Graph([first_connection, second_connection])
+        graph.add_connection(third_connection)
+
+        self.assertIs(graph.connections[0], first_connection)
+        self.assertIs(graph.connections[2], third_connection)
+        self.assertIs(second_connection.end, first_connection.begin)
+        self.assertIs(third_connection.begin.tile, first_connection.begin.tile)
+        self.assertIs(graph.get_port("fake_tile", 0, 1, "fake_name"), first_connection.begin)
+
+    def test_get_compact_graph_is_rebuilt_after_changes(self):
+        compact_graph = self.graph_under_test.get_compact_graph()
+        self.assertIs(self.graph_under_test.get_compact_graph(), compact_graph)
+        self.assertEqual(compact_graph.ports, [self.first_port, self.second_port])
+
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+
+        self.assertIsNot(self.graph_under_test.get_compact_graph(), compact_graph)
+        self.assertEqual(self.graph_under_test.get_compact_graph().edge_count, 2)
+
+    def test_get_spatial_index_is_rebuilt_after_changes(self):
+        spatial_index = self.graph_under_test.get_spatial_index()
+        self.assertIs(self.graph_under_test.get_spatial_index(), spatial_index)
+
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+
+        self.assertIsNot(self.graph_under_test.get_spatial_index(), spatial_index)
+        self.assertCountEqual(self.graph_under_test.get_spatial_index().get_ports(Region(1, 0, 2, 3)),
+                              [self.second_port, third_port])
+
+    def test_attribute_index_is_updated_with_graph(self):
+        attribute_index = self.graph_under_test.get_attribute_index()
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        new_connection = Connection(self.second_port, third_port, {"FF"})
+
+        self.graph_under_test.add_connection(new_connection)
+        self.graph_under_test.add_attributes(Connection(self.first_port, self.second_port), {"FF"})
+        self.graph_under_test.add_attributes(Connection(self.second_port, third_port), {"CLK"})
+
+        self.assertIs(self.graph_under_test.get_attribute_index(), attribute_index)
+        self.assertEqual(attribute_index.get_connections(["FF"]), [new_connection, self.initial_connection])
+        self.assertEqual(attribute_index.get_connections(["CLK"]), [new_connection])
+
+        self.graph_under_test.remove_connection(Connection(self.second_port, third_port))
+
+        self.assertEqual(attribute_index.get_connections(["FF", "CLK"]), [self.initial_connection])
+
+    def test_add_attributes_raises_error_for_missing_connection(self):
+        with self.assertRaises(ValueError):
+            self.graph_under_test.add_attributes(Connection(self.second_port, self.first_port), {"FF"})
+
+    def test_get_port_catalogue_is_rebuilt_after_changes(self):
+        port_catalogue = self.graph_under_test.get_port_catalogue()
+        self.assertIs(self.graph_under_test.get_port_catalogue(), port_catalogue)
+
+        third_port = Port(Tile("third_tile", 2, 3), "third_name")
+        self.graph_under_test.add_connection(Connection(self.second_port, third_port))
+
+        self.assertIsNot(self.graph_under_test.get_port_catalogue(), port_catalogue)
+        self.assertEqual(self.graph_under_test.get_port_catalogue().get_port_names("third_tile"),
+                         {"third_name": [third_port]})
+
+    def test_get_region_subgraph_copies_connections_of_region(self):
+        third_port = Port(Tile("fake_tile", 0, 1), "third_name")
+        self.graph_under_test.add_connection(Connection(self.first_port, third_port, {"FAKE_ATTRIBUTE"}))
+        self.graph_under_test.lut_values["fake_tile_X0Y1"] = {"fake_lut": "10"}
+
+        region_subgraph = self.graph_under_test.get_region_subgraph(Region(0, 1, 0, 1))
+        region_subgraph.add_attributes(region_subgraph.connections[0], {"NEW_ATTRIBUTE"})
+
+        self.assertEqual(region_subgraph.connections, [Connection(self.first_port, third_port)])
+        self.assertEqual(region_subgraph.lut_values, {"fake_tile_X0Y1": {"fake_lut": "10"}})
+        self.assertEqual(self.graph_under_test.connections[1].attributes, {"FAKE_ATTRIBUTE"})
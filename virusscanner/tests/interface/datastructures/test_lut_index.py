@@ -0,0 +1,34 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.lut_index import LUTFunction, LUTIndex
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestLUTIndex(TestCase):
+    def setUp(self) -> None:
+        self.lut_tile = Tile("CLEM", 2, 50)
+        self.lut_index = LUTIndex({"CLEM_X2Y50": {"A_O": "0110", "B_O": ""}, "CLEL_R_X3Y4": {"A_O": "01"}})
+
+    def test_from_truth_table_decodes_lut_value(self):
+        lut_function = LUTFunction.from_truth_table("0010")
+        self.assertEqual(lut_function.mask, 0b0100)
+        self.assertEqual(lut_function.input_count, 2)
+        self.assertEqual(lut_function.truth_table, "0010")
+
+    def test_get_lut_function_returns_function_of_lut_hops(self):
+        lut_function = self.lut_index.get_lut_function(Port(self.lut_tile, "A1"), Port(Tile("CLEM", 2, 50), "A_O"))
+
+        self.assertEqual(lut_function, LUTFunction("0110", 0b0110, 2))
+        self.assertEqual(self.lut_index.get_lut_function(Port(Tile("CLEL_R", 3, 4), "A1"),
+                                                         Port(Tile("CLEL_R", 3, 4), "A_O")).truth_table, "01")
+        self.assertTrue(self.lut_index.is_lut_tile(self.lut_tile))
+        self.assertEqual(len(self.lut_index), 2)
+
+    def test_get_lut_function_returns_none_without_lut_hop(self):
+        self.assertIsNone(self.lut_index.get_lut_function(Port(self.lut_tile, "A1"), Port(self.lut_tile, "B_O")))
+        self.assertIsNone(self.lut_index.get_lut_function(Port(self.lut_tile, "A1"), Port(self.lut_tile, "C_O")))
+        self.assertIsNone(self.lut_index.get_lut_function(Port(Tile("INT", 2, 50), "A1"),
+                                                          Port(self.lut_tile, "A_O")))
+        self.assertIsNone(self.lut_index.get_lut_function(Port(Tile("INT", 2, 50), "A1"),
+                                                          Port(Tile("INT", 2, 50), "A_O")))
@@ -0,0 +1,38 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_catalogue import PortCatalogue
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestPortCatalogue(TestCase):
+    def setUp(self) -> None:
+        self.int_port = Port(Tile("INT", 1, 2), "VCC_WIRE")
+        self.other_int_port = Port(Tile("INT", 5, 2), "VCC_WIRE")
+        self.cle_port = Port(Tile("CLEM", 1, 2), "CLE_CLE_M_SITE_0_AQ")
+        self.catalogue_under_test = PortCatalogue([Connection(self.int_port, self.cle_port),
+                                                   Connection(self.cle_port, self.other_int_port),
+                                                   Connection(self.other_int_port, self.int_port)])
+
+    def test_get_tile_types_keeps_order_of_first_use(self):
+        self.assertEqual(self.catalogue_under_test.get_tile_types(), ["INT", "CLEM"])
+        self.assertEqual(len(self.catalogue_under_test), 3)
+
+    def test_get_port_names_groups_ports_by_name(self):
+        self.assertEqual(self.catalogue_under_test.get_port_names("INT"),
+                         {"VCC_WIRE": [self.int_port, self.other_int_port]})
+        self.assertEqual(self.catalogue_under_test.get_port_names("BRAM"), dict())
+
+    def test_has_port_role_notes_connection_ends(self):
+        one_way_catalogue = PortCatalogue([Connection(self.int_port, self.cle_port)])
+
+        self.assertTrue(one_way_catalogue.has_port_role(self.int_port, "begin"))
+        self.assertFalse(one_way_catalogue.has_port_role(self.int_port, "end"))
+        self.assertTrue(one_way_catalogue.has_port_role(self.cle_port, "end"))
+        self.assertFalse(one_way_catalogue.has_port_role(self.other_int_port, "begin"))
+
+    def test_get_tile_type_counts_counts_ports_and_connections(self):
+        self.assertEqual(self.catalogue_under_test.get_tile_type_counts(),
+                         {"CLEM": (1, 1, 1), "INT": (2, 2, 2)})
+        self.assertEqual(list(self.catalogue_under_test.get_tile_type_counts()), ["CLEM", "INT"])
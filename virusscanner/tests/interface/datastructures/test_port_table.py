@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_table import PortTable
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestPortTable(TestCase):
+    def test_get_port_returns_same_object_for_equal_ports(self):
+        port_table = PortTable()
+        first_port = port_table.intern_port(port_table.get_port("fake_tile", 1, 2, "fake_port"))
+        second_port = port_table.get_port("fake_tile", 1, 2, "fake_port")
+
+        self.assertIs(first_port, second_port)
+        self.assertEqual(first_port, Port(Tile("fake_tile", 1, 2), "fake_port"))
+
+    def test_get_port_does_not_add_ports(self):
+        port_table = PortTable()
+        new_port = port_table.get_port("fake_tile", 1, 2, "fake_port")
+
+        self.assertEqual(len(port_table), 0)
+        self.assertIsNone(port_table.find_port("fake_tile", 1, 2, "fake_port"))
+        self.assertIsNot(port_table.get_tile("fake_tile", 1, 2), new_port.tile)
+        self.assertIs(port_table.intern_port(new_port), new_port)
+        self.assertEqual(len(port_table), 1)
+        self.assertIs(port_table.get_tile("fake_tile", 1, 2), new_port.tile)
+
+    def test_get_port_shares_tiles_between_ports(self):
+        port_table = PortTable()
+        first_port = port_table.intern_port(port_table.get_port("fake_tile", 1, 2, "fake_port"))
+        second_port = port_table.get_port("fake_tile", 1, 2, "another_port")
+
+        self.assertIsNot(first_port, second_port)
+        self.assertIs(first_port.tile, second_port.tile)
+
+    def test_intern_port_returns_existing_port(self):
+        port_table = PortTable()
+        existing_port = port_table.intern_port(Port(Tile("fake_tile", 1, 2), "fake_port"))
+
+        self.assertIs(port_table.intern_port(Port(Tile("fake_tile", 1, 2), "fake_port")), existing_port)
+
+    def test_intern_port_uses_interned_tile(self):
+        port_table = PortTable()
+        existing_port = port_table.intern_port(Port(Tile("fake_tile", 1, 2), "fake_port"))
+        interned_port = port_table.intern_port(Port(Tile("fake_tile", 1, 2), "another_port"))
+
+        self.assertEqual(interned_port, Port(Tile("fake_tile", 1, 2), "another_port"))
+        self.assertIs(interned_port.tile, existing_port.tile)
+
+    def test_find_port_does_not_add_ports(self):
+        port_table = PortTable()
+        expected_port = port_table.intern_port(port_table.get_port("fake_tile", 1, 2, "fake_port"))
+
+        self.assertIs(port_table.find_port("fake_tile", 1, 2, "fake_port"), expected_port)
+        self.assertIsNone(port_table.find_port("fake_tile", 2, 1, "fake_port"))
+        self.assertEqual(list(port_table), [expected_port])
+
+    def test_release_port_forgets_port_after_last_use(self):
+        port_table = PortTable()
+        first_port = port_table.intern_port(Port(Tile("fake_tile", 1, 2), "fake_port"))
+        port_table.intern_port(Port(Tile("fake_tile", 1, 2), "fake_port"))
+
+        port_table.release_port(first_port)
+        self.assertIs(port_table.find_port("fake_tile", 1, 2, "fake_port"), first_port)
+
+        port_table.release_port(first_port)
+        self.assertIsNone(port_table.find_port("fake_tile", 1, 2, "fake_port"))
+        self.assertEqual(len(port_table), 0)
+        self.assertIsNot(port_table.get_tile("fake_tile", 1, 2), first_port.tile)
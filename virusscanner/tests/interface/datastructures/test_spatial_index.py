@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.spatial_index import Region, SpatialIndex
+from virusscanner.interface.datastructures.tile import Tile
+
+
+class TestSpatialIndex(TestCase):
+    def setUp(self) -> None:
+        self.inside_port = Port(Tile("INT", 2, 3), "A")
+        self.another_inside_port = Port(Tile("CLEM", 9, 12), "B")
+        self.outside_port = Port(Tile("INT", 30, 3), "C")
+        self.inside_connection = Connection(self.inside_port, self.another_inside_port)
+        self.outgoing_connection = Connection(self.another_inside_port, self.outside_port)
+        self.incoming_connection = Connection(self.outside_port, self.inside_port)
+        self.tile_connection = Connection(self.inside_port, Port(Tile("INT", 2, 3), "D"))
+        self.index_under_test = SpatialIndex([self.inside_connection, self.outgoing_connection,
+                                              self.incoming_connection, self.tile_connection], bucket_size=4)
+        self.region = Region(0, 0, 10, 20)
+
+    def test_region_contains_tiles_inside_limits(self):
+        self.assertTrue(Region(2, 3, 2, 3).contains(self.inside_port.tile))
+        self.assertFalse(Region(3, None, None, None).contains(self.inside_port.tile))
+        self.assertTrue(Region(None, None, None, 3).contains(self.inside_port.tile))
+
+    def test_get_tiles_finds_tiles_in_region(self):
+        self.assertCountEqual(self.index_under_test.get_tiles(self.region),
+                              [self.inside_port.tile, self.another_inside_port.tile])
+        self.assertEqual(len(self.index_under_test), 3)
+
+    def test_get_ports_finds_ports_in_open_region(self):
+        self.assertCountEqual(self.index_under_test.get_ports(Region(None, 3, None, 3)),
+                              [self.inside_port, self.tile_connection.end, self.outside_port])
+
+    def test_get_connections_finds_connections_inside_region(self):
+        self.assertCountEqual(self.index_under_test.get_connections(self.region),
+                              [self.inside_connection, self.tile_connection])
+
+    def test_get_crossing_connections_finds_connections_with_one_port_inside(self):
+        self.assertCountEqual(self.index_under_test.get_crossing_connections(self.region),
+                              [self.outgoing_connection, self.incoming_connection])
+
+    def test_empty_index_finds_nothing(self):
+        self.assertEqual(list(SpatialIndex([]).get_ports(self.region)), [])
+
+    def test_bucket_size_has_to_be_positive(self):
+        with self.assertRaises(ValueError):
+            SpatialIndex([], bucket_size=0)
@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 
 from virusscanner.interface.datastructures.tile import Tile
@@ -19,3 +20,12 @@ class TestTile(TestCase):
         self.assertEqual(tile_under_test.name, tile_name)
         self.assertEqual(tile_under_test.x, tile_x)
         self.assertEqual(tile_under_test.y, tile_y)
+
+    def test_tile_is_slotted_and_picklable(self):
+        tile_under_test = Tile("fake_tile", 2, 1)
+        self.assertFalse(hasattr(tile_under_test, "__dict__"))
+        self.assertIs(str(tile_under_test), str(tile_under_test))
+
+        unpickled_tile = pickle.loads(pickle.dumps(tile_under_test))
+        self.assertEqual(unpickled_tile, tile_under_test)
+        self.assertEqual(hash(unpickled_tile), hash(tile_under_test))
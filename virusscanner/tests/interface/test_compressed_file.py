@@ -0,0 +1,44 @@
+import bz2
+import gzip
+import lzma
+import os
+import tempfile
+import zipfile
+from unittest import TestCase
+
+from virusscanner.interface.compressed_file import is_compressed_file, open_text_file
+
+
+class TestCompressedFile(TestCase):
+
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.directory = temporary_directory.name
+        self.file_content = '{"CONNECTIONS": []}'
+
+    def test_open_text_file_decompresses_files(self):
+        for file_name, compressed_file_opener in (("design.json.gz", gzip.open), ("design.json.bz2", bz2.open),
+                                                  ("design.json.xz", lzma.open), ("design.json", open)):
+            file_path = os.path.join(self.directory, file_name)
+            with compressed_file_opener(file_path, "wt") as file_handle:
+                file_handle.write(self.file_content)
+            with open_text_file(file_path) as file_handle:
+                self.assertEqual(file_handle.read(), self.file_content)
+            self.assertEqual(is_compressed_file(file_path), file_name != "design.json")
+
+    def test_open_text_file_reads_single_file_zip(self):
+        file_path = os.path.join(self.directory, "design.zip")
+        with zipfile.ZipFile(file_path, "w") as zip_file:
+            zip_file.writestr("design/", "")
+            zip_file.writestr("design/design.json", self.file_content)
+        with open_text_file(file_path) as file_handle:
+            self.assertEqual(file_handle.read(), self.file_content)
+        self.assertTrue(is_compressed_file(file_path))
+
+    def test_open_text_file_raises_error_with_multiple_file_zip(self):
+        file_path = os.path.join(self.directory, "design.zip")
+        with zipfile.ZipFile(file_path, "w") as zip_file:
+            zip_file.writestr("design.json", self.file_content)
+            zip_file.writestr("other.json", self.file_content)
+        self.assertRaises(ValueError, open_text_file, file_path)
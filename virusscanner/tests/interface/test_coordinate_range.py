@@ -0,0 +1,44 @@
+import pickle
+from unittest import TestCase
+
+import numpy
+
+from virusscanner.interface.coordinate_range import CoordinateRange
+
+
+class TestCoordinateRange(TestCase):
+    def test_from_string_parses_inclusive_ranges(self):
+        self.assertEqual(CoordinateRange.from_string("10..40"), CoordinateRange("10..40", 10, 40))
+        self.assertEqual(CoordinateRange.from_string("10.."), CoordinateRange("10..", 10, None))
+        self.assertEqual(CoordinateRange.from_string(" ..-4 "), CoordinateRange(" ..-4 ", None, -4))
+
+    def test_from_string_parses_comparisons(self):
+        self.assertEqual(CoordinateRange.from_string(">=12"), CoordinateRange(">=12", 12, None))
+        self.assertEqual(CoordinateRange.from_string(">12"), CoordinateRange(">12", 13, None))
+        self.assertEqual(CoordinateRange.from_string("<=12"), CoordinateRange("<=12", None, 12))
+        self.assertEqual(CoordinateRange.from_string("<12"), CoordinateRange("<12", None, 11))
+
+    def test_from_string_returns_nothing_for_regular_expressions(self):
+        for range_string in (r"\d+", "..", "1.2", "=12", "1[0-9]"):
+            self.assertIsNone(CoordinateRange.from_string(range_string))
+
+    def test_match_checks_coordinate_strings(self):
+        coordinate_range = CoordinateRange.from_string("10..40")
+
+        self.assertTrue(coordinate_range.match("10"))
+        self.assertTrue(coordinate_range.match("40"))
+        self.assertFalse(coordinate_range.match("41"))
+        self.assertFalse(coordinate_range.match("fake"))
+
+    def test_contains_checks_coordinate_arrays(self):
+        coordinates = numpy.array([-1, 10, 25, 40, 41])
+
+        self.assertEqual(CoordinateRange.from_string("10..40").contains(coordinates).tolist(),
+                         [False, True, True, True, False])
+        self.assertEqual(CoordinateRange.from_string("<25").contains(coordinates).tolist(),
+                         [True, True, False, False, False])
+
+    def test_range_can_be_pickled(self):
+        coordinate_range = CoordinateRange.from_string(">=12")
+
+        self.assertEqual(pickle.loads(pickle.dumps(coordinate_range)), coordinate_range)
@@ -1,15 +1,17 @@
 import re
 from unittest import TestCase, mock
 
+from virusscanner.interface.coordinate_range import CoordinateRange
 from virusscanner.interface.csv_reader import CSVInput
+from virusscanner.interface.literal_pattern import LiteralPattern
 
 
 class TestCSVInput(TestCase):
     def test_get_regexps_list_from_file_finds_regex(self):
         regex_key = "fake"
         another_regex_key = "another_fake"
-        expected_string = "some_name"
-        another_expected_string = "other_name"
+        expected_string = "some_.*"
+        another_expected_string = r"other_\d+"
         read_data = regex_key + "," + another_regex_key + "\n" + expected_string + "," + another_expected_string
         with mock.patch("virusscanner.interface.csv_reader.open", mock.mock_open(read_data=read_data)):
             test_csv_reader = CSVInput()
@@ -38,3 +40,21 @@ class TestCSVInput(TestCase):
             test_csv_reader = CSVInput()
             test_csv_reader.REGEX_KEY_SET = (regex_key,)
             self.assertEqual(test_csv_reader.get_regexps_list_from_file("some_file"), [])
+
+    def test_get_regexps_list_from_file_finds_literals(self):
+        read_data = "tile_type,tile_x,tile_y,port\nINT,12,7,VCC_WIRE\nINT,12,7,VCC_WIRE$"
+        with mock.patch("virusscanner.interface.csv_reader.open", mock.mock_open(read_data=read_data)):
+            self.assertEqual(CSVInput().get_regexps_list_from_file("some_file"),
+                             [{"tile_type": LiteralPattern("INT"), "tile_x": LiteralPattern("12"),
+                               "tile_y": LiteralPattern("7"), "port": LiteralPattern("VCC_WIRE")},
+                              {"tile_type": LiteralPattern("INT"), "tile_x": LiteralPattern("12"),
+                               "tile_y": LiteralPattern("7"), "port": re.compile(r"VCC_WIRE$")}])
+
+    def test_get_regexps_list_from_file_finds_coordinate_ranges(self):
+        read_data = "tile_type,tile_x,tile_y\nINT,10..40,>=12\nCLE,\\d+,1.2"
+        with mock.patch("virusscanner.interface.csv_reader.open", mock.mock_open(read_data=read_data)):
+            self.assertEqual(CSVInput().get_regexps_list_from_file("some_file"),
+                             [{"tile_type": LiteralPattern("INT"), "tile_x": CoordinateRange("10..40", 10, 40),
+                               "tile_y": CoordinateRange(">=12", 12, None)},
+                              {"tile_type": LiteralPattern("CLE"), "tile_x": re.compile(r"\d+"),
+                               "tile_y": re.compile(r"1.2")}])
@@ -0,0 +1,80 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.interface.graph_cache import GraphCache
+
+
+class TestGraphCache(TestCase):
+
+    def setUp(self) -> None:
+        temporary_directory = tempfile.TemporaryDirectory()
+        self.addCleanup(temporary_directory.cleanup)
+        self.json_file = os.path.join(temporary_directory.name, "design.json")
+        with open(self.json_file, "w") as json_file_handle:
+            json_file_handle.write("{}")
+
+        port1 = Port(Tile("INT", 1, 0), "FAKE_PORT")
+        port2 = Port(Tile("INT", 0, 0), "FAKE_PORT1")
+        port3 = Port(Tile("CLEM", 2, 50), "FAKE_PORT2")
+        self.graph = Graph(connections=[Connection(port1, port2), Connection(port3, port2, {"FF", "FAKE_ATTRIBUTE"}),
+                                        Connection(port2, port1, {"FF"})],
+                           lut_values={"CLEM_X2Y50": {"A6LUT": "0110", "B6LUT": "1"}})
+
+    def test_load_graph_returns_saved_graph(self):
+        graph_cache = GraphCache(self.json_file)
+        self.assertFalse(graph_cache.is_valid())
+        graph_cache.save_graph(self.graph)
+        self.assertTrue(graph_cache.is_valid())
+
+        loaded_graph = graph_cache.load_graph()
+        self.assertEqual(loaded_graph, self.graph)
+        self.assertEqual([connection.attributes for connection in loaded_graph.connections],
+                         [set(), {"FF", "FAKE_ATTRIBUTE"}, {"FF"}])
+        self.assertEqual(dict(loaded_graph.get_adjacency_list()), dict(self.graph.get_adjacency_list()))
+        self.assertEqual(dict(loaded_graph.get_adjacency_list(True)), dict(self.graph.get_adjacency_list(True)))
+        self.assertIs(loaded_graph.get_port("INT", 0, 0, "FAKE_PORT1"), loaded_graph.connections[0].end)
+
+    def test_is_valid_returns_false_after_json_file_changes(self):
+        graph_cache = GraphCache(self.json_file)
+        graph_cache.save_graph(self.graph)
+        with open(self.json_file, "w") as json_file_handle:
+            json_file_handle.write('{"CONNECTIONS": []}')
+        self.assertFalse(graph_cache.is_valid())
+
+    def test_load_graph_uses_saved_compact_graph(self):
+        graph_cache = GraphCache(self.json_file)
+        graph_cache.save_graph(self.graph)
+
+        loaded_graph = graph_cache.load_graph()
+        compact_graph = loaded_graph.get_compact_graph()
+        expected_compact_graph = self.graph.get_compact_graph()
+        self.assertIsInstance(compact_graph.forward_targets, memoryview)
+        self.assertEqual(compact_graph.ports, expected_compact_graph.ports)
+        self.assertIs(compact_graph.ports[0], loaded_graph.connections[0].begin)
+        for is_reverse in (False, True):
+            self.assertEqual({port_id: list(adjacent_ids) for port_id, adjacent_ids in
+                              compact_graph.get_adjacency_rows(is_reverse).items()},
+                             {port_id: list(adjacent_ids) for port_id, adjacent_ids in
+                              expected_compact_graph.get_adjacency_rows(is_reverse).items()})
+
+    def test_save_graph_keeps_every_attribute(self):
+        port = Port(Tile("INT", 1, 0), "FAKE_PORT")
+        attributes = {str(attribute) for attribute in range(65)}
+        graph = Graph(connections=[Connection(port, port, attributes)])
+        graph_cache = GraphCache(self.json_file)
+        graph_cache.save_graph(graph)
+
+        self.assertTrue(graph_cache.is_valid())
+        self.assertEqual(graph_cache.load_graph().connections[0].attributes, attributes)
+
+    def test_save_graph_raises_error_if_cache_file_cant_be_written(self):
+        graph_cache = GraphCache(self.json_file)
+        graph_cache.cache_file = os.path.join(self.json_file + "_missing_directory", "design.json.graphcache")
+
+        with self.assertRaises(OSError):
+            graph_cache.save_graph(self.graph)
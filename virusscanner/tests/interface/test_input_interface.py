@@ -1,5 +1,11 @@
+import re
 from unittest import TestCase, mock
 
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
 from virusscanner.interface.input_interface import Input
 
 
@@ -14,6 +20,10 @@ class TestInput(TestCase):
         self.addCleanup(attributes_patcher.stop)
         self.mock_attributes = attributes_patcher.start()
 
+        propagator_patcher = mock.patch("virusscanner.interface.input_interface.AttributePropagator")
+        self.addCleanup(propagator_patcher.stop)
+        self.mock_propagator = propagator_patcher.start()
+
     @mock.patch("virusscanner.interface.input_interface.ConfigParser")
     def test_input_raises_error_with_non_existing_config(self, mock_parser):
         mock_parser.return_value.read.return_value = []
@@ -54,13 +64,26 @@ class TestInput(TestCase):
     @mock.patch("virusscanner.interface.input_interface.ConfigParser")
     @mock.patch("virusscanner.interface.input_interface.GraphCreator")
     def test_input_uses_attribute_adder(self, mock_creator, mock_parser):
-        mock_parser.return_value.has_section.side_effect = [False, True]
+        mock_parser.return_value.has_section.side_effect = [False, True, False]
 
         Input("some_config", "output.txt", "some_json")
 
         mock_creator.return_value.get_connections_from_json.assert_called_once()
         mock_parser.return_value.get.assert_called_once()
         self.mock_attributes.return_value.add_attributes_to_connections.assert_called_once()
+        self.mock_propagator.return_value.propagate_attributes.assert_not_called()
+
+    @mock.patch("virusscanner.interface.input_interface.ConfigParser")
+    @mock.patch("virusscanner.interface.input_interface.GraphCreator")
+    def test_input_uses_attribute_propagator(self, mock_creator, mock_parser):
+        mock_parser.return_value.has_section.side_effect = [False, False, True]
+
+        Input("some_config", "output.txt", "some_json")
+
+        mock_parser.return_value.get.assert_called_once_with("attribute_propagation", "propagation_file")
+        self.mock_attributes.return_value.add_attributes_to_connections.assert_not_called()
+        self.mock_propagator.return_value.propagate_attributes.assert_called_once_with(
+            mock_parser.return_value.get.return_value, mock_creator.return_value.get_connections_from_json.return_value)
 
     @mock.patch("virusscanner.interface.input_interface.ConfigParser")
     @mock.patch("virusscanner.interface.input_interface.GraphCreator")
@@ -76,11 +99,68 @@ class TestInput(TestCase):
     @mock.patch("virusscanner.interface.input_interface.GraphCreator")
     @mock.patch("virusscanner.interface.input_interface.ConnectionRemover")
     def test_input_removes_wanted_connections(self, mock_remover, mock_creator, mock_parser):
-        mock_parser.return_value.has_section.side_effect = [True, False]
+        mock_parser.return_value.has_section.side_effect = [True, False, False]
+        mock_remover.return_value.remove_connections.return_value = ["fake_line"]
 
-        Input("some_config", "output.txt", "some_json")
+        input_under_test = Input("some_config", "output.txt", "some_json")
 
         mock_creator.return_value.get_connections_from_json.assert_called_once()
         mock_parser.return_value.get.assert_called_once()
         self.mock_attributes.return_value.add_attributes_to_connections.assert_not_called()
         mock_remover.return_value.remove_connections.assert_called_once()
+        self.assertEqual(input_under_test.unmatched_removable_connections, ["fake_line"])
+
+    @mock.patch("virusscanner.interface.input_interface.ConfigParser")
+    @mock.patch("virusscanner.interface.input_interface.GraphCreator")
+    def test_get_matching_ports_reuses_ports_of_same_rules(self, mock_creator, mock_parser):
+        mock_parser.return_value.has_section.return_value = False
+        first_port = Port(Tile("INT", 1, 2), "A")
+        second_port = Port(Tile("CLEM", 1, 2), "B")
+        mock_creator.return_value.get_connections_from_json.return_value = Graph(
+            [Connection(first_port, second_port), Connection(second_port, first_port)])
+        int_rule = dict(tile_type=re.compile(r"INT"), tile_x=re.compile(r"\d+"), tile_y=re.compile(r"\d+"),
+                        port=re.compile(r".+"))
+        cle_rule = dict(tile_type=re.compile(r"CLE"), tile_x=re.compile(r"\d+"), tile_y=re.compile(r"\d+"),
+                        port=re.compile(r".+"))
+        input_under_test = Input("some_config", "output.txt", "some_json")
+
+        matching_ports = input_under_test.get_matching_ports([int_rule, cle_rule], ["begin"])
+
+        self.assertEqual(matching_ports, frozenset({first_port, second_port}))
+        self.assertIs(input_under_test.get_matching_ports([dict(cle_rule), int_rule, int_rule], ["begin"]),
+                      matching_ports)
+        self.assertEqual(input_under_test.get_matching_ports([int_rule], ["end", "begin"]), frozenset({first_port}))
+
+    @mock.patch("virusscanner.interface.input_interface.ConfigParser")
+    @mock.patch("virusscanner.interface.input_interface.GraphCreator")
+    def test_get_matching_ports_updates_ports_after_graph_changes(self, mock_creator, mock_parser):
+        mock_parser.return_value.has_section.return_value = False
+        first_port = Port(Tile("INT", 1, 2), "A")
+        second_port = Port(Tile("INT", 3, 4), "B")
+        connections_graph = Graph([Connection(first_port, second_port)])
+        mock_creator.return_value.get_connections_from_json.return_value = connections_graph
+        int_rule = dict(tile_type=re.compile(r"INT"), tile_x=re.compile(r"\d+"), tile_y=re.compile(r"\d+"),
+                        port=re.compile(r".+"))
+        input_under_test = Input("some_config", "output.txt", "some_json")
+
+        self.assertEqual(input_under_test.get_matching_ports([int_rule], ["begin"]), frozenset({first_port}))
+        connections_graph.add_connection(Connection(second_port, first_port))
+        self.assertEqual(input_under_test.get_matching_ports([int_rule], ["begin"]),
+                         frozenset({first_port, second_port}))
+
+    @mock.patch("virusscanner.interface.input_interface.ConfigParser")
+    @mock.patch("virusscanner.interface.input_interface.GraphCreator")
+    def test_get_matching_ports_finds_ports_of_region_rules(self, mock_creator, mock_parser):
+        mock_parser.return_value.has_section.return_value = False
+        first_port = Port(Tile("INT", 1, 2), "A")
+        second_port = Port(Tile("INT", 3, 4), "B")
+        third_port = Port(Tile("INT", 30, 4), "C")
+        mock_creator.return_value.get_connections_from_json.return_value = Graph(
+            [Connection(first_port, second_port), Connection(second_port, third_port)])
+        region_rule = dict(tile_type=re.compile(r"INT"), tile_x=CoordinateRange.from_string("..10"),
+                           tile_y=re.compile(r"\d+"), port=re.compile(r".+"))
+        input_under_test = Input("some_config", "output.txt", "some_json")
+
+        self.assertEqual(input_under_test.get_matching_ports([region_rule], ["end"]), frozenset({second_port}))
+        self.assertEqual(input_under_test.get_matching_ports([region_rule], ["begin", "end"]),
+                         frozenset({first_port, second_port}))
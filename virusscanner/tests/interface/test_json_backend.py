@@ -0,0 +1,53 @@
+import glob
+import os
+from unittest import TestCase, mock
+
+from virusscanner.interface.json_backend import get_json_backend, get_json_backend_names, OPTIONAL_JSON_BACKENDS, \
+    STDLIB_JSON_BACKEND
+from virusscanner.interface.json_graph_parser import GraphCreator
+
+BENCHMARK_DIRECTORY = os.path.join(os.path.dirname(__file__), "..", "..", "..",
+                                   "2019-11-08_FPGADefender_Journal_Experiments",
+                                   "FPGADefender_Journal_Experiments", "circuits_benchmark")
+
+
+def get_installed_backend_names():
+    installed_backend_names = [STDLIB_JSON_BACKEND]
+    for backend_name in OPTIONAL_JSON_BACKENDS:
+        try:
+            get_json_backend(backend_name)
+            installed_backend_names.append(backend_name)
+        except ValueError:
+            pass
+    return installed_backend_names
+
+
+class TestJSONBackend(TestCase):
+
+    def test_get_json_backend_returns_chosen_backend(self):
+        self.assertEqual(get_json_backend("json").name, "json")
+        self.assertEqual(get_json_backend("json").loads('{"A": [1, "2"]}'), {"A": [1, "2"]})
+        self.assertIn(get_json_backend("auto").name, get_installed_backend_names())
+        self.assertIn("auto", get_json_backend_names())
+
+    @mock.patch.dict(os.environ, {"VIRUSSCANNER_JSON_BACKEND": "json"})
+    def test_get_json_backend_uses_environment_variable(self):
+        self.assertEqual(get_json_backend().name, "json")
+        self.assertEqual(GraphCreator().get_json_backend_name(), "json")
+
+    def test_get_json_backend_raises_error_with_unknown_backend(self):
+        self.assertRaises(ValueError, get_json_backend, "fake_json")
+
+    def test_backends_give_same_graphs_for_benchmarks(self):
+        benchmark_files = sorted(glob.glob(os.path.join(BENCHMARK_DIRECTORY, "*.json")))
+        backend_names = get_installed_backend_names()
+        if not benchmark_files or len(backend_names) < 2:
+            self.skipTest("Benchmark designs or optional JSON backends are not available")
+        for benchmark_file in benchmark_files:
+            expected_graph = GraphCreator(STDLIB_JSON_BACKEND).get_connections_from_json(benchmark_file)
+            for backend_name in backend_names[1:]:
+                with self.subTest(benchmark=os.path.basename(benchmark_file), backend=backend_name):
+                    found_graph = GraphCreator(backend_name).get_connections_from_json(benchmark_file)
+                    self.assertEqual(found_graph, expected_graph)
+                    self.assertEqual([connection.attributes for connection in found_graph.connections],
+                                     [connection.attributes for connection in expected_graph.connections])
@@ -1,3 +1,4 @@
+import json
 from unittest import TestCase, mock
 
 from virusscanner.interface.datastructures.implementation_graph import Graph
@@ -11,8 +12,8 @@ from virusscanner.interface.json_graph_parser import GraphCreator
 
 class TestGraphCreator(TestCase):
 
-    @mock.patch("virusscanner.interface.json_graph_parser.open", new_callable=mock.mock_open())
-    @mock.patch("virusscanner.interface.json_graph_parser.json")
+    @mock.patch("virusscanner.interface.json_graph_parser.open_text_file", new_callable=mock.mock_open())
+    @mock.patch("virusscanner.interface.json_backend.json")
     def test_get_connections_from_json_returns_correct_data(self, mock_json, mock_open):
         expected_attributes = ["FAKE_ATTRIBUTE1", "FAKE_ATTRIBUTE2"]
 
@@ -26,8 +27,9 @@ class TestGraphCreator(TestCase):
             Connection(Port(Tile("CLEM", 2, 50), "FAKE_PORT2"), Port(Tile("INT", 3, 3), "FAKE_PORT3"),
                        set(expected_attributes))]
 
-        mock_json.load.return_value = dict(CONNECTIONS=input_connections)
-        self.assertEqual(GraphCreator().get_connections_from_json("some_file"), Graph(connections=expected_connections))
+        mock_json.loads.return_value = dict(CONNECTIONS=input_connections)
+        self.assertEqual(GraphCreator("json").get_connections_from_json("some_file"),
+                         Graph(connections=expected_connections))
         mock_open.return_value.__enter__.assert_called_once()
 
     @mock.patch("virusscanner.interface.json_graph_parser.open", new_callable=mock.mock_open())
@@ -37,3 +39,39 @@ class TestGraphCreator(TestCase):
         GraphCreator().output_graph(Graph(connections=expected_graph), "some_file")
         mock_json.dump.assert_called_once_with(expected_graph, mock_open.return_value.__enter__.return_value,
                                                cls=DataClassesJSONEncoder)
+
+    def test_get_connections_from_json_stream_returns_correct_data(self):
+        input_json = json.dumps(dict(CONNECTIONS=[
+            dict(begin=dict(tile=dict(name="INT", x=1, y=0), name="FAKE_PORT"),
+                 end=dict(tile=dict(name="INT", x=0, y=0), name="FAKE_PORT1")),
+            dict(begin=dict(tile=dict(name="CLEM", x=2, y=50), name="FAKE_PORT2"),
+                 end=dict(tile=dict(name="INT", x=3, y=3), name="FAKE_PORT3"), attributes=["FAKE_ATTRIBUTE"])],
+            IGNORED_KEY=[1, 2, {"a": None}], LUT_VALUES={"CLEM_X2Y50": {"A6LUT": "0110"}}))
+        expected_connections = [
+            Connection(Port(Tile("INT", 1, 0), "FAKE_PORT"), Port(Tile("INT", 0, 0), "FAKE_PORT1")),
+            Connection(Port(Tile("CLEM", 2, 50), "FAKE_PORT2"), Port(Tile("INT", 3, 3), "FAKE_PORT3"),
+                       {"FAKE_ATTRIBUTE"})]
+
+        with mock.patch("virusscanner.interface.json_graph_parser.open_text_file",
+                        mock.mock_open(read_data=input_json)):
+            found_graph = GraphCreator().get_connections_from_json("some_file", True)
+
+        self.assertEqual(found_graph, Graph(connections=expected_connections,
+                                            lut_values={"CLEM_X2Y50": {"A6LUT": "0110"}}))
+        self.assertEqual(found_graph.connections[1].attributes, {"FAKE_ATTRIBUTE"})
+
+    @mock.patch("virusscanner.interface.json_graph_parser.open_text_file", new_callable=mock.mock_open())
+    @mock.patch("virusscanner.interface.json_backend.json")
+    def test_get_connections_from_json_interns_equal_ports(self, mock_json, mock_open):
+        input_connections = [
+            dict(begin=dict(tile=dict(name="INT", x=1, y=0), name="FAKE_PORT"),
+                 end=dict(tile=dict(name="INT", x=0, y=0), name="FAKE_PORT1")),
+            dict(begin=dict(tile=dict(name="INT", x=1, y=0), name="FAKE_PORT"),
+                 end=dict(tile=dict(name="INT", x=1, y=0), name="FAKE_PORT2"))]
+
+        mock_json.loads.return_value = dict(CONNECTIONS=input_connections)
+        found_graph = GraphCreator("json").get_connections_from_json("some_file")
+
+        self.assertIs(found_graph.connections[0].begin, found_graph.connections[1].begin)
+        self.assertIs(found_graph.connections[0].begin.tile, found_graph.connections[1].end.tile)
+        self.assertIs(found_graph.get_port("INT", 1, 0, "FAKE_PORT"), found_graph.connections[1].begin)
@@ -0,0 +1,55 @@
+import io
+import json
+from unittest import TestCase
+
+from virusscanner.interface.json_stream_reader import JSONStreamReader
+
+
+class TestJSONStreamReader(TestCase):
+    def setUp(self) -> None:
+        self.input_data = {"FIRST": [{"a": 1, "b": [1.5, "x"]}, 12345, "text", None, [], {}],
+                           "SKIPPED": {"nested": [1, 2, 3]},
+                           "LAST": {"key": "value", "other_key": 1234567}}
+
+    def test_read_value_reads_whole_document_with_small_chunks(self):
+        reader = JSONStreamReader(io.StringIO(json.dumps(self.input_data, indent=2)), chunk_size=3)
+        self.assertEqual(reader.read_value(), self.input_data)
+
+    def test_iterate_array_yields_each_element(self):
+        reader = JSONStreamReader(io.StringIO(json.dumps(self.input_data["FIRST"])), chunk_size=2)
+        self.assertEqual(list(reader.iterate_array()), self.input_data["FIRST"])
+
+    def test_iterate_array_handles_empty_array(self):
+        reader = JSONStreamReader(io.StringIO(" [ ] "))
+        self.assertEqual(list(reader.iterate_array()), [])
+
+    def test_iterate_object_skips_unconsumed_values(self):
+        found_values = dict()
+        reader = JSONStreamReader(io.StringIO(json.dumps(self.input_data)), chunk_size=4)
+        for key in reader.iterate_object():
+            if key == "FIRST":
+                found_values[key] = list(reader.iterate_array())
+            elif key == "LAST":
+                found_values[key] = dict(reader.iterate_object_items())
+
+        self.assertEqual(found_values, {"FIRST": self.input_data["FIRST"], "LAST": self.input_data["LAST"]})
+
+    def test_iterate_array_raises_error_with_incorrect_separator(self):
+        reader = JSONStreamReader(io.StringIO("[1; 2]"))
+        with self.assertRaises(ValueError):
+            list(reader.iterate_array())
+
+    def test_read_value_raises_error_with_truncated_document(self):
+        reader = JSONStreamReader(io.StringIO('{"a": [1, 2'), chunk_size=2)
+        with self.assertRaises(ValueError):
+            reader.read_value()
+
+    def test_iterate_object_items_reads_numbers_cut_at_chunk_boundaries(self):
+        input_data = {"LUT_VALUES": {"a": -2500.0, "b": 1e20, "c": 2.5E-3, "d": [-0.125, 7e+2]}}
+        for document in [json.dumps(input_data), '{"LUT_VALUES": {"a": -2500.0, "b": 1e20, "c": 2.5E-3, '
+                                                 '"d": [-0.125, 7e+2]}}']:
+            for chunk_size in range(1, 8):
+                with self.subTest(document=document, chunk_size=chunk_size):
+                    reader = JSONStreamReader(io.StringIO(document), chunk_size=chunk_size)
+                    found_values = {key: dict(reader.iterate_object_items()) for key in reader.iterate_object()}
+                    self.assertEqual(found_values, input_data)
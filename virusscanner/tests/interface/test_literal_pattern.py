@@ -0,0 +1,24 @@
+import pickle
+import re
+from unittest import TestCase
+
+from virusscanner.interface.literal_pattern import LiteralPattern
+
+
+class TestLiteralPattern(TestCase):
+    def test_from_string_accepts_strings_without_metacharacters(self):
+        self.assertEqual(LiteralPattern.from_string("CLE_CLE_M_SITE_0_AQ"), LiteralPattern("CLE_CLE_M_SITE_0_AQ"))
+        self.assertEqual(LiteralPattern.from_string("12"), LiteralPattern("12"))
+
+    def test_from_string_rejects_regular_expressions(self):
+        for pattern_string in (r"\d+", "CLE.+", "INT_(L|R)", "VCC$", "A-B"):
+            with self.subTest(pattern_string=pattern_string):
+                self.assertIsNone(LiteralPattern.from_string(pattern_string))
+
+    def test_match_matches_like_regular_expression(self):
+        for value in ("INT", "INT_L", "IN", "RCLK_INT"):
+            with self.subTest(value=value):
+                self.assertEqual(LiteralPattern("INT").match(value), bool(re.compile("INT").match(value)))
+
+    def test_literal_pattern_can_be_pickled(self):
+        self.assertEqual(pickle.loads(pickle.dumps(LiteralPattern("INT"))), LiteralPattern("INT"))
@@ -15,7 +15,7 @@ class TestAntennaDetector(TestCase):
 
         mock_processor.return_value.find_dangling_ports.side_effect = [{first_port, second_port},
                                                                        {second_port, third_port}]
-        mock_processor.return_value.find_matching_ports.side_effect = [{second_port, third_port}, set()]
+        mock_input.get_matching_ports.side_effect = [{second_port, third_port}, set()]
 
         score = detector_under_test.detect_virus()
 
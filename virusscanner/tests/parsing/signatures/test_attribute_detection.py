@@ -42,3 +42,14 @@ class TestAttributeDetector(TestCase):
         mock_input.get_disallowed_attributes_list.return_value = [first_attribute, second_attribute]
 
         self.assertEqual(AttributeDetector(mock_input).detect_virus(), 5)
+
+    def test_detect_virus_counts_every_parallel_connection(self):
+        mock_input = mock.Mock()
+        begin_port = mock.Mock()
+        end_port = mock.Mock()
+
+        mock_input.get_connections_graph.return_value = Graph(
+            connections=[Connection(begin_port, end_port, {"CLK"}), Connection(begin_port, end_port, {"CLK"})])
+        mock_input.get_disallowed_attributes_list.return_value = ["CLK"]
+
+        self.assertEqual(AttributeDetector(mock_input).detect_virus(), 2)
@@ -4,52 +4,78 @@ from virusscanner.parsing.signatures.fan_out_detection import FanOutDetector
 
 
 class TestFanOutDetector(TestCase):
-    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.GraphProcessor")
-    def test_detect_virus_skips_finding_paths_with_no_ports(self, mock_processor):
-        detector_under_test = FanOutDetector(mock.Mock())
-        mock_processor.return_value.find_matching_ports.return_value = set()
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.PathCounter")
+    def test_detect_virus_skips_finding_paths_with_no_ports(self, mock_counter):
+        mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = None
+        detector_under_test = FanOutDetector(mock_input)
+        mock_input.get_matching_ports.return_value = set()
 
         score = detector_under_test.detect_virus()
-        self.assertEqual(mock_processor.return_value.find_matching_ports.call_count, 2)
+        self.assertEqual(mock_input.get_matching_ports.call_count, 2)
+        mock_counter.assert_not_called()
         self.assertEqual(score, 0)
 
-    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.GraphProcessor")
-    def test_detect_virus_finds_two_ports_with_too_high_fan_out(self, mock_processor):
-        first_begin_port = mock.Mock()
-        second_begin_port = mock.Mock()
-        third_begin_port = mock.Mock()
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.PathCounter")
+    def test_detect_virus_finds_two_ports_with_too_high_fan_out(self, mock_counter):
         mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = None
 
         mock_input.get_fan_out_threshold.return_value = 1
 
         detector_under_test = FanOutDetector(mock_input)
-        mock_processor.return_value.find_matching_ports.return_value = mock.Mock()
-        mock_processor.return_value.find_all_paths.return_value = [[first_begin_port, mock.Mock()],
-                                                                   [first_begin_port, mock.Mock()],
-                                                                   [second_begin_port, mock.Mock()],
-                                                                   [second_begin_port, mock.Mock()],
-                                                                   [third_begin_port, mock.Mock(), mock.Mock()]]
+        mock_input.get_matching_ports.return_value = mock.Mock()
+        mock_counter.return_value.get_path_counts.return_value = {mock.Mock(): 2, mock.Mock(): 2, mock.Mock(): 1}
 
         score = detector_under_test.detect_virus()
         self.assertEqual(score, 2)
 
-    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.GraphProcessor")
-    def test_detect_virus_returns_the_score_of_the_highest_fan_out(self, mock_processor):
-        first_begin_port = mock.Mock()
-        second_begin_port = mock.Mock()
-        third_begin_port = mock.Mock()
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.PathCounter")
+    def test_detect_virus_returns_the_score_of_the_highest_fan_out(self, mock_counter):
         mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = None
 
         mock_input.get_fan_out_threshold.return_value = None
 
         detector_under_test = FanOutDetector(mock_input)
-        mock_processor.return_value.find_matching_ports.return_value = mock.Mock()
-        mock_processor.return_value.find_all_paths.return_value = [[first_begin_port, mock.Mock()],
-                                                                   [first_begin_port, mock.Mock()],
-                                                                   [second_begin_port, mock.Mock()],
-                                                                   [second_begin_port, mock.Mock()],
-                                                                   [second_begin_port, mock.Mock()],
-                                                                   [third_begin_port, mock.Mock(), mock.Mock()]]
+        mock_input.get_matching_ports.return_value = mock.Mock()
+        mock_counter.return_value.get_path_counts.return_value = {mock.Mock(): 2, mock.Mock(): 3, mock.Mock(): 1}
 
         score = detector_under_test.detect_virus()
         self.assertEqual(score, 3)
+
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.PathCounter")
+    def test_detect_virus_returns_zero_without_found_paths(self, mock_counter):
+        mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = None
+
+        mock_input.get_fan_out_threshold.return_value = None
+
+        detector_under_test = FanOutDetector(mock_input)
+        mock_input.get_matching_ports.return_value = mock.Mock()
+        mock_counter.return_value.get_path_counts.return_value = {mock.Mock(): 0}
+
+        score = detector_under_test.detect_virus()
+        self.assertEqual(score, 0)
+
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.PathCounter")
+    @mock.patch("virusscanner.parsing.signatures.fan_out_detection.EndPortReachability")
+    def test_detect_virus_counts_distinct_end_ports_in_distinct_sinks_mode(self, mock_reachability, mock_counter):
+        mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = FanOutDetector.DISTINCT_SINKS_MODE
+        mock_input.get_fan_out_threshold.return_value = None
+
+        detector_under_test = FanOutDetector(mock_input)
+        mock_input.get_matching_ports.return_value = mock.Mock()
+        mock_reachability.return_value.count_reachable_end_ports.return_value = {mock.Mock(): 2, mock.Mock(): 4}
+
+        score = detector_under_test.detect_virus()
+        mock_counter.assert_not_called()
+        self.assertEqual(score, 4)
+
+    def test_init_raises_error_with_unknown_mode(self):
+        mock_input = mock.Mock()
+        mock_input.get_fan_out_mode.return_value = "fake_mode"
+
+        with self.assertRaises(ValueError):
+            FanOutDetector(mock_input)
@@ -4,25 +4,51 @@ from virusscanner.parsing.signatures.path_detection import PathDetector
 
 
 class TestPathDetector(TestCase):
+    @mock.patch("virusscanner.parsing.signatures.path_detection.PathCounter")
     @mock.patch("virusscanner.parsing.signatures.path_detection.GraphProcessor")
-    def test_detect_virus_uses_graph_processor_results(self, mock_processor):
+    def test_detect_virus_uses_path_counter_results(self, mock_processor, mock_counter):
         mock_input = mock.Mock()
+        mock_input.get_disallowed_path_report_limit.return_value = None
         detector_under_test = PathDetector(mock_input)
-        mock_processor.return_value.find_all_paths.return_value = [[mock.Mock], [mock.Mock]]
+        mock_counter.return_value.get_path_counts.return_value = {mock.Mock(): 1, mock.Mock(): 1}
+        mock_counter.return_value.find_paths.return_value = [[mock.Mock], [mock.Mock]]
         score = detector_under_test.detect_virus()
 
+        mock_counter.return_value.find_paths.assert_called_once_with(PathDetector.DEFAULT_PATH_REPORT_LIMIT)
         mock_processor.return_value.print_paths.assert_called_once_with(
-            mock.ANY, mock_processor.return_value.find_all_paths.return_value)
+            mock.ANY, mock_counter.return_value.find_paths.return_value)
         self.assertEqual(score, 2)
 
+    @mock.patch("virusscanner.parsing.signatures.path_detection.PathCounter")
     @mock.patch("virusscanner.parsing.signatures.path_detection.GraphProcessor")
-    def test_detect_virus_skips_printing_without_ports(self, mock_processor):
+    def test_detect_virus_scores_paths_left_out_of_report(self, mock_processor, mock_counter):
         mock_input = mock.Mock()
+        mock_input.get_disallowed_path_report_limit.return_value = 1
+        detector_under_test = PathDetector(mock_input)
+        mock_counter.return_value.get_path_counts.return_value = {mock.Mock(): 3, mock.Mock(): 2}
+        mock_counter.return_value.find_paths.return_value = [[mock.Mock]]
+        score = detector_under_test.detect_virus()
+
+        mock_counter.return_value.find_paths.assert_called_once_with(1)
+        self.assertEqual(score, 5)
+
+    def test_init_rejects_negative_report_limit(self):
+        mock_input = mock.Mock()
+        mock_input.get_disallowed_path_report_limit.return_value = -1
+
+        with self.assertRaises(ValueError):
+            PathDetector(mock_input)
+
+    @mock.patch("virusscanner.parsing.signatures.path_detection.PathCounter")
+    @mock.patch("virusscanner.parsing.signatures.path_detection.GraphProcessor")
+    def test_detect_virus_skips_printing_without_ports(self, mock_processor, mock_counter):
+        mock_input = mock.Mock()
+        mock_input.get_disallowed_path_report_limit.return_value = None
         detector_under_test = PathDetector(mock_input)
 
-        mock_processor.return_value.find_matching_ports.return_value = set()
+        mock_input.get_matching_ports.return_value = set()
         score = detector_under_test.detect_virus()
 
         mock_processor.return_value.print_paths.assert_not_called()
-        mock_processor.return_value.find_all_paths.assert_not_called()
+        mock_counter.assert_not_called()
         self.assertEqual(score, 0)
@@ -1,5 +1,6 @@
 from unittest import TestCase, mock
 
+from virusscanner.interface.datastructures.attribute_index import AttributeIndex
 from virusscanner.interface.datastructures.connection import Connection
 from virusscanner.interface.datastructures.implementation_graph import Graph
 from virusscanner.parsing.signatures.ring_oscillator_detection import CombinatorialLoopDetector
@@ -7,12 +8,14 @@ from virusscanner.parsing.signatures.ring_oscillator_detection import Combinator
 
 class TestCombinatorialLoopDetector(TestCase):
     @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.GraphProcessor")
-    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.networkx")
-    def test_detect_virus_uses_networkx_results(self, mock_networkx, mock_processor):
+    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.LoopFinder")
+    def test_detect_virus_uses_loop_finder_results(self, mock_loop_finder, mock_processor):
         mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = None
         detector_under_test = CombinatorialLoopDetector(mock_input)
         mock_graph = mock.Mock()
         mock_input.get_connections_graph.return_value = mock_graph
+        mock_input.get_ignored_loop_attributes_list.return_value = []
         input_dict = dict()
 
         first_port = mock.Mock()
@@ -22,45 +25,47 @@ class TestCombinatorialLoopDetector(TestCase):
         connections_list = [Connection(first_port, second_port), Connection(second_port, third_port)]
 
         mock_graph.get_adjacency_list.return_value = input_dict
-        mock_graph.connections = connections_list
-
-        found_cycles = [[first_port, second_port], [second_port, first_port]]
-        mock_networkx.simple_cycles.return_value = found_cycles
+        mock_graph.get_attribute_index.return_value = AttributeIndex(connections_list)
+
+        first_loop = [first_port, second_port]
+        second_loop = [third_port]
+        mock_loop_finder.return_value.find_loops.return_value = [first_loop, second_loop]
+        mock_loop_finder.return_value.count_independent_cycles.side_effect = [2, 1]
+        mock_loop_finder.return_value.find_shortest_cycles.side_effect = [[[first_port, second_port]],
+                                                                          [[third_port]]]
         score = detector_under_test.detect_virus()
 
-        expected_path_list = [[first_port, second_port, first_port], [second_port, first_port, second_port]]
+        expected_path_list = [[first_port, second_port, first_port], [third_port, third_port]]
 
+        mock_loop_finder.return_value.find_shortest_cycles.assert_has_calls([
+            mock.call(first_loop, CombinatorialLoopDetector.DEFAULT_CYCLE_LIMIT),
+            mock.call(second_loop, CombinatorialLoopDetector.DEFAULT_CYCLE_LIMIT)])
         mock_processor.return_value.print_paths.assert_called_once_with(mock.ANY, expected_path_list)
-        self.assertEqual(score, 2)
+        self.assertEqual(score, 3)
 
     @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.GraphProcessor")
-    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.networkx")
-    def test_detect_virus_skips_printing_without_cycles(self, mock_networkx, mock_processor):
+    def test_detect_virus_skips_printing_without_cycles(self, mock_processor):
         mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = None
         detector_under_test = CombinatorialLoopDetector(mock_input)
-        mock_graph = mock.Mock()
-        mock_input.get_connections_graph.return_value = mock_graph
-        input_dict = dict()
+        mock_input.get_ignored_loop_attributes_list.return_value = []
 
         first_port = mock.Mock()
         second_port = mock.Mock()
         third_port = mock.Mock()
 
         connections_list = [Connection(first_port, second_port), Connection(second_port, third_port)]
+        mock_input.get_connections_graph.return_value = Graph(connections=connections_list)
 
-        mock_graph.get_adjacency_list.return_value = input_dict
-        mock_graph.connections = connections_list
-
-        found_cycles = []
-        mock_networkx.simple_cycles.return_value = found_cycles
         score = detector_under_test.detect_virus()
 
         mock_processor.return_value.print_paths.assert_not_called()
         self.assertEqual(score, 0)
 
-    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.networkx")
-    def test_detect_skips_ignored_attributes(self, mock_networkx):
+    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.LoopFinder")
+    def test_detect_skips_ignored_attributes(self, mock_loop_finder):
         mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = None
         detector_under_test = CombinatorialLoopDetector(mock_input)
         mock_graph = mock.Mock()
         mock_input.get_connections_graph.return_value = mock_graph
@@ -80,15 +85,17 @@ class TestCombinatorialLoopDetector(TestCase):
             second_port: (third_port,)
         }
         mock_graph.get_adjacency_list.return_value = input_dict
-        mock_graph.connections = connections_list
+        mock_graph.get_attribute_index.return_value = AttributeIndex(connections_list)
+        mock_loop_finder.return_value.find_loops.return_value = []
 
         detector_under_test.detect_virus()
 
-        mock_networkx.DiGraph.assert_called_once_with({second_port: (third_port,)})
+        mock_loop_finder.assert_called_once_with({second_port: (third_port,)})
 
-    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.networkx")
-    def test_detect_does_preserve_other_end_ports(self, mock_networkx):
+    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.GraphProcessor")
+    def test_detect_does_preserve_other_end_ports(self, mock_processor):
         mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = 2
         detector_under_test = CombinatorialLoopDetector(mock_input)
 
         ignored_attribute = "fake"
@@ -104,15 +111,40 @@ class TestCombinatorialLoopDetector(TestCase):
                             Connection(third_port, fourth_port, {ignored_attribute}),
                             Connection(third_port, first_port)]
 
-        expected_adjacency_list = {
-            first_port: (second_port,),
-            second_port: (third_port,),
-            third_port: (first_port,)
-        }
-
         input_graph = Graph(connections=connections_list)
         mock_input.get_connections_graph.return_value = input_graph
 
-        detector_under_test.detect_virus()
+        score = detector_under_test.detect_virus()
+
+        printed_cycles = mock_processor.return_value.print_paths.call_args[0][1]
+        self.assertEqual(len(printed_cycles), 1)
+        self.assertEqual(set(printed_cycles[0]), {first_port, second_port, third_port})
+        self.assertEqual(score, 1)
+
+    def test_init_raises_error_with_negative_cycle_limit(self):
+        mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = -1
 
-        mock_networkx.DiGraph.assert_called_once_with(expected_adjacency_list)
+        with self.assertRaises(ValueError):
+            CombinatorialLoopDetector(mock_input)
+
+    @mock.patch("virusscanner.parsing.signatures.ring_oscillator_detection.GraphProcessor")
+    def test_detect_removes_every_parallel_ignored_connection(self, mock_processor):
+        mock_input = mock.Mock()
+        mock_input.get_ring_oscillator_cycle_limit.return_value = None
+        detector_under_test = CombinatorialLoopDetector(mock_input)
+        ignored_attribute = "CLK"
+        mock_input.get_ignored_loop_attributes_list.return_value = [ignored_attribute]
+
+        first_port = mock.Mock()
+        second_port = mock.Mock()
+
+        mock_input.get_connections_graph.return_value = Graph(connections=[
+            Connection(first_port, second_port, {ignored_attribute}),
+            Connection(first_port, second_port, {ignored_attribute}),
+            Connection(second_port, first_port)])
+
+        score = detector_under_test.detect_virus()
+
+        mock_processor.return_value.print_paths.assert_not_called()
+        self.assertEqual(score, 0)
@@ -17,13 +17,12 @@ class TestShortCircuitDetector(TestCase):
                           third_port: (first_port, second_port)}
         shorting_ports = {second_port}
 
-        mock_processor.return_value.find_matching_ports.return_value = shorting_ports
+        mock_input.get_matching_ports.return_value = shorting_ports
         mock_input.get_connections_graph.return_value.get_adjacency_list.return_value = adjacency_list
 
         score = detector_under_test.detect_virus()
 
-        mock_processor.return_value.find_matching_ports.assert_called_once_with(
-            mock_input.get_short_locations_list.return_value, mock_input.get_connections_graph.return_value.connections,
-            ["end"])
+        mock_input.get_matching_ports.assert_called_once_with(
+            mock_input.get_short_locations_list.return_value, ["end"])
         mock_processor.return_value.print_ports.assert_called_once_with(mock.ANY, (first_port, third_port))
         self.assertEqual(score, 1)
@@ -13,7 +13,7 @@ class TestUnspecifiedPathDetector(TestCase):
         second_port = mock.Mock()
         routing_port = mock.Mock()
 
-        mock_processor.return_value.find_matching_ports.side_effect = [{first_port}, {second_port}, {routing_port}]
+        mock_input.get_matching_ports.side_effect = [{first_port}, {second_port}, {routing_port}]
 
         reverse_adjacency_list = mock.Mock()
 
@@ -33,19 +33,21 @@ class TestUnspecifiedPathDetector(TestCase):
 
     @mock.patch("virusscanner.parsing.signatures.unspecified_path_detection.GraphProcessor")
     def test_detect_virus_skips_finding_routing_without_found_ports(self, mock_processor):
-        detector_under_test = UnspecifiedPathDetector(mock.Mock())
-        mock_processor.return_value.find_matching_ports.return_value = set()
+        mock_input = mock.Mock()
+        detector_under_test = UnspecifiedPathDetector(mock_input)
+        mock_input.get_matching_ports.return_value = set()
 
         score = detector_under_test.detect_virus()
         mock_processor.return_value.print_paths.assert_not_called()
-        self.assertEqual(mock_processor.return_value.find_matching_ports.call_count, 2)
+        self.assertEqual(mock_input.get_matching_ports.call_count, 2)
         self.assertEqual(score, 0)
 
     @mock.patch("virusscanner.parsing.signatures.unspecified_path_detection.GraphProcessor")
     def test_detect_virus_skips_finding_paths_without_found_routing(self, mock_processor):
-        detector_under_test = UnspecifiedPathDetector(mock.Mock())
-        mock_processor.return_value.find_matching_ports.side_effect = [{mock.Mock}, set(), set()]
+        mock_input = mock.Mock()
+        detector_under_test = UnspecifiedPathDetector(mock_input)
+        mock_input.get_matching_ports.side_effect = [{mock.Mock}, set(), set()]
 
         detector_under_test.detect_virus()
         mock_processor.return_value.print_paths.assert_not_called()
-        self.assertEqual(mock_processor.return_value.find_matching_ports.call_count, 3)
+        self.assertEqual(mock_input.get_matching_ports.call_count, 3)
@@ -23,6 +23,9 @@ class TestSignatureDetector(TestCase):
 
     def test_parse_input_calls_signature_detector_twice(self):
         mock_input = mock.Mock()
+        mock_input.get_connections_graph.return_value.get_port_catalogue.return_value.get_tile_type_counts \
+            .return_value = {"CLEL_R": (4, 3, 1)}
+        mock_input.unmatched_removable_connections = []
         mock_input.get_virus_signatures.return_value = {"some.Class": 1.0, "some.other.MyClass": 1.0}
         mock_signature = mock.Mock()
         self.mock_getattr.return_value = mock_signature
@@ -35,6 +38,9 @@ class TestSignatureDetector(TestCase):
 
     def test_parse_input_calls_signature_detector_once_(self):
         mock_input = mock.Mock()
+        mock_input.get_connections_graph.return_value.get_port_catalogue.return_value.get_tile_type_counts \
+            .return_value = {"CLEL_R": (4, 3, 1)}
+        mock_input.unmatched_removable_connections = []
         mock_input.get_virus_signatures.return_value = {"some.Class": 1.0}
         mock_signature = mock.Mock()
         self.mock_getattr.return_value = mock_signature
@@ -50,6 +56,9 @@ class TestSignatureDetector(TestCase):
         expected_second_class = "MyClass"
 
         mock_input = mock.Mock()
+        mock_input.get_connections_graph.return_value.get_port_catalogue.return_value.get_tile_type_counts \
+            .return_value = {"CLEL_R": (4, 3, 1)}
+        mock_input.unmatched_removable_connections = []
         mock_input.get_virus_signatures.return_value = {"some." + expected_first_class: 1.0,
                                                         "some.other." + expected_second_class: 1.0}
         mock_signature = mock.Mock()
@@ -60,7 +69,9 @@ class TestSignatureDetector(TestCase):
         signature_detector.SignatureDetector().parse_input(mock_input)
 
         expected_call_list = [mock.call("Output for " + str(mock_input.input_file) + " generated at "
-                                        + str(self.mock_date.datetime.now.return_value) + "\n\n"),
+                                        + str(self.mock_date.datetime.now.return_value)
+                                        + "\nConnections graph decoded with: " + str(mock_input.json_backend)
+                                        + "\nTile type CLEL_R: 4 ports, 3 outgoing and 1 incoming connections\n\n"),
                               mock.call(expected_first_class + ": " + str(expected_score) + "\n"),
                               mock.call("Nothing found.\n\n"),
                               mock.call(expected_second_class + ": " + str(expected_score) + "\n"),
@@ -74,6 +85,9 @@ class TestSignatureDetector(TestCase):
 
     def test_parse_input_outputs_combined_score(self):
         mock_input = mock.Mock()
+        mock_input.get_connections_graph.return_value.get_port_catalogue.return_value.get_tile_type_counts \
+            .return_value = {"CLEL_R": (4, 3, 1)}
+        mock_input.unmatched_removable_connections = []
         mock_input.get_virus_signatures.return_value = {"some.Class": 1.0, "some.other.MyClass": 0.5}
         mock_signature = mock.Mock()
         self.mock_getattr.return_value = mock_signature
@@ -83,3 +97,19 @@ class TestSignatureDetector(TestCase):
 
         self.assertIn(mock.call("Final score: 1.8\n"),
                       self.mock_output_open.return_value.__enter__.return_value.write.mock_calls, )
+
+    def test_parse_input_writes_unmatched_removable_connections_to_header(self):
+        mock_input = mock.Mock()
+        mock_input.get_connections_graph.return_value.get_port_catalogue.return_value.get_tile_type_counts \
+            .return_value = {}
+        mock_input.unmatched_removable_connections = ["INT_X1Y0 A -> INT_X1Y0 B"]
+        mock_input.get_virus_signatures.return_value = {}
+
+        signature_detector.SignatureDetector().parse_input(mock_input)
+
+        self.assertEqual(self.mock_output_open.return_value.__enter__.return_value.write.mock_calls[0],
+                         mock.call("Output for " + str(mock_input.input_file) + " generated at "
+                                   + str(self.mock_date.datetime.now.return_value)
+                                   + "\nConnections graph decoded with: " + str(mock_input.json_backend)
+                                   + "\nRemovable connection not found in the connections graph: "
+                                   + "INT_X1Y0 A -> INT_X1Y0 B\n\n"))
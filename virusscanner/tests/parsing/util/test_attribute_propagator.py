@@ -0,0 +1,90 @@
+import re
+from unittest import TestCase, mock
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.implementation_graph import Graph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.attribute_propagator import AttributePropagator
+
+
+def make_rule(tile_type: str, port: str, attribute_name: str, **extra_columns):
+    return dict(tile_type=re.compile(tile_type), tile_x=re.compile(r"\d+"), tile_y=re.compile(r"\d+"),
+                port=re.compile(port), attribute_name=attribute_name, **extra_columns)
+
+
+class TestAttributePropagator(TestCase):
+    def setUp(self) -> None:
+        csv_patcher = mock.patch("virusscanner.parsing.util.attribute_propagator.CSVInput")
+        self.addCleanup(csv_patcher.stop)
+        self.mock_csv_reader = csv_patcher.start()
+
+        self.clock_port = Port(Tile("RCLK_INT_L", 1, 29), "CLK_LEAF")
+        self.leaf_port = Port(Tile("INT", 1, 26), "GCLK_B_0_0")
+        self.control_port = Port(Tile("INT", 1, 26), "CTRL_W4")
+        self.lut_port = Port(Tile("CLEL_R", 1, 26), "CLE_CLE_L_SITE_0_A1")
+        self.lut_output_port = Port(Tile("CLEL_R", 1, 26), "CLE_CLE_L_SITE_0_A_O")
+        self.data_port = Port(Tile("INT", 2, 26), "LOGIC_OUTS_W0")
+        self.clock_connections = [Connection(self.clock_port, self.leaf_port),
+                                  Connection(self.leaf_port, self.control_port)]
+        self.lut_connection = Connection(self.control_port, self.lut_port)
+        self.logic_connection = Connection(self.lut_port, self.lut_output_port)
+        self.data_connection = Connection(self.data_port, self.lut_port)
+        self.graph = Graph(self.clock_connections + [self.lut_connection, self.logic_connection,
+                                                     self.data_connection])
+
+    def test_propagate_attributes_tags_reachable_connections(self):
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK")]
+
+        AttributePropagator().propagate_attributes("fake_file", self.graph)
+
+        for connection in self.clock_connections + [self.lut_connection, self.logic_connection]:
+            self.assertEqual(connection.attributes, {"CLK"})
+        self.assertEqual(self.data_connection.attributes, set())
+
+    def test_propagate_attributes_stops_at_stopping_ports(self):
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK", stop_tile_type=re.compile(r"CLE"), stop_tile_x=re.compile(r"\d+"),
+                      stop_tile_y=re.compile(r"\d+"), stop_port=re.compile(r".+_[A-H][1-6]$"))]
+
+        AttributePropagator().propagate_attributes("fake_file", self.graph)
+
+        self.assertEqual(self.lut_connection.attributes, {"CLK"})
+        self.assertEqual(self.logic_connection.attributes, set())
+
+    def test_propagate_attributes_stops_at_max_depth(self):
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK", max_depth="2"), make_rule(r"INT", r"LOGIC_OUTS", "DATA")]
+
+        AttributePropagator().propagate_attributes("fake_file", self.graph)
+
+        self.assertEqual([connection.attributes for connection in self.clock_connections], [{"CLK"}, {"CLK"}])
+        self.assertEqual(self.lut_connection.attributes, set())
+        self.assertEqual(self.logic_connection.attributes, {"DATA"})
+        self.assertEqual(self.data_connection.attributes, {"DATA"})
+
+    def test_propagate_attributes_follows_loops_once(self):
+        loop_connection = Connection(self.lut_output_port, self.leaf_port)
+        self.graph.add_connection(loop_connection)
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK")]
+
+        AttributePropagator().propagate_attributes("fake_file", self.graph)
+
+        self.assertEqual(loop_connection.attributes, {"CLK"})
+        self.assertEqual(len(self.graph.connections), 6)
+
+    def test_incomplete_stop_columns_raise_error(self):
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK", stop_port=re.compile(r".+"))]
+
+        with self.assertRaises(ValueError):
+            AttributePropagator().propagate_attributes("fake_file", self.graph)
+
+    def test_max_depth_has_to_be_positive(self):
+        self.mock_csv_reader.return_value.get_regexps_list_from_file.return_value = [
+            make_rule(r"RCLK_.*", r".+", "CLK", max_depth="0")]
+
+        with self.assertRaises(ValueError):
+            AttributePropagator().propagate_attributes("fake_file", self.graph)
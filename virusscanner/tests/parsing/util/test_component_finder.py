@@ -0,0 +1,50 @@
+import sys
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.component_finder import ComponentFinder
+
+
+class TestComponentFinder(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+        self.fourth_port = Port(fake_tile, "D")
+        self.adjacency_list = {self.first_port: (self.second_port,),
+                               self.second_port: (self.third_port,),
+                               self.third_port: (self.second_port, self.fourth_port)}
+
+    def test_find_components_returns_components_in_reverse_topological_order(self):
+        components = ComponentFinder(self.adjacency_list).find_components([self.first_port])
+
+        self.assertEqual([set(component) for component in components],
+                         [{self.fourth_port}, {self.second_port, self.third_port}, {self.first_port}])
+
+    def test_find_components_only_visits_reachable_ports(self):
+        components = ComponentFinder(self.adjacency_list).find_components([self.third_port])
+
+        self.assertEqual([set(component) for component in components],
+                         [{self.fourth_port}, {self.second_port, self.third_port}])
+
+    def test_find_components_ignores_connections_of_stop_ports(self):
+        component_finder = ComponentFinder(self.adjacency_list, {self.third_port})
+        components = component_finder.find_components([self.first_port])
+
+        self.assertEqual(components, [[self.third_port], [self.second_port], [self.first_port]])
+        self.assertEqual(component_finder.get_next_ports(self.third_port), ())
+
+    def test_find_components_handles_chains_longer_than_recursion_limit(self):
+        fake_tile = Tile("fake_tile", 1, 1)
+        chain_length = sys.getrecursionlimit() + 100
+        chain_ports = [Port(fake_tile, str(index)) for index in range(chain_length)]
+        adjacency_list = {port: (next_port,) for port, next_port in zip(chain_ports, chain_ports[1:])}
+        adjacency_list[chain_ports[-1]] = (chain_ports[0],)
+
+        components = ComponentFinder(adjacency_list).find_components([chain_ports[0]])
+
+        self.assertEqual(len(components), 1)
+        self.assertEqual(set(components[0]), set(chain_ports))
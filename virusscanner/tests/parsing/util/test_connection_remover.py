@@ -21,5 +21,22 @@ class TestConnectionRemover(TestCase):
         input_graph = Graph(connections=[first_connection, second_connection, third_connection, fourth_connection])
         input_data = str(first_connection) + "\nfake_string\n\n    " + str(second_connection)
         with mock.patch("virusscanner.parsing.util.connections_remover.open", mock.mock_open(read_data=input_data)):
-            ConnectionRemover.remove_connections("fake_file", input_graph)
+            unmatched_lines = ConnectionRemover.remove_connections("fake_file", input_graph)
             self.assertEqual(input_graph.connections, [third_connection, fourth_connection])
+            self.assertEqual(unmatched_lines, ["fake_string"])
+
+    def test_remove_connections_ignores_whitespace_and_repeated_lines(self):
+        first_port = Port(Tile("fake1", 1, 1), "fake1")
+        second_port = Port(Tile("fake2", 1, 1), "fake2")
+
+        first_connection = Connection(first_port, second_port)
+        second_connection = Connection(second_port, first_port)
+
+        input_graph = Graph(connections=[first_connection, second_connection])
+        input_data = "{}  ->{}\n{}\n{} -> {}\n".format(first_port, second_port, first_connection, second_port,
+                                                       second_port)
+        with mock.patch("virusscanner.parsing.util.connections_remover.open", mock.mock_open(read_data=input_data)):
+            unmatched_lines = ConnectionRemover.remove_connections("fake_file", input_graph)
+            self.assertEqual(input_graph.connections, [second_connection])
+            self.assertEqual(input_graph.get_adjacency_list(), {second_port: (first_port,)})
+            self.assertEqual(unmatched_lines, ["{} -> {}".format(second_port, second_port)])
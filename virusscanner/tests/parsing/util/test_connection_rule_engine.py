@@ -0,0 +1,59 @@
+import re
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.connection_rule_engine import ConnectionRuleEngine
+
+
+def make_rule(begin_tile_type: str, begin_port: str, end_tile_type: str, end_port: str):
+    return dict(begin_tile_type=re.compile(begin_tile_type), begin_tile_x=re.compile(r"\d+"),
+                begin_tile_y=re.compile(r"\d+"), begin_port=re.compile(begin_port),
+                end_tile_type=re.compile(end_tile_type), end_tile_x=re.compile(r"\d+"),
+                end_tile_y=re.compile(r"\d+"), end_port=re.compile(end_port))
+
+
+class TestConnectionRuleEngine(TestCase):
+    def setUp(self) -> None:
+        self.int_port = Port(Tile("INT", 1, 2), "A")
+        self.cle_port = Port(Tile("CLEM", 1, 2), "B")
+        self.int_to_cle = Connection(self.int_port, self.cle_port)
+        self.cle_to_int = Connection(self.cle_port, self.int_port)
+        self.int_to_int = Connection(self.int_port, Port(Tile("INT", 3, 4), "B"))
+
+    def test_get_rule_masks_matches_begin_and_end_columns(self):
+        rule_engine = ConnectionRuleEngine([make_rule(r"INT", r".+", r"CLE", r".+"),
+                                            make_rule(r".+", r".+", r".+", r"B")])
+
+        self.assertEqual(rule_engine.get_rule_masks([self.int_to_cle, self.cle_to_int, self.int_to_int]),
+                         {self.int_to_cle: 0b11, self.int_to_int: 0b10})
+
+    def test_get_rule_assignments_returns_connections_of_every_rule(self):
+        rule_engine = ConnectionRuleEngine([make_rule(r"CLE", r".+", r".+", r".+"),
+                                            make_rule(r"NONE", r".+", r".+", r".+"),
+                                            make_rule(r".+", r"A", r".+", r".+")])
+
+        self.assertEqual(rule_engine.get_rule_assignments([self.int_to_cle, self.cle_to_int, self.int_to_int]),
+                         [[self.cle_to_int], [], [self.int_to_cle, self.int_to_int]])
+
+    def test_get_unique_rule_assignments_returns_rule_indexes(self):
+        rule_engine = ConnectionRuleEngine([make_rule(r"CLE", r".+", r".+", r".+"),
+                                            make_rule(r"INT", r".+", r"INT", r".+")])
+
+        self.assertEqual(rule_engine.get_unique_rule_assignments([self.int_to_cle, self.cle_to_int, self.int_to_int]),
+                         {self.cle_to_int: 0, self.int_to_int: 1})
+
+    def test_get_unique_rule_assignments_raises_error_with_multiple_rules(self):
+        rule_engine = ConnectionRuleEngine([make_rule(r"INT", r".+", r".+", r".+"),
+                                            make_rule(r".+", r"A", r".+", r".+")])
+
+        with self.assertRaisesRegex(ValueError, "has multiple power costs given"):
+            rule_engine.get_unique_rule_assignments([self.int_to_cle], "{} has multiple power costs given!")
+
+    def test_missing_column_raises_error(self):
+        connection_rule = make_rule(r"INT", r".+", r".+", r".+")
+        del connection_rule["end_tile_y"]
+
+        with self.assertRaises(ValueError):
+            ConnectionRuleEngine([connection_rule])
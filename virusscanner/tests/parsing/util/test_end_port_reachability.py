@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.end_port_reachability import EndPortReachability
+
+
+class TestEndPortReachability(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.first_begin_port = Port(fake_tile, "BEGIN1")
+        self.second_begin_port = Port(fake_tile, "BEGIN2")
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.first_end_port = Port(fake_tile, "END1")
+        self.second_end_port = Port(fake_tile, "END2")
+        self.third_end_port = Port(fake_tile, "END3")
+        self.adjacency_list = {self.first_begin_port: (self.first_port,),
+                               self.second_begin_port: (self.second_port, self.third_end_port),
+                               self.first_port: (self.second_port, self.first_end_port),
+                               self.second_port: (self.first_port, self.second_end_port),
+                               self.first_end_port: (self.third_end_port,)}
+        self.end_ports = {self.first_end_port, self.second_end_port, self.third_end_port}
+
+    def test_get_reachable_end_ports_returns_distinct_end_ports_of_every_begin_port(self):
+        reachability = EndPortReachability(self.adjacency_list, [self.first_begin_port, self.second_begin_port],
+                                           self.end_ports)
+
+        reachable_end_ports = reachability.get_reachable_end_ports()
+
+        self.assertEqual(list(reachable_end_ports), [self.first_begin_port, self.second_begin_port])
+        self.assertEqual(set(reachable_end_ports[self.first_begin_port]), {self.first_end_port, self.second_end_port})
+        self.assertEqual(set(reachable_end_ports[self.second_begin_port]), self.end_ports)
+
+    def test_count_reachable_end_ports_doesnt_continue_past_end_ports(self):
+        reachability = EndPortReachability(self.adjacency_list, [self.first_begin_port, self.first_end_port],
+                                           self.end_ports)
+
+        self.assertEqual(reachability.count_reachable_end_ports(),
+                         {self.first_begin_port: 2, self.first_end_port: 1})
+
+    def test_count_reachable_end_ports_skips_begin_port_reached_again(self):
+        self.adjacency_list[self.third_end_port] = (self.first_end_port,)
+        reachability = EndPortReachability(self.adjacency_list, [self.first_end_port], self.end_ports)
+
+        self.assertEqual(reachability.get_reachable_end_ports(), {self.first_end_port: [self.third_end_port]})
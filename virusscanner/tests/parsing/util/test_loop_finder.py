@@ -0,0 +1,52 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.loop_finder import LoopFinder
+
+
+class TestLoopFinder(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+        self.fourth_port = Port(fake_tile, "D")
+        self.fifth_port = Port(fake_tile, "E")
+        self.adjacency_list = {self.first_port: (self.second_port,),
+                               self.second_port: (self.third_port, self.fourth_port),
+                               self.third_port: (self.first_port,),
+                               self.fourth_port: (self.first_port, self.fifth_port),
+                               self.fifth_port: (self.fifth_port,)}
+        self.loop = [self.first_port, self.second_port, self.third_port, self.fourth_port]
+
+    def test_find_loops_returns_components_with_cycles(self):
+        self.adjacency_list[self.fifth_port] = ()
+        loops = LoopFinder(self.adjacency_list).find_loops()
+
+        self.assertEqual([set(loop) for loop in loops], [set(self.loop)])
+
+    def test_find_loops_returns_ports_with_connection_to_themselves(self):
+        loops = LoopFinder(self.adjacency_list).find_loops()
+
+        self.assertEqual([set(loop) for loop in loops], [{self.fifth_port}, set(self.loop)])
+
+    def test_count_independent_cycles_counts_cycles_of_the_loop(self):
+        loop_finder = LoopFinder(self.adjacency_list)
+
+        self.assertEqual(loop_finder.count_independent_cycles(self.loop), 2)
+        self.assertEqual(loop_finder.count_independent_cycles([self.fifth_port]), 1)
+
+    def test_find_shortest_cycles_returns_distinct_shortest_cycles(self):
+        loop_finder = LoopFinder(self.adjacency_list)
+
+        self.assertEqual(loop_finder.find_shortest_cycles(self.loop, 1),
+                         [[self.first_port, self.second_port, self.third_port]])
+        self.assertEqual(loop_finder.find_shortest_cycles(self.loop, 2),
+                         [[self.first_port, self.second_port, self.third_port],
+                          [self.fourth_port, self.first_port, self.second_port]])
+        self.assertEqual(loop_finder.find_shortest_cycles([self.fifth_port], 2), [[self.fifth_port]])
+
+    def test_find_shortest_cycles_returns_nothing_without_max_cycles(self):
+        self.assertEqual(LoopFinder(self.adjacency_list).find_shortest_cycles(self.loop, 0), [])
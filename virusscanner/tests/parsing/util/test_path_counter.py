@@ -0,0 +1,92 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.compact_graph import CompactGraph
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.path_counter import PathCounter
+
+
+class TestPathCounter(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.begin_port = Port(fake_tile, "BEGIN")
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+        self.first_end_port = Port(fake_tile, "END1")
+        self.second_end_port = Port(fake_tile, "END2")
+        self.adjacency_list = {self.begin_port: (self.first_port, self.second_port),
+                               self.first_port: (self.second_port, self.first_end_port),
+                               self.second_port: (self.third_port, self.first_end_port),
+                               self.third_port: (self.first_port, self.second_end_port),
+                               self.first_end_port: (self.second_end_port,)}
+        self.end_ports = {self.first_end_port, self.second_end_port}
+
+    def __get_compact_graph(self):
+        return CompactGraph.from_edges((port, next_port) for port, next_ports in self.adjacency_list.items()
+                                       for next_port in next_ports)
+
+    def __find_all_paths(self, begin_ports):
+        return GraphProcessor().find_all_paths(self.adjacency_list, begin_ports, self.end_ports)
+
+    def test_get_path_counts_counts_paths_through_cyclic_components(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports)
+
+        self.assertEqual(path_counter.get_path_counts(),
+                         {self.begin_port: len(self.__find_all_paths([self.begin_port]))})
+
+    def test_get_path_counts_counts_paths_of_every_begin_port(self):
+        begin_ports = [self.begin_port, self.third_port]
+        path_counter = PathCounter(self.__get_compact_graph(), begin_ports, self.end_ports)
+
+        self.assertEqual(path_counter.get_path_counts(),
+                         {begin_port: len(self.__find_all_paths([begin_port])) for begin_port in begin_ports})
+
+    def test_get_path_counts_skips_paths_returning_to_begin_end_port(self):
+        self.adjacency_list[self.second_end_port] = (self.first_end_port,)
+        path_counter = PathCounter(self.__get_compact_graph(), [self.first_end_port], self.end_ports)
+
+        self.assertEqual(path_counter.get_path_counts(), {self.first_end_port: 1})
+
+    def test_get_path_counts_returns_zero_without_reachable_end_ports(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], {Port(Tile("other", 1, 1), "END")})
+
+        self.assertEqual(path_counter.get_path_counts(), {self.begin_port: 0})
+
+    def test_get_path_counts_returns_zero_for_begin_ports_outside_graph(self):
+        missing_port = Port(Tile("other", 1, 1), "BEGIN")
+        path_counter = PathCounter(self.__get_compact_graph(), [missing_port, self.third_port], self.end_ports)
+
+        self.assertEqual(path_counter.get_path_counts(),
+                         {missing_port: 0, self.third_port: len(self.__find_all_paths([self.third_port]))})
+        self.assertEqual(path_counter.find_paths(), self.__find_all_paths([self.third_port]))
+
+    def test_find_paths_returns_paths_in_depth_first_order(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports)
+
+        self.assertEqual(path_counter.find_paths(), self.__find_all_paths([self.begin_port]))
+
+    def test_find_paths_stops_at_max_paths(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports)
+
+        self.assertEqual(path_counter.find_paths(2), self.__find_all_paths([self.begin_port])[:2])
+        self.assertEqual(path_counter.find_paths(0), [])
+
+    def test_get_path_counts_gives_lower_bound_after_last_walk_step(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports, 2)
+        path_count = path_counter.get_path_counts()[self.begin_port]
+
+        self.assertFalse(path_counter.are_path_counts_exact())
+        self.assertLess(path_count, len(self.__find_all_paths([self.begin_port])))
+
+    def test_are_path_counts_exact_without_cut_walks(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports)
+
+        self.assertTrue(path_counter.are_path_counts_exact())
+
+    def test_find_paths_stops_after_last_walk_step(self):
+        path_counter = PathCounter(self.__get_compact_graph(), [self.begin_port], self.end_ports, 4)
+
+        self.assertEqual(path_counter.find_paths(), self.__find_all_paths([self.begin_port])[:1])
@@ -0,0 +1,66 @@
+import sys
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.path_traversal import PathTraversal
+
+
+class TestPathTraversal(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+        self.adjacency_list = {self.first_port: (self.second_port, self.third_port),
+                               self.second_port: (self.first_port, self.third_port)}
+
+    def test_walk_enters_ports_of_simple_paths_in_depth_first_order(self):
+        entered_paths = []
+
+        def enter_port(port, next_port, path):
+            entered_paths.append((port, next_port, list(path)))
+            return True
+
+        PathTraversal(self.adjacency_list).walk(self.first_port, enter_port)
+
+        self.assertEqual(entered_paths, [
+            (self.first_port, self.second_port, [self.first_port, self.second_port]),
+            (self.second_port, self.third_port, [self.first_port, self.second_port, self.third_port]),
+            (self.first_port, self.third_port, [self.first_port, self.third_port])])
+
+    def test_walk_examines_every_connection_of_continued_ports(self):
+        examined_connections = []
+        left_paths = []
+
+        PathTraversal(self.adjacency_list).walk(
+            self.first_port, lambda port, next_port, path: next_port != self.third_port,
+            examine_connection=lambda port, next_port, path: examined_connections.append((port, next_port)),
+            leave_port=lambda port, next_port, path: left_paths.append((port, next_port, list(path))))
+
+        self.assertEqual(examined_connections,
+                         [(self.first_port, self.second_port), (self.second_port, self.first_port),
+                          (self.second_port, self.third_port), (self.first_port, self.third_port)])
+        self.assertEqual(left_paths, [(self.first_port, self.second_port, [self.first_port, self.second_port])])
+
+    def test_walk_keeps_given_path(self):
+        current_path = [self.third_port, self.first_port]
+
+        PathTraversal(self.adjacency_list).walk(self.first_port, lambda port, next_port, path: True, current_path)
+
+        self.assertEqual(current_path, [self.third_port, self.first_port])
+
+    def test_walk_follows_paths_longer_than_recursion_limit(self):
+        chain_ports = [Port(Tile("INT", index, 0), "A") for index in range(sys.getrecursionlimit() * 2)]
+        adjacency_list = {port: (next_port,) for port, next_port in zip(chain_ports, chain_ports[1:])}
+        found_paths = []
+
+        def enter_port(port, next_port, path):
+            if next_port == chain_ports[-1]:
+                found_paths.append(list(path))
+            return True
+
+        PathTraversal(adjacency_list).walk(chain_ports[0], enter_port)
+
+        self.assertEqual(found_paths, [chain_ports])
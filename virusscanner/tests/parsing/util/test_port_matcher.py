@@ -0,0 +1,143 @@
+import re
+from unittest import TestCase, mock
+
+from virusscanner.interface.coordinate_range import CoordinateRange
+from virusscanner.interface.datastructures.connection import Connection
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.port_catalogue import PortCatalogue
+from virusscanner.interface.datastructures.spatial_index import Region
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.interface.literal_pattern import LiteralPattern
+from virusscanner.parsing.util.port_matcher import PortMatcher
+
+
+def make_row(tile_type: str, tile_x: str, tile_y: str, port: str):
+    return dict(tile_type=re.compile(tile_type), tile_x=re.compile(tile_x), tile_y=re.compile(tile_y),
+                port=re.compile(port))
+
+
+class TestPortMatcher(TestCase):
+    def setUp(self) -> None:
+        self.int_port = Port(Tile("INT", 1, 12), "VCC_WIRE")
+        self.cle_port = Port(Tile("CLEM", 3, 7), "CLE_CLE_M_SITE_0_AQ")
+        self.negative_port = Port(Tile("INT", -1, 2), "VCC_WIRE")
+
+    def test_port_matches_with_all_fields_of_one_row(self):
+        port_matcher = PortMatcher([make_row(r"INT", r"\d+", r"1", r"VCC")])
+
+        self.assertTrue(port_matcher.is_matching_port(self.int_port))
+        self.assertFalse(port_matcher.is_matching_port(self.cle_port))
+
+    def test_port_does_not_match_fields_from_different_rows(self):
+        port_matcher = PortMatcher([make_row(r"INT", r"3", r"\d+", r".+"), make_row(r"CLE", r"3", r"\d+", r".+")])
+
+        self.assertFalse(port_matcher.is_matching_port(self.int_port))
+        self.assertTrue(port_matcher.is_matching_port(self.cle_port))
+
+    def test_regular_expressions_match_the_beginning_of_values(self):
+        port_matcher = PortMatcher([make_row(r"CLE", r"3", r"7", r"CLE_CLE")])
+
+        self.assertTrue(port_matcher.is_matching_port(self.cle_port))
+        self.assertFalse(PortMatcher([make_row(r"LEM", r"3", r"7", r".+")]).is_matching_port(self.cle_port))
+
+    def test_wildcards_match_like_regular_expressions(self):
+        port_matcher = PortMatcher([make_row(r".+", r"\d+", r"[0-9]+", r".*")])
+
+        self.assertTrue(port_matcher.is_matching_port(self.int_port))
+        self.assertFalse(port_matcher.is_matching_port(self.negative_port))
+
+    def test_not_combinable_regular_expressions_keep_their_meaning(self):
+        port_matcher = PortMatcher([make_row(r"(?i)int", r"\d+", r"\d+", r".+"),
+                                    make_row(r"(C)L(?(1)E|X)", r"\d+", r"\d+", r".+")])
+
+        self.assertTrue(port_matcher.is_matching_port(self.int_port))
+        self.assertTrue(port_matcher.is_matching_port(self.cle_port))
+
+    def test_coordinate_ranges_match_ports_in_region(self):
+        port_matcher = PortMatcher([dict(tile_type=re.compile(r".+"), tile_x=CoordinateRange.from_string("0..3"),
+                                         tile_y=CoordinateRange.from_string(">=7"), port=re.compile(r".+")),
+                                    make_row(r"INT", r"-", r"\d+", r".+")])
+        outside_port = Port(Tile("CLEM", 4, 7), "CLE_CLE_M_SITE_0_AQ")
+
+        self.assertEqual(port_matcher.get_matching_ports([self.int_port, self.cle_port, self.negative_port,
+                                                          outside_port]),
+                         {self.int_port, self.cle_port, self.negative_port})
+        self.assertTrue(PortMatcher([dict(tile_type=re.compile(r".+"), tile_x=CoordinateRange.from_string("..3"),
+                                          tile_y=re.compile(r"7"), port=re.compile(r".+"))]).is_matching_port(
+            self.cle_port))
+
+    def test_literal_rows_match_beginning_of_values(self):
+        port_matcher = PortMatcher([dict(tile_type=LiteralPattern("IN"), tile_x=LiteralPattern("1"),
+                                         tile_y=LiteralPattern("12"), port=LiteralPattern("VCC_WIRE")),
+                                    make_row(r"CLEM", r"3", r"7", r"CLE_CLE_M_SITE_0_AQ"),
+                                    make_row(r"INT", r"-1", r"2", r"VCC_WIRE_LONG")])
+
+        self.assertEqual(port_matcher.get_matching_ports([self.int_port, self.cle_port, self.negative_port]),
+                         {self.int_port, self.cle_port})
+        self.assertEqual(port_matcher.get_row_mask(self.int_port), 0b001)
+        self.assertEqual(port_matcher.get_row_mask(self.cle_port), 0b010)
+
+    def test_literal_patterns_are_not_evaluated_with_match(self):
+        tile_type_literal = mock.MagicMock(spec=LiteralPattern)
+        tile_type_literal.pattern = "INT"
+        tile_type_literal.flags = re.UNICODE
+        port_matcher = PortMatcher([dict(tile_type=tile_type_literal, tile_x=re.compile(r"\d+"),
+                                         tile_y=re.compile(r"\d+"), port=re.compile(r"VCC"))])
+
+        self.assertEqual(port_matcher.get_matching_ports([self.int_port, self.cle_port]), {self.int_port})
+        tile_type_literal.match.assert_not_called()
+
+    def test_field_values_are_evaluated_once(self):
+        tile_type_regex = mock.MagicMock()
+        tile_type_regex.pattern = "IN."
+        tile_type_regex.flags = re.UNICODE
+        tile_type_regex.match.return_value = True
+        port_matcher = PortMatcher([dict(tile_type=tile_type_regex, tile_x=re.compile(r"\d+"),
+                                         tile_y=re.compile(r"\d+"), port=re.compile(r".+"))])
+
+        self.assertEqual(port_matcher.get_matching_ports([self.int_port, self.int_port, self.negative_port]),
+                         {self.int_port})
+        tile_type_regex.match.assert_called_once_with("INT")
+
+    def test_row_masks_note_every_matching_row(self):
+        port_matcher = PortMatcher([make_row(r"INT", r".+", r".+", r".+"), make_row(r"CLE", r".+", r".+", r".+"),
+                                    make_row(r".+", r"1", r".+", r"VCC")])
+
+        self.assertEqual(port_matcher.get_row_masks([self.int_port, self.cle_port]),
+                         {self.int_port: 0b101, self.cle_port: 0b010})
+        self.assertEqual(port_matcher.get_tile_type_mask("INT"), 0b101)
+
+    def test_get_matching_ports_returns_nothing_without_rows(self):
+        self.assertEqual(PortMatcher([]).get_matching_ports([self.int_port]), set())
+
+    def test_get_matching_catalogue_ports_matches_ports_in_given_role(self):
+        port_matcher = PortMatcher([make_row(r"INT", r".*", r".*", r"VCC"), make_row(r"CLE", r"3", r"7", r"CLE")])
+        port_catalogue = PortCatalogue([Connection(self.int_port, self.cle_port),
+                                        Connection(self.cle_port, self.negative_port)])
+
+        self.assertEqual(port_matcher.get_matching_catalogue_ports(port_catalogue, ["begin"]),
+                         {self.int_port, self.cle_port})
+        self.assertEqual(port_matcher.get_matching_catalogue_ports(port_catalogue, ["end"]),
+                         {self.cle_port, self.negative_port})
+        self.assertEqual(port_matcher.get_matching_catalogue_ports(port_catalogue, ["begin", "end"]),
+                         {self.int_port, self.cle_port, self.negative_port})
+
+    def test_missing_column_raises_error(self):
+        with self.assertRaises(ValueError):
+            PortMatcher([dict(tile_type=re.compile(r"INT"), tile_x=re.compile(r"\d+"), port=re.compile(r".+"))])
+
+    def test_rules_key_ignores_row_order_and_repetitions(self):
+        first_row = make_row(r"INT", r"\d+", r"\d+", r".+")
+        second_row = make_row(r"CLE", r"\d+", r"\d+", r".+")
+
+        self.assertEqual(PortMatcher.get_rules_key([first_row, second_row]),
+                         PortMatcher.get_rules_key([second_row, make_row(r"INT", r"\d+", r"\d+", r".+"), first_row]))
+        self.assertNotEqual(PortMatcher.get_rules_key([first_row]),
+                            PortMatcher.get_rules_key([make_row(r"(?i)INT", r"\d+", r"\d+", r".+")]))
+
+    def test_get_rule_regions_returns_regions_of_coordinate_ranges(self):
+        region_row = dict(tile_type=re.compile(r".+"), tile_x=CoordinateRange.from_string("0..3"),
+                          tile_y=re.compile(r"\d+"), port=re.compile(r".+"))
+
+        self.assertEqual(PortMatcher.get_rule_regions([region_row]), [Region(0, None, 3, None)])
+        self.assertIsNone(PortMatcher.get_rule_regions([region_row, make_row(r"INT", r"\d+", r"\d+", r".+")]))
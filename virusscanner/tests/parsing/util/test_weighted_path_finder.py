@@ -0,0 +1,103 @@
+from unittest import TestCase
+
+from virusscanner.interface.datastructures.port import Port
+from virusscanner.interface.datastructures.tile import Tile
+from virusscanner.parsing.util.graph_processing import GraphProcessor
+from virusscanner.parsing.util.weighted_path_finder import WeightedPathFinder
+
+
+class TestWeightedPathFinder(TestCase):
+    def setUp(self) -> None:
+        fake_tile = Tile("fake_tile", 0, 0)
+
+        self.begin_port = Port(fake_tile, "BEGIN")
+        self.first_port = Port(fake_tile, "A")
+        self.second_port = Port(fake_tile, "B")
+        self.third_port = Port(fake_tile, "C")
+        self.first_end_port = Port(fake_tile, "END1")
+        self.second_end_port = Port(fake_tile, "END2")
+        self.adjacency_list = {self.begin_port: (self.first_port, self.second_port),
+                               self.first_port: (self.second_port, self.first_end_port),
+                               self.second_port: (self.third_port, self.first_end_port),
+                               self.third_port: (self.first_port, self.second_end_port),
+                               self.first_end_port: (self.second_end_port,)}
+        self.connection_weights = {(self.begin_port, self.first_port): 1,
+                                   (self.first_port, self.second_port): 4,
+                                   (self.second_port, self.third_port): 2,
+                                   (self.third_port, self.first_port): 8,
+                                   (self.second_port, self.first_end_port): 16}
+        self.end_ports = {self.first_end_port, self.second_end_port}
+
+    def __get_weight(self, begin_port, end_port):
+        return self.connection_weights.get((begin_port, end_port), 0)
+
+    def __get_path_scores(self, begin_ports):
+        return [(sum(self.__get_weight(port, next_port) for port, next_port in zip(path, path[1:])), path)
+                for path in GraphProcessor().find_all_paths(self.adjacency_list, begin_ports, self.end_ports)]
+
+    def test_find_best_paths_finds_highest_scoring_path_to_every_end_port(self):
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.begin_port], self.end_ports, self.__get_weight)
+
+        self.assertEqual(path_finder.find_best_paths(), {
+            self.first_end_port: (21, [self.begin_port, self.first_port, self.second_port, self.first_end_port]),
+            self.second_end_port: (7, [self.begin_port, self.first_port, self.second_port, self.third_port,
+                                       self.second_end_port])})
+
+    def test_find_best_paths_matches_scores_of_all_paths(self):
+        begin_ports = [self.begin_port, self.third_port]
+        path_finder = WeightedPathFinder(self.adjacency_list, begin_ports, self.end_ports, self.__get_weight)
+
+        path_scores = self.__get_path_scores(begin_ports)
+        for end_port, (best_score, best_path) in path_finder.find_best_paths().items():
+            self.assertEqual(best_score, max(path_score for path_score, path in path_scores if path[-1] == end_port))
+            self.assertIn((best_score, best_path), path_scores)
+
+    def test_find_best_paths_skips_paths_returning_to_begin_end_port(self):
+        self.adjacency_list[self.second_end_port] = (self.first_end_port,)
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.first_end_port], self.end_ports,
+                                         self.__get_weight)
+
+        self.assertEqual(path_finder.find_best_paths(),
+                         {self.second_end_port: (0, [self.first_end_port, self.second_end_port])})
+
+    def test_count_paths_over_threshold_counts_paths_of_every_end_port(self):
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.begin_port, self.third_port], self.end_ports,
+                                         self.__get_weight)
+        expected_counts = dict()
+        for path_score, path in self.__get_path_scores([self.begin_port, self.third_port]):
+            if path_score > 10:
+                expected_counts[path[-1]] = expected_counts.get(path[-1], 0) + 1
+
+        self.assertEqual(path_finder.count_paths_over_threshold(10), expected_counts)
+
+    def test_count_paths_over_threshold_returns_nothing_without_paths_over_threshold(self):
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.begin_port], self.end_ports, self.__get_weight)
+
+        self.assertEqual(path_finder.count_paths_over_threshold(100), dict())
+
+    def test_count_paths_over_threshold_matches_all_paths_with_every_threshold(self):
+        self.adjacency_list[self.second_end_port] = (self.first_end_port,)
+        begin_ports = [self.begin_port, self.third_port, self.first_end_port]
+        path_scores = self.__get_path_scores(begin_ports)
+        path_finder = WeightedPathFinder(self.adjacency_list, begin_ports, self.end_ports, self.__get_weight)
+
+        for score_threshold in range(-1, max(path_score for path_score, _ in path_scores) + 1):
+            expected_counts = dict()
+            for path_score, path in path_scores:
+                if path_score > score_threshold:
+                    expected_counts[path[-1]] = expected_counts.get(path[-1], 0) + 1
+            with self.subTest(score_threshold=score_threshold):
+                self.assertEqual(path_finder.count_paths_over_threshold(score_threshold), expected_counts)
+
+    def test_search_gives_lower_bounds_after_last_walk_step(self):
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.begin_port], self.end_ports, self.__get_weight, 2)
+        expected_count = sum(1 for path_score, _ in self.__get_path_scores([self.begin_port]) if path_score > 0)
+
+        self.assertLess(sum(path_finder.count_paths_over_threshold(0).values()), expected_count)
+        self.assertFalse(path_finder.is_search_exact())
+
+    def test_search_is_exact_without_cut_walks(self):
+        path_finder = WeightedPathFinder(self.adjacency_list, [self.begin_port], self.end_ports, self.__get_weight)
+        path_finder.find_best_paths()
+
+        self.assertTrue(path_finder.is_search_exact())